@@ -24,52 +24,54 @@ except ImportError:
     SCAN_PNG = "core_os/screenshots/scan.png"
     DYNAMIC_TOOLS_DIR = "core_os/dynamic_tools"
 
-try:
-    import tkinter as tk
-    from tkinter import messagebox
-    TK_AVAILABLE = True
-except ImportError:
-    tk = None
-    messagebox = None
-    TK_AVAILABLE = False
+from core_os.lazy import LazyResource, lazy_module
+from core_os.ocr_cache import ocr_cache
+from core_os.ocr_service import ocr
 
-# Force headless mode to bypass GUI dependencies
-pyautogui = None
-try:
-    if os.environ.get("DISPLAY"):
-        import pyautogui
-    else:
-        pyautogui = None
-except Exception:
-    pyautogui = None
 
-try:
-    from pynput import keyboard
-except Exception:
-    keyboard = None
+def _load_pyautogui():
+    # Headless hosts have no display to drive
+    if not os.environ.get("DISPLAY"):
+        raise RuntimeError("no DISPLAY")
+    import pyautogui
+    return pyautogui
 
-try:
-    import ollama
-except ImportError:
-    ollama = None
 
-try:
-    import speech_recognition as sr
-except ImportError:
-    sr = None
+# Heavy optional dependencies, imported on first use rather than at package import.
+# Module attributes of the same names (core_os.actions.reader, .pyautogui, ...) still
+# work through __getattr__ below and resolve to None when unavailable.
+_LAZY = {
+    "tk":         lazy_module("tkinter"),
+    "messagebox": lazy_module("tkinter.messagebox"),
+    "pyautogui":  LazyResource("pyautogui", _load_pyautogui),
+    "keyboard":   lazy_module("pynput.keyboard"),
+    "ollama":     lazy_module("ollama"),
+    "sr":         lazy_module("speech_recognition"),
+    "reader":     ocr.engine,   # the process-wide reader shared with the server and control plane
+    "DDGS":       lazy_module("duckduckgo_search", "DDGS"),
+}
 
-try:
-    import easyocr
-    reader = easyocr.Reader(['en'], gpu=False) 
-except Exception:
-    reader = None
 
-try:
-    from playsound3 import playsound
-except ImportError:
-    def playsound(path):
+def __getattr__(name):
+    if name == "TK_AVAILABLE":
+        return _LAZY["tk"].get() is not None
+    if name in _LAZY:
+        return _LAZY[name].get()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def lazy_status():
+    from core_os.lazy import status
+    return status(_LAZY)
+
+
+def playsound(path):
+    try:
+        from playsound3 import playsound as _playsound
+    except ImportError:
         print(f"[*] Voice (Mock): {path}")
-from duckduckgo_search import DDGS
+        return
+    return _playsound(path)
 
 # --- CONFIG ---
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -105,11 +107,15 @@ def memory_load(query: str, limit: int = 10):
     except Exception as e: return f"Error: {e}"
 
 def find_on_screen(target_text):
-    if pyautogui is None or reader is None: return None
+    pyautogui = _LAZY["pyautogui"].get()
+    if pyautogui is None or not ocr.installed: return None
     shot_path = str(SCAN_PNG)
     os.makedirs(os.path.dirname(shot_path), exist_ok=True)
     pyautogui.screenshot().save(shot_path)
-    results = reader.readtext(shot_path)
+    try:
+        results = ocr_cache.readtext(shot_path, stream="screen")
+    except Exception:
+        return None
     for (bbox, text, prob) in results:
         if str(target_text).lower() in text.lower():
             x_min, y_min = int(bbox[0][0]), int(bbox[0][1])
@@ -119,6 +125,7 @@ def find_on_screen(target_text):
     return None
 
 def pyautogui_control(action: str, target: str, x: int = None, y: int = None):
+    pyautogui = _LAZY["pyautogui"].get()
     if pyautogui is None: return {"status": "error", "msg": "GUI unavailable."}
     try:
         if action == "click" and x is not None and y is not None: pyautogui.click(x, y)
@@ -150,6 +157,14 @@ def tool_writer(tool_name: str, code: str):
     except Exception as e: return {"status": "error", "msg": str(e)}
 
 def execute_dynamic_tool(tool_name: str):
+    from core_os.metrics import metrics
+    with metrics.timed("dynamic_tool", tool_name) as call:
+        result = _execute_dynamic_tool(tool_name)
+        if result.get("status") != "success":
+            call.fail()
+    return result
+
+def _execute_dynamic_tool(tool_name: str):
     from core_os.sandbox.executor import SandboxExecutor
     from core_os.sandbox.verification_protocol import VerificationProtocol
     from core_os.sandbox.security_policy import SecurityPolicy
@@ -260,6 +275,8 @@ def speak_response(text: str):
 
 def web_search(query: str):
     try:
+        DDGS = _LAZY["DDGS"].get()
+        if DDGS is None: return {"status": "error", "msg": "duckduckgo_search unavailable."}
         results = DDGS().text(query, max_results=5)
         return {"status": "success", "results": [r['body'] for r in results]}
     except Exception as e: return {"status": "error", "msg": str(e)}
@@ -282,7 +299,7 @@ class SafeWordMonitor(threading.Thread):
     def on_press(self, key):
         global STOP_FLAG
         try:
-            if key == keyboard.Key.space:
+            if key == _LAZY["keyboard"].get().Key.space:
                 now = time.time()
                 if now - self.last_space < 0.3:
                     STOP_FLAG = True
@@ -290,5 +307,6 @@ class SafeWordMonitor(threading.Thread):
                 self.last_space = now
         except: pass
     def run(self):
+        keyboard = _LAZY["keyboard"].get()
         if keyboard is None: return
         with keyboard.Listener(on_press=self.on_press) as listener: listener.join()
@@ -1,5 +1,4 @@
 import os
-import threading
 import sys
 import re
 from pathlib import Path
@@ -11,46 +10,53 @@ sys.path.append(str(PROJECT_ROOT))
 # Import memory core
 try:
     from core_os.memory.agent_memory import memory
+    from core_os.memory.code_index import get_code_index
 except ImportError:
     # Handle if run outside of standard package context
     from ogdray.core_os.memory.agent_memory import memory
+    from ogdray.core_os.memory.code_index import get_code_index
 
-class LibrarianTwin(threading.Thread):
-    def __init__(self, file_list, direction="forward", search_pattern=None, specialization="Structural"):
-        super().__init__()
-        self.files = file_list
-        self.direction = direction
+def twin_lens(f_path, search_pattern, specialization):
+    """One Twin's reading of a file. Top-level so the Twins can work in separate processes."""
+    try:
+        content = Path(f_path).read_text(errors='ignore')
+    except Exception:
+        return False
+    if specialization == "Structural":
+        return bool(re.search(rf"(class|def)\s+.*{search_pattern}", content, re.IGNORECASE))
+    if specialization == "Functional":
+        return bool(re.search(rf"[^def\s+]{search_pattern}\(", content, re.IGNORECASE)) or f"import {search_pattern}" in content
+    return search_pattern.lower() in content.lower()
+
+
+def _twin_batch(args):
+    files, search_pattern, specialization = args
+    return [f for f in files if twin_lens(f, search_pattern, specialization)]
+
+
+class LibrarianTwins:
+    """Structural and Functional Twins verifying candidate files across a process pool."""
+    POOL_THRESHOLD = 24   # below this many candidates a pool costs more than it saves
+
+    def __init__(self, search_pattern, workers=None):
         self.search_pattern = search_pattern
-        self.specialization = specialization
-        self.results = []
-        self.clues_found = 0
+        self.workers = workers or max(2, min(8, os.cpu_count() or 2))
+
+    def run(self, files):
+        files = [str(f) for f in files]
+        lenses = ("Structural", "Functional")
+        if len(files) < self.POOL_THRESHOLD:
+            return {lens: _twin_batch((files, self.search_pattern, lens)) for lens in lenses}
+
+        from concurrent.futures import ProcessPoolExecutor
+        step = max(1, len(files) // self.workers)
+        jobs = [(lens, files[i:i + step]) for lens in lenses for i in range(0, len(files), step)]
+        found = {lens: [] for lens in lenses}
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for (lens, _), hits in zip(jobs, pool.map(_twin_batch, [(chunk, self.search_pattern, lens) for lens, chunk in jobs])):
+                found[lens].extend(hits)
+        return found
 
-    def run(self):
-        work_list = self.files if self.direction == "forward" else reversed(self.files)
-        print(f"[*] Librarian Twin ({self.direction} | {self.specialization}) waking up...")
-        
-        for f_path in work_list:
-            try:
-                content = f_path.read_text(errors='ignore')
-                match = False
-                
-                # Specialized Lens
-                if self.specialization == "Structural":
-                    if re.search(rf"(class|def)\s+.*{self.search_pattern}", content, re.IGNORECASE):
-                        match = True
-                elif self.specialization == "Functional":
-                    if re.search(rf"[^def\s+]{self.search_pattern}\(", content, re.IGNORECASE) or f"import {self.search_pattern}" in content:
-                        match = True
-                else:
-                    if self.search_pattern.lower() in content.lower():
-                        match = True
-                
-                if match:
-                    self.results.append(str(f_path))
-                    self.clues_found += 1
-                    print(f" [+] {self.specialization} Twin found a deep clue in {f_path.name}")
-            except Exception:
-                pass
 
 class LibrarianAgent:
     """The Librarian Twins: One Architects the structure, the other Weaves the usage."""
@@ -72,30 +78,13 @@ class LibrarianAgent:
         ]
 
     def refresh_catalog(self):
-        """Re-indexes the entire codebase into the Card Catalog."""
+        """Re-indexes changed files in the codebase into the Card Catalog."""
         print("[*] Librarian Registrar: Re-indexing the Card Catalog...")
-        memory.clear_catalog()
-        
-        all_files = self._get_core_files()
-        
-        symbols_indexed = 0
-        for f_path in all_files:
-            try:
-                rel_path = str(f_path.relative_to(self.root))
-                lines = f_path.read_text(errors='ignore').splitlines()
-                
-                for i, line in enumerate(lines):
-                    # Find definitions: class Name:, def name(params):, async def name(params):
-                    match = re.search(r"^\s*(class|def|async\s+def)\s+([a-zA-Z_][a-zA-Z0-9_]*)", line)
-                    if match:
-                        s_type = match.group(1).replace("async ", "")
-                        s_name = match.group(2)
-                        memory.register_symbol(s_name, rel_path, i + 1, s_type)
-                        symbols_indexed += 1
-            except Exception:
-                pass
-        
-        print(f"[*] Catalog Refresh Complete. {symbols_indexed} symbols indexed.")
+        stats = memory.catalog.refresh(self.root, self._get_core_files())
+        print(f"[*] Catalog Refresh Complete. {stats['reindexed']} files re-indexed "
+              f"({stats['symbols']} symbols), {stats['unchanged']} unchanged, "
+              f"{stats['removed']} removed in {stats['elapsed_sec']}s.")
+        return stats
 
     def deep_scan(self, search_pattern):
         """Checks the Catalog first, then falls back to a Twin Resonance Scan."""
@@ -118,18 +107,21 @@ class LibrarianAgent:
             print("[!] No core files found to scan.")
             return results
 
-        mid = len(all_files) // 2
-        twin_a = LibrarianTwin(all_files[:mid], direction="forward", search_pattern=search_pattern, specialization="Structural")
-        twin_b = LibrarianTwin(all_files[mid:], direction="backward", search_pattern=search_pattern, specialization="Functional")
-        
-        twin_a.start()
-        twin_b.start()
-        
-        twin_a.join()
-        twin_b.join()
-        
-        total_results = list(set(results + twin_a.results + twin_b.results))
-        print(f"[*] Search Complete. Twin A found {twin_a.clues_found} structural clues. Twin B found {twin_b.clues_found} functional clues.")
+        # Narrow with the trigram index so the Twins only read files that could match
+        index = get_code_index()
+        index.update(all_files)
+        candidates = index.candidates(search_pattern)
+        if candidates is None:
+            candidates = all_files
+        print(f" [*] Librarian: Trigram index narrowed {len(all_files)} files to {len(candidates)} candidates.")
+
+        found = LibrarianTwins(search_pattern).run(candidates)
+        for lens, hits in found.items():
+            for hit in hits:
+                print(f" [+] {lens} Twin found a deep clue in {Path(hit).name}")
+
+        total_results = list(set(results + found["Structural"] + found["Functional"]))
+        print(f"[*] Search Complete. Twin A found {len(found['Structural'])} structural clues. Twin B found {len(found['Functional'])} functional clues.")
         
         return total_results
 
@@ -0,0 +1,183 @@
+"""
+camera_manager.py — long-lived capture threads for USB and RTSP cameras.
+
+Opening a cv2.VideoCapture costs anywhere from half a second (USB, exposure
+settling) to several seconds (RTSP handshake). Here each source is opened
+once. A background reader thread keeps pulling frames from it and holds the
+latest decoded one, so `cameras.frame(key, opener)` is a memory read after the
+first call.
+
+    frame = cameras.frame("usb:0", lambda: open_capture(0))     # ndarray (BGR) or None
+
+A source nobody has asked for in IDLE_TIMEOUT seconds is released and its
+thread exits. The next request opens it again. Read failures (unplugged
+camera, expired RTSP URL) trigger a reopen through the same opener, which may
+build a fresh URL.
+
+Config (env):
+    CAMERA_IDLE_TIMEOUT  seconds without a request before a source is released (default 60)
+    CAMERA_FIRST_FRAME   seconds to wait for the first frame of a new source (default 5)
+    CAMERA_MAX_FPS       reader loop rate limit; file sources would otherwise spin (default 30)
+"""
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+IDLE_TIMEOUT = float(os.getenv("CAMERA_IDLE_TIMEOUT", "60"))
+FIRST_FRAME_TIMEOUT = float(os.getenv("CAMERA_FIRST_FRAME", "5"))
+MAX_FPS = float(os.getenv("CAMERA_MAX_FPS", "30"))
+WARMUP_FRAMES = 5          # frames discarded after open while auto-exposure settles
+MAX_READ_FAILURES = 10     # consecutive failed reads before the source is reopened
+REOPEN_BACKOFF = 2.0
+STALE_AFTER = 5.0          # a frame this old means the reader is stuck; report no frame
+
+
+def open_capture(source) -> Any:
+    """cv2.VideoCapture for a device index, file or RTSP URL, with a one-frame buffer."""
+    import cv2
+    cap = cv2.VideoCapture(source)
+    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+    if not cap.isOpened():
+        cap.release()
+        raise RuntimeError(f"cannot open capture source {source!r}")
+    return cap
+
+
+class CameraSource:
+    def __init__(self, key: str, opener: Callable[[], Any], idle_timeout: float = IDLE_TIMEOUT,
+                 max_fps: float = MAX_FPS, warmup: int = WARMUP_FRAMES):
+        self.key = key
+        self._opener = opener
+        self.idle_timeout = idle_timeout
+        self.min_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+        self.warmup = warmup
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._stop = threading.Event()
+        self._frame = None
+        self.frame_time: Optional[float] = None
+        self.last_access = time.monotonic()
+        self.frames_read = 0
+        self.opens = 0
+        self.last_error: Optional[str] = None
+        self._thread = threading.Thread(target=self._run, name=f"camera-{key}", daemon=True)
+        self._thread.start()
+
+    @property
+    def alive(self) -> bool:
+        return self._thread.is_alive()
+
+    def latest(self, timeout: float = FIRST_FRAME_TIMEOUT, max_age: float = STALE_AFTER):
+        """Most recent frame; waits up to `timeout` for the first one, None if older than max_age."""
+        self.last_access = time.monotonic()
+        if not self._ready.wait(timeout):
+            return None
+        with self._lock:
+            if self.frame_time is None or time.time() - self.frame_time > max_age:
+                return None
+            return self._frame
+
+    def stop(self):
+        self._stop.set()
+
+    def status(self) -> dict:
+        return {
+            "alive": self.alive,
+            "frames_read": self.frames_read,
+            "opens": self.opens,
+            "frame_age_sec": round(time.time() - self.frame_time, 3) if self.frame_time else None,
+            "idle_sec": round(time.monotonic() - self.last_access, 1),
+            "last_error": self.last_error,
+        }
+
+    def _open(self):
+        try:
+            cap = self._opener()
+        except Exception as e:
+            self.last_error = f"{type(e).__name__}: {e}"
+            return None
+        self.opens += 1
+        for _ in range(self.warmup):
+            cap.read()
+        return cap
+
+    def _run(self):
+        cap = None
+        failures = 0
+        try:
+            while not self._stop.is_set():
+                if time.monotonic() - self.last_access > self.idle_timeout:
+                    break
+                if cap is None:
+                    cap = self._open()
+                    if cap is None:
+                        self._stop.wait(REOPEN_BACKOFF)
+                        continue
+                started = time.monotonic()
+                ok, frame = cap.read()
+                if ok and frame is not None:
+                    failures = 0
+                    with self._lock:
+                        self._frame = frame
+                        self.frame_time = time.time()
+                        self.frames_read += 1
+                    self._ready.set()
+                else:
+                    failures += 1
+                    if failures >= MAX_READ_FAILURES:
+                        self.last_error = "read failed; reopening"
+                        cap.release()
+                        cap, failures = None, 0
+                        continue
+                elapsed = time.monotonic() - started
+                if elapsed < self.min_interval:
+                    self._stop.wait(self.min_interval - elapsed)
+        finally:
+            if cap is not None:
+                try:
+                    cap.release()
+                except Exception:
+                    pass
+
+
+class CameraManager:
+    def __init__(self, idle_timeout: float = IDLE_TIMEOUT, max_fps: float = MAX_FPS, warmup: int = WARMUP_FRAMES):
+        self.idle_timeout = idle_timeout
+        self.max_fps = max_fps
+        self.warmup = warmup
+        self._sources: Dict[str, CameraSource] = {}
+        self._lock = threading.Lock()
+
+    def source(self, key: str, opener: Callable[[], Any]) -> CameraSource:
+        with self._lock:
+            src = self._sources.get(key)
+            if src is None or not src.alive:
+                src = CameraSource(key, opener, self.idle_timeout, self.max_fps, self.warmup)
+                self._sources[key] = src
+            return src
+
+    def frame(self, key: str, opener: Callable[[], Any], timeout: float = FIRST_FRAME_TIMEOUT):
+        """Latest frame of `key`, opening it with `opener()` if it is not already running."""
+        return self.source(key, opener).latest(timeout)
+
+    def release(self, key: str):
+        with self._lock:
+            src = self._sources.pop(key, None)
+        if src is not None:
+            src.stop()
+
+    def release_all(self):
+        with self._lock:
+            sources, self._sources = list(self._sources.values()), {}
+        for src in sources:
+            src.stop()
+
+    def status(self) -> Dict[str, dict]:
+        with self._lock:
+            sources = dict(self._sources)
+        return {key: src.status() for key, src in sources.items()}
+
+
+cameras = CameraManager()
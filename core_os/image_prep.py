@@ -0,0 +1,110 @@
+"""
+image_prep.py — shrink and re-encode images in memory before vision inference.
+
+Full-resolution desktop screenshots, ADB screencaps and RTSP frames are far
+larger than what the vision models actually look at. Each model resizes its
+input internally anyway, so the extra pixels only cost upload time and
+prefill. prepare() downsizes an image to the model's target long side and
+re-encodes it (JPEG by default) in memory. It never upscales, and it returns
+the original bytes whenever re-encoding would not make them smaller.
+
+    payload = prepare(img_bytes, "qwen2.5vl:7b")
+    ollama.generate(model=..., images=[payload.data])
+    prep_stats()   # bytes in / out / saved per model
+
+Without Pillow images pass through unchanged.
+
+Config (env):
+    VISION_MAX_SIDE      long side for models without a profile (default 1280)
+    VISION_JPEG_QUALITY  JPEG quality for models without a profile (default 85)
+"""
+
+import io
+import os
+import threading
+from typing import Dict, NamedTuple, Tuple
+
+from core_os.lazy import lazy_module
+
+DEFAULT_MAX_SIDE = int(os.getenv("VISION_MAX_SIDE", "1280"))
+DEFAULT_QUALITY = int(os.getenv("VISION_JPEG_QUALITY", "85"))
+
+# model -> (max long side in px, encode format, JPEG quality)
+PROFILES: Dict[str, Tuple[int, str, int]] = {
+    "qwen3.5:397b-cloud": (1568, "JPEG", 88),   # remote: payload size dominates
+    "qwen2.5vl:7b":       (1280, "JPEG", 85),
+    "moondream:latest":   (768, "JPEG", 80),    # SigLIP encoder works at 378 px crops
+}
+
+_Image = lazy_module("PIL.Image")
+
+
+class Prepared(NamedTuple):
+    data: bytes
+    size: Tuple[int, int]       # (0, 0) when the image could not be decoded
+    original_bytes: int
+    changed: bool
+
+    @property
+    def saved(self) -> int:
+        return self.original_bytes - len(self.data)
+
+
+_lock = threading.Lock()
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def profile_for(model: str) -> Tuple[int, str, int]:
+    return PROFILES.get(model, (DEFAULT_MAX_SIDE, "JPEG", DEFAULT_QUALITY))
+
+
+def _record(model: str, prepared: Prepared):
+    with _lock:
+        s = _stats.setdefault(model, {"images": 0, "resized": 0, "bytes_in": 0, "bytes_out": 0})
+        s["images"] += 1
+        s["resized"] += int(prepared.changed)
+        s["bytes_in"] += prepared.original_bytes
+        s["bytes_out"] += len(prepared.data)
+
+
+def prepare(image: bytes, model: str) -> Prepared:
+    """Encoded image bytes sized for `model`; the input bytes when that is already smallest."""
+    Image = _Image.get()
+    if Image is None:
+        prepared = Prepared(image, (0, 0), len(image), False)
+        _record(model, prepared)
+        return prepared
+    max_side, fmt, quality = profile_for(model)
+    try:
+        with Image.open(io.BytesIO(image)) as img:
+            size = img.size
+            scale = min(1.0, max_side / max(size))
+            out = img if img.mode in ("RGB", "L") else img.convert("RGB")
+            if scale < 1.0:
+                out = out.resize((max(1, round(size[0] * scale)), max(1, round(size[1] * scale))),
+                                 Image.LANCZOS)
+            buf = io.BytesIO()
+            if fmt == "JPEG":
+                out.save(buf, format="JPEG", quality=quality, optimize=True)
+            else:
+                out.save(buf, format=fmt)
+            data = buf.getvalue()
+            new_size = out.size
+    except Exception:
+        prepared = Prepared(image, (0, 0), len(image), False)
+        _record(model, prepared)
+        return prepared
+    if len(data) >= len(image) and new_size == size:
+        prepared = Prepared(image, size, len(image), False)
+    else:
+        prepared = Prepared(data, new_size, len(image), True)
+    _record(model, prepared)
+    return prepared
+
+
+def prep_stats() -> Dict[str, Dict[str, int]]:
+    with _lock:
+        out = {m: dict(s) for m, s in _stats.items()}
+    for s in out.values():
+        s["bytes_saved"] = s["bytes_in"] - s["bytes_out"]
+    return out
@@ -0,0 +1,60 @@
+"""
+lazy.py — optional heavy dependencies that materialize on first use.
+
+    reader = LazyResource("easyocr.Reader", lambda: easyocr.Reader(["en"]))
+    ...
+    ocr = reader.get()      # imported / constructed here, once; None if unavailable
+
+A loader that raises (missing package, no display, no model files) leaves the
+resource as None, the same value the old `try: import ... except: x = None`
+blocks produced, and the failure is not retried.
+"""
+
+import importlib
+import threading
+from typing import Any, Callable, Dict, Optional
+
+
+class LazyResource:
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        self.name = name
+        self._loader = loader
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._value = None
+        self.error: Optional[str] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded
+
+    def get(self) -> Any:
+        if self._loaded:
+            return self._value
+        with self._lock:
+            if not self._loaded:
+                try:
+                    self._value = self._loader()
+                except Exception as e:
+                    self._value, self.error = None, f"{type(e).__name__}: {e}"
+                self._loaded = True
+        return self._value
+
+
+def lazy_module(module: str, attr: Optional[str] = None) -> LazyResource:
+    """A module (or one attribute of it) imported on first get()."""
+    def _load():
+        mod = importlib.import_module(module)
+        return getattr(mod, attr) if attr else mod
+    return LazyResource(f"{module}.{attr}" if attr else module, _load)
+
+
+def status(resources: Dict[str, LazyResource]) -> Dict[str, str]:
+    """'pending', 'ready' or the load error for each resource — without loading any."""
+    out = {}
+    for key, res in resources.items():
+        if not res.loaded:
+            out[key] = "pending"
+        else:
+            out[key] = "ready" if res.error is None else res.error
+    return out
@@ -3,6 +3,9 @@ import os
 from datetime import datetime
 from pathlib import Path
 
+from core_os.memory.mailbox import MailboxQueue
+from core_os.memory.symbol_catalog import SymbolCatalog
+
 # --- CENTRALIZED PATHS ---
 # These are absolute paths based on the location of this file
 MEMORY_DIR = Path(__file__).parent.resolve()
@@ -10,8 +13,8 @@ CORE_OS_DIR = MEMORY_DIR.parent
 PROJECT_ROOT = CORE_OS_DIR.parent
 
 # Database & Index Paths
-DB_PATH = MEMORY_DIR / "agent_memory.db"
-CATALOG_PATH = MEMORY_DIR / "agent_memory.db"
+DB_PATH = Path(os.getenv("AGENT_MEMORY_DB", MEMORY_DIR / "agent_memory.db"))   # override for tests / sandboxes
+CATALOG_PATH = DB_PATH
 LONG_TERM_DB = MEMORY_DIR / "milla_long_term.db"
 SEMANTIC_INDEX = MEMORY_DIR / "semantic_index.json"
 GRAPH_FILE = MEMORY_DIR / "knowledge_graph.json"
@@ -46,32 +49,14 @@ class AgentMemory:
         
         # Core Memory Table
         self.cursor.execute('CREATE TABLE IF NOT EXISTS mem (k TEXT PRIMARY KEY, v TEXT, t DATETIME)')
-        
-        # Card Catalog Table (The Library's Index)
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS catalog (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                symbol TEXT,
-                path TEXT,
-                line INTEGER,
-                type TEXT,
-                timestamp DATETIME
-            )
-        ''')
-
-        # Mailbox Table (Remote Node Queuing)
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS mailbox (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                target TEXT,
-                role TEXT,
-                content TEXT,
-                status TEXT DEFAULT 'pending',
-                timestamp DATETIME
-            )
-        ''')
         self.conn.commit()
 
+        # Mailbox (Remote Node Queuing) — thread-safe queue with its own per-thread connections
+        self.mailbox = MailboxQueue(db_path)
+
+        # Card Catalog (The Library's Index) — incremental refresh + FTS lookups
+        self.catalog = SymbolCatalog(db_path)
+
     def remember(self, key, value):
         self.cursor.execute("INSERT OR REPLACE INTO mem VALUES (?, ?, ?)", (key, value, datetime.now()))
         self.conn.commit()
@@ -85,27 +70,27 @@ class AgentMemory:
     # Mailbox Methods
     def post_mail(self, target, role, content):
         """Posts a message to the mailbox for a remote node."""
-        self.cursor.execute(
-            "INSERT INTO mailbox (target, role, content, timestamp) VALUES (?, ?, ?, ?)",
-            (target, role, content, datetime.now())
-        )
-        self.conn.commit()
+        return self.mailbox.post(target, role, content)
 
-    def fetch_mail(self, target, clear=True):
-        """Fetches all pending mail for a target."""
-        self.cursor.execute(
-            "SELECT id, role, content, timestamp FROM mailbox WHERE target=? AND status='pending'",
-            (target,)
-        )
-        messages = self.cursor.fetchall()
-        if messages and clear:
-            # Mark as delivered
-            self.cursor.execute(
-                "UPDATE mailbox SET status='delivered' WHERE target=? AND status='pending'",
-                (target,)
-            )
-            self.conn.commit()
-        return messages
+    def fetch_mail(self, target, clear=True, wait=0.0, limit=None):
+        """Fetches pending mail for a target, long-polling up to `wait` seconds.
+
+        By default every pending message is returned. With a `limit`, anything
+        beyond it stays queued; `pending_mail` reports how much is left.
+        With clear=False the messages are leased instead of delivered; confirm
+        them with ack_mail or they are redelivered once the lease expires.
+        """
+        if limit is None:
+            return self.mailbox.drain(target, wait=wait, auto_ack=clear)
+        return self.mailbox.fetch(target, limit=limit, wait=wait, auto_ack=clear)
+
+    def pending_mail(self, target):
+        """Number of messages still waiting for a target."""
+        return self.mailbox.pending_count(target)
+
+    def ack_mail(self, ids):
+        """Confirms delivery of leased messages in a single batch."""
+        return self.mailbox.ack(ids)
 
     # Card Catalog Methods
     def register_symbol(self, name, path, line, s_type):
@@ -116,15 +101,10 @@ class AgentMemory:
         self.conn.commit()
 
     def search_catalog(self, pattern):
-        self.cursor.execute(
-            "SELECT symbol, path, line, type FROM catalog WHERE symbol LIKE ?",
-            (f"%{pattern}%",)
-        )
-        return self.cursor.fetchall()
+        return self.catalog.search(pattern)
 
     def clear_catalog(self):
-        self.cursor.execute("DELETE FROM catalog")
-        self.conn.commit()
+        self.catalog.clear()
 
 # Singleton instance
 memory = AgentMemory()
@@ -0,0 +1,220 @@
+import os
+import re
+import time
+import hashlib
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from re import _parser as sre_parse      # Python 3.11+
+except ImportError:                           # pragma: no cover
+    import sre_parse
+
+from core_os.memory.sqlite_local import LocalSQLite
+
+MEMORY_DIR = Path(__file__).parent.resolve()
+CODE_INDEX_DB = MEMORY_DIR / "code_index.db"
+
+MAX_FILE_BYTES = 2 * 1024 * 1024   # larger files are recorded but not trigram-indexed
+POOL_THRESHOLD = 32                # fewer changed files than this are indexed in-process
+WORKERS = max(1, min(8, (os.cpu_count() or 2) - 1))
+BATCH_FILES = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS code_files (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    mtime REAL,
+    size INTEGER,
+    sha1 TEXT,
+    indexed DATETIME
+);
+CREATE TABLE IF NOT EXISTS code_trigrams (
+    trigram TEXT NOT NULL,
+    file_id INTEGER NOT NULL REFERENCES code_files(id) ON DELETE CASCADE,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_code_trigrams_file ON code_trigrams(file_id);
+"""
+
+
+def trigrams(text: str) -> Set[str]:
+    text = text.lower()
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def _index_file(path: str) -> Tuple[str, Optional[str], Optional[Set[str]]]:
+    """Worker: (path, sha1, trigram set). Runs in a pool process, so it must stay top-level."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        return path, None, None
+    digest = hashlib.sha1(data).hexdigest()
+    if len(data) > MAX_FILE_BYTES:
+        return path, digest, set()
+    return path, digest, trigrams(data.decode("utf-8", "ignore"))
+
+
+def required_literals(pattern: str) -> List[str]:
+    """Literal runs (3+ chars) that any match of `pattern` must contain.
+
+    Alternations, classes and optional repeats end a run; anything we cannot
+    reason about simply contributes nothing, so narrowing stays conservative.
+    """
+    try:
+        parsed = sre_parse.parse(pattern)
+    except (re.error, RecursionError):
+        return []
+    runs, current = [], []
+
+    def flush():
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    def walk(seq):
+        for op, av in seq:
+            name = str(op)
+            if name == "LITERAL":
+                current.append(chr(av))
+            elif name == "SUBPATTERN":
+                walk(av[-1])
+            elif name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT"):
+                flush()
+                if av[0] >= 1:
+                    walk(av[2])
+                    flush()
+            elif name == "AT":
+                continue   # anchors are zero-width
+            else:
+                flush()
+
+    walk(parsed)
+    flush()
+    return [r for r in runs if len(r) >= 3]
+
+
+class CodeSearchIndex(LocalSQLite):
+    """Persistent trigram inverted index over workspace files.
+
+    `update` re-reads only files whose mtime/size changed (in a process pool when
+    there are many), and `candidates` intersects posting lists so a regex only has
+    to be verified against files that could possibly match.
+    """
+
+    def __init__(self, db_path=str(CODE_INDEX_DB), workers: int = WORKERS):
+        super().__init__(db_path)
+        self.workers = workers
+        self.conn.executescript(SCHEMA)
+
+    def update(self, files: Iterable[Path], prune: bool = True) -> Dict:
+        started = time.time()
+        known = {row[1]: row for row in self.conn.execute("SELECT id, path, mtime, size, sha1 FROM code_files")}
+        seen, changed, stats = set(), [], {"files": 0, "unchanged": 0, "reindexed": 0, "removed": 0}
+        stat_of = {}
+        for f_path in files:
+            path = str(Path(f_path).resolve())
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            seen.add(path)
+            stats["files"] += 1
+            prev = known.get(path)
+            if prev and prev[2] == st.st_mtime and prev[3] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+            stat_of[path] = st
+            changed.append(path)
+
+        if len(changed) >= POOL_THRESHOLD and self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                results = pool.map(_index_file, changed, chunksize=max(1, len(changed) // (self.workers * 4)))
+                self._write(results, known, stat_of, stats)
+        else:
+            self._write(map(_index_file, changed), known, stat_of, stats)
+
+        if prune:
+            gone = [(known[p][0],) for p in known if p not in seen]
+            with self.transaction() as conn:
+                conn.executemany("DELETE FROM code_files WHERE id=?", gone)
+            stats["removed"] = len(gone)
+        stats["elapsed_sec"] = round(time.time() - started, 3)
+        return stats
+
+    def _write(self, results, known, stat_of, stats):
+        batch = []
+        for item in results:
+            if item[1] is not None:
+                batch.append(item)
+            if len(batch) >= BATCH_FILES:
+                self._write_batch(batch, known, stat_of, stats)
+                batch = []
+        self._write_batch(batch, known, stat_of, stats)
+
+    def _write_batch(self, batch, known, stat_of, stats):
+        if not batch:
+            return
+        now = datetime.now()
+        with self.transaction() as conn:
+            for path, digest, grams in batch:
+                st = stat_of[path]
+                prev = known.get(path)
+                if prev and prev[4] == digest:
+                    conn.execute("UPDATE code_files SET mtime=?, size=? WHERE id=?", (st.st_mtime, st.st_size, prev[0]))
+                    stats["unchanged"] += 1
+                    continue
+                if prev:
+                    file_id = prev[0]
+                    conn.execute("DELETE FROM code_trigrams WHERE file_id=?", (file_id,))
+                    conn.execute("UPDATE code_files SET mtime=?, size=?, sha1=?, indexed=? WHERE id=?",
+                                 (st.st_mtime, st.st_size, digest, now, file_id))
+                else:
+                    file_id = conn.execute(
+                        "INSERT INTO code_files (path, mtime, size, sha1, indexed) VALUES (?, ?, ?, ?, ?)",
+                        (path, st.st_mtime, st.st_size, digest, now)
+                    ).lastrowid
+                conn.executemany("INSERT OR IGNORE INTO code_trigrams (trigram, file_id) VALUES (?, ?)",
+                                 [(g, file_id) for g in grams])
+                stats["reindexed"] += 1
+
+    def candidates(self, pattern: str, literal: bool = False) -> Optional[List[str]]:
+        """Files that contain every trigram the pattern requires.
+
+        Returns None when the pattern yields no usable trigrams; the caller must
+        then verify against every file.
+        """
+        literals = [pattern] if literal else required_literals(pattern)
+        grams = set()
+        for lit in literals:
+            grams |= trigrams(lit)
+        if not grams:
+            return None
+        marks = ",".join("?" * len(grams))
+        # Oversized files carry no trigrams, so they are always candidates
+        rows = self.conn.execute(
+            f"SELECT f.path FROM code_files f JOIN ("
+            f"  SELECT file_id FROM code_trigrams WHERE trigram IN ({marks})"
+            f"  GROUP BY file_id HAVING COUNT(*) = ?"
+            f") hit ON hit.file_id = f.id "
+            f"UNION SELECT path FROM code_files WHERE size > ?",
+            [*grams, len(grams), MAX_FILE_BYTES]
+        ).fetchall()
+        return [r[0] for r in rows]
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_code_index() -> CodeSearchIndex:
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = CodeSearchIndex()
+    return _index
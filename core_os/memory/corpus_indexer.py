@@ -0,0 +1,256 @@
+import os
+import re
+import json
+import glob
+import time
+import sqlite3
+import hashlib
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+# CONFIG
+MEMORY_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(MEMORY_DIR, "semantic_index.json")
+EMBED_MODEL = os.getenv("MILLA_EMBED_MODEL", "nomic-embed-text")
+
+CHUNK_SIZE = 1200        # characters per chunk
+CHUNK_OVERLAP = 200      # characters shared between neighbouring chunks
+BATCH_SIZE = 16          # texts per embedding request
+WORKERS = 4              # concurrent embedding requests
+CHECKPOINT_EVERY = 8     # flush the index to disk every N completed batches
+
+# (source, type, text)
+Document = Tuple[str, str, str]
+EmbedFn = Callable[[List[str]], List[Optional[List[float]]]]
+
+
+def chunk_text(text: str, size: int = CHUNK_SIZE, overlap: int = CHUNK_OVERLAP) -> List[str]:
+    """Splits text into overlapping windows, preferring paragraph/sentence boundaries."""
+    text = text.strip()
+    if not text:
+        return []
+    if len(text) <= size:
+        return [text]
+
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + size, len(text))
+        if end < len(text):
+            # Pull the cut back to the nearest natural break inside the window
+            window = text[start:end]
+            cut = max(window.rfind("\n\n"), window.rfind(". "), window.rfind("\n"))
+            if cut > size // 2:
+                end = start + cut + 1
+        chunk = text[start:end].strip()
+        if chunk:
+            chunks.append(chunk)
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+    return chunks
+
+
+def chunk_hash(content: str) -> str:
+    return hashlib.sha1(content.encode("utf-8", "ignore")).hexdigest()
+
+
+def ollama_embed_batch(texts: List[str]) -> List[Optional[List[float]]]:
+    """Embeds a batch with one Ollama request, falling back to per-text calls on older servers."""
+    import ollama
+    safe = [t[:2000] for t in texts]
+    try:
+        resp = ollama.embed(model=EMBED_MODEL, input=safe)
+        vectors = resp.get("embeddings") if isinstance(resp, dict) else getattr(resp, "embeddings", None)
+        if vectors and len(vectors) == len(texts):
+            return [list(v) if v else None for v in vectors]
+    except Exception as e:
+        print(f"[!] Batch embed failed, falling back to single requests: {e}")
+
+    out = []
+    for t in safe:
+        try:
+            vec = ollama.embeddings(model=EMBED_MODEL, prompt=t).get("embedding", [])
+            out.append(list(vec) if vec else None)
+        except Exception as e:
+            print(f"[!] Embedding Error: {e}")
+            out.append(None)
+    return out
+
+
+class CorpusIndexer:
+    """Walks Milla's text corpora and incrementally (re)builds the semantic index.
+
+    Chunks already present in the index (matched by content hash) are skipped, new
+    chunks are embedded in batches across a thread pool, and the index is flushed
+    every few batches so an interrupted rebuild resumes where it left off.
+    """
+
+    def __init__(self, memory_dir: str = MEMORY_DIR, index_path: str = None,
+                 embed_fn: EmbedFn = None, batch_size: int = BATCH_SIZE,
+                 workers: int = WORKERS, checkpoint_every: int = CHECKPOINT_EVERY):
+        self.memory_dir = memory_dir
+        self.index_path = index_path or os.path.join(memory_dir, "semantic_index.json")
+        self.embed_fn = embed_fn or ollama_embed_batch
+        self.batch_size = max(1, batch_size)
+        self.workers = max(1, workers)
+        self.checkpoint_every = max(1, checkpoint_every)
+
+    # ---- Corpus readers ----
+
+    def _read_chat(self) -> Iterator[Document]:
+        path = os.path.join(self.memory_dir, "shared_chat.jsonl")
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            for lineno, line in enumerate(f, 1):
+                try:
+                    msg = json.loads(line)
+                except ValueError:
+                    continue
+                content = msg.get("content") if isinstance(msg, dict) else None
+                if isinstance(content, str) and content.strip():
+                    yield f"shared_chat.jsonl:{lineno}", f"chat:{msg.get('role', 'unknown')}", content
+
+    def _read_archives(self) -> Iterator[Document]:
+        for path in sorted(glob.glob(os.path.join(self.memory_dir, "thought_archives", "*.md"))):
+            try:
+                with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                    yield f"thought_archives/{os.path.basename(path)}", "archive", f.read()
+            except OSError as e:
+                print(f"[!] Could not read {path}: {e}")
+
+    def _read_sectioned(self, name: str, m_type: str, separator: str) -> Iterator[Document]:
+        path = os.path.join(self.memory_dir, name)
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8", errors="ignore") as f:
+            sections = re.split(separator, f.read())
+        for i, section in enumerate(sections):
+            if section.strip():
+                yield f"{name}#{i}", m_type, section
+
+    def _read_long_term(self) -> Iterator[Document]:
+        path = os.path.join(self.memory_dir, "milla_long_term.db")
+        if not os.path.exists(path):
+            return
+        try:
+            conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            rows = conn.execute("SELECT rowid, fact, category FROM memories").fetchall()
+            conn.close()
+        except sqlite3.Error as e:
+            print(f"[!] Long-term DB read error: {e}")
+            return
+        for rowid, fact, category in rows:
+            if fact:
+                yield f"milla_long_term.db:{rowid}", f"LTM:{category}", fact
+
+    def iter_documents(self) -> Iterator[Document]:
+        yield from self._read_chat()
+        yield from self._read_archives()
+        yield from self._read_sectioned("dreams.txt", "dream", r"\n(?==== )")
+        yield from self._read_sectioned("stream_of_consciousness.md", "stream", r"\n---\n")
+        yield from self._read_long_term()
+
+    def iter_chunks(self) -> Iterator[Dict]:
+        for source, m_type, text in self.iter_documents():
+            for n, content in enumerate(chunk_text(text)):
+                yield {"content": content, "source": source, "type": m_type,
+                       "chunk": n, "chunk_hash": chunk_hash(content)}
+
+    # ---- Index I/O ----
+
+    def _load_index(self) -> List[Dict]:
+        if not os.path.exists(self.index_path):
+            return []
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"[!] Error loading index, starting fresh: {e}")
+            return []
+
+    def _save_index(self, index: List[Dict]):
+        """Atomic write so readers (SemanticMemory) never see a half-written file."""
+        tmp = self.index_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f)
+        os.replace(tmp, self.index_path)
+
+    # ---- Build ----
+
+    def run(self, prune: bool = True) -> Dict:
+        """Indexes every corpus chunk not already embedded. Returns throughput stats."""
+        started = time.time()
+        index = self._load_index()
+        known = set()
+        for entry in index:
+            h = entry.get("chunk_hash") or chunk_hash(entry.get("content", ""))
+            entry.setdefault("chunk_hash", h)
+            known.add(h)
+
+        seen = set()
+        pending = []
+        total = 0
+        for chunk in self.iter_chunks():
+            total += 1
+            h = chunk["chunk_hash"]
+            if h in seen:
+                continue
+            seen.add(h)
+            if h not in known:
+                pending.append(chunk)
+        skipped = total - len(pending)
+
+        batches = [pending[i:i + self.batch_size] for i in range(0, len(pending), self.batch_size)]
+        embedded = failed = 0
+        embed_started = time.time()
+        print(f"[*] Corpus Indexer: {total} chunks, {skipped} unchanged, {len(pending)} to embed "
+              f"in {len(batches)} batches ({self.workers} workers).")
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            results = pool.map(lambda b: (b, self.embed_fn([c["content"] for c in b])), batches)
+            for done, (batch, vectors) in enumerate(results, 1):
+                now = datetime.now().isoformat()
+                for chunk, vec in zip(batch, vectors or []):
+                    if not vec:
+                        failed += 1
+                        continue
+                    chunk.update({"timestamp": now, "vector": list(vec), "indexer": True})
+                    index.append(chunk)
+                    embedded += 1
+                failed += max(0, len(batch) - len(vectors or []))
+                if done % self.checkpoint_every == 0:
+                    self._save_index(index)
+                    print(f"[*] Checkpoint: {done}/{len(batches)} batches, {embedded} chunks embedded.")
+
+        if prune:
+            # Drop indexer-owned chunks whose source text no longer exists; ad hoc entries stay.
+            index = [e for e in index if not e.get("indexer") or e["chunk_hash"] in seen]
+        self._save_index(index)
+
+        embed_time = time.time() - embed_started
+        stats = {
+            "total_chunks": total,
+            "skipped": skipped,
+            "embedded": embedded,
+            "failed": failed,
+            "index_size": len(index),
+            "skip_ratio": round(skipped / total, 4) if total else 0.0,
+            "chunks_per_sec": round(embedded / embed_time, 2) if embed_time > 0 else 0.0,
+            "elapsed_sec": round(time.time() - started, 3),
+        }
+        print(f"[*] Corpus Indexer done: {stats['embedded']} embedded @ {stats['chunks_per_sec']} chunks/s, "
+              f"skip ratio {stats['skip_ratio']:.1%}, {stats['elapsed_sec']}s total.")
+        return stats
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Incrementally rebuild Milla's semantic index.")
+    parser.add_argument("--workers", type=int, default=WORKERS)
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    parser.add_argument("--no-prune", action="store_true", help="Keep chunks whose source text is gone")
+    args = parser.parse_args()
+    print(json.dumps(CorpusIndexer(workers=args.workers, batch_size=args.batch_size).run(prune=not args.no_prune), indent=2))
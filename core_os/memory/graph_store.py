@@ -0,0 +1,253 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core_os.memory.sqlite_local import LocalSQLite
+
+MEMORY_DIR = Path(__file__).parent.resolve()
+GRAPH_DB = MEMORY_DIR / "knowledge_graph.db"
+
+# SQLite caps bound parameters per statement; frontier lookups are chunked below this.
+_MAX_PARAMS = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    type TEXT,
+    created DATETIME
+);
+CREATE TABLE IF NOT EXISTS observations (
+    id INTEGER PRIMARY KEY,
+    entity_id INTEGER NOT NULL REFERENCES entities(id) ON DELETE CASCADE,
+    content TEXT NOT NULL,
+    timestamp DATETIME
+);
+CREATE INDEX IF NOT EXISTS idx_observations_entity ON observations(entity_id);
+CREATE TABLE IF NOT EXISTS edges (
+    source_id INTEGER NOT NULL REFERENCES entities(id) ON DELETE CASCADE,
+    relation TEXT NOT NULL,
+    target_id INTEGER NOT NULL REFERENCES entities(id) ON DELETE CASCADE,
+    timestamp DATETIME,
+    PRIMARY KEY (source_id, relation, target_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_edges_target ON edges(target_id, relation);
+"""
+
+
+class GraphStore(LocalSQLite):
+    """Relational knowledge graph: entities, observations and directed, labelled edges.
+
+    The edge primary key doubles as the source index and `idx_edges_target` covers
+    reverse lookups, so neighbour queries never scan. Each thread gets its own
+    connection; WAL lets readers proceed while a batch is being written.
+    """
+
+    def __init__(self, db_path=str(GRAPH_DB)):
+        super().__init__(db_path)
+        self.conn.executescript(SCHEMA)
+
+    def batch(self):
+        """Groups many writes into a single transaction: `with graph.batch(): ...`."""
+        return self.transaction()
+
+    # ---- Writes ----
+
+    def _ensure_entities(self, conn, names: Iterable[str], e_type: Optional[str] = None):
+        now = datetime.now()
+        conn.executemany(
+            "INSERT OR IGNORE INTO entities (name, type, created) VALUES (?, ?, ?)",
+            [(n, e_type, now) for n in set(names)]
+        )
+
+    def add_entity(self, name: str, entity_type: str = None, observation: str = None):
+        with self.transaction():
+            self.add_entities([(name, entity_type)])
+            if observation:
+                self.add_observations([(name, observation)])
+
+    def add_entities(self, entities: Iterable[Tuple[str, Optional[str]]]):
+        """Upserts (name, type) pairs; an existing type is only replaced by a non-empty one."""
+        now = datetime.now()
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO entities (name, type, created) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET type = COALESCE(excluded.type, entities.type)",
+                [(name, e_type or None, now) for name, e_type in entities]
+            )
+
+    def add_observation(self, entity_name: str, observation: str) -> bool:
+        return self.add_observations([(entity_name, observation)], create_missing=False) == 1
+
+    def add_observations(self, observations: Iterable[Tuple[str, str]], create_missing: bool = True) -> int:
+        """Appends observations without rewriting the entity. Returns rows inserted."""
+        observations = list(observations)
+        now = datetime.now()
+        with self.transaction() as conn:
+            if create_missing:
+                self._ensure_entities(conn, (name for name, _ in observations))
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT INTO observations (entity_id, content, timestamp) "
+                "SELECT id, ?, ? FROM entities WHERE name = ?",
+                [(content, now, name) for name, content in observations]
+            )
+            return conn.total_changes - before
+
+    def add_relation(self, source: str, relation: str, target: str):
+        self.add_relations([(source, relation, target)])
+
+    def add_relations(self, relations: Iterable[Tuple[str, str, str]]):
+        """Inserts (source, relation, target) edges, creating endpoint entities as needed."""
+        relations = list(relations)
+        now = datetime.now()
+        with self.transaction() as conn:
+            self._ensure_entities(conn, [r[0] for r in relations] + [r[2] for r in relations])
+            conn.executemany(
+                "INSERT OR IGNORE INTO edges (source_id, relation, target_id, timestamp) "
+                "SELECT s.id, ?, t.id, ? FROM entities s, entities t WHERE s.name = ? AND t.name = ?",
+                [(rel, now, src, tgt) for src, rel, tgt in relations]
+            )
+
+    def remove_relation(self, source: str, relation: str, target: str):
+        with self.transaction() as conn:
+            conn.execute(
+                "DELETE FROM edges WHERE relation = ? "
+                "AND source_id = (SELECT id FROM entities WHERE name = ?) "
+                "AND target_id = (SELECT id FROM entities WHERE name = ?)",
+                (relation, source, target)
+            )
+
+    # ---- Reads ----
+
+    def get_entity(self, name: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT id, type FROM entities WHERE name = ?", (name,)).fetchone()
+        if not row:
+            return None
+        obs = self.conn.execute(
+            "SELECT content FROM observations WHERE entity_id = ? ORDER BY id", (row[0],)
+        ).fetchall()
+        return {"name": name, "type": row[1], "observations": [o[0] for o in obs]}
+
+    def neighbors(self, name: str, relation: str = None, direction: str = "out") -> List[Dict]:
+        """Direct neighbours of `name`. direction is 'out', 'in' or 'both'."""
+        row = self.conn.execute("SELECT id FROM entities WHERE name = ?", (name,)).fetchone()
+        if not row:
+            return []
+        return [
+            {"name": n, "type": t, "relation": rel, "direction": d}
+            for _, n, t, rel, d in self._expand([row[0]], relation, direction)
+        ]
+
+    def _expand(self, ids: List[int], relation: Optional[str], direction: str):
+        """Yields (node_id, name, type, relation, direction) for one hop from `ids`."""
+        sides = []
+        if direction in ("out", "both"):
+            sides.append(("source_id", "target_id", "out"))
+        if direction in ("in", "both"):
+            sides.append(("target_id", "source_id", "in"))
+        for start in range(0, len(ids), _MAX_PARAMS):
+            chunk = ids[start:start + _MAX_PARAMS]
+            marks = ",".join("?" * len(chunk))
+            for near, far, label in sides:
+                sql = (f"SELECT e.{far}, n.name, n.type, e.relation FROM edges e "
+                       f"JOIN entities n ON n.id = e.{far} WHERE e.{near} IN ({marks})")
+                params = list(chunk)
+                if relation:
+                    sql += " AND e.relation = ?"
+                    params.append(relation)
+                for node_id, n, t, rel in self.conn.execute(sql, params):
+                    yield node_id, n, t, rel, label
+
+    def traverse(self, start: str, max_depth: int = 2, relation: str = None,
+                 direction: str = "out", limit: int = 1000) -> List[Dict]:
+        """Breadth-first multi-hop walk. Each reachable entity is reported once, at its
+        shortest depth, with the entity it was reached from."""
+        row = self.conn.execute("SELECT id FROM entities WHERE name = ?", (start,)).fetchone()
+        if not row:
+            return []
+        visited = {row[0]: start}
+        frontier = [row[0]]
+        results = []
+        for depth in range(1, max_depth + 1):
+            next_frontier = []
+            for node_id, n, t, rel, d in self._expand(frontier, relation, direction):
+                if node_id in visited:
+                    continue
+                visited[node_id] = n
+                next_frontier.append(node_id)
+                results.append({"name": n, "type": t, "depth": depth, "relation": rel, "direction": d})
+                if len(results) >= limit:
+                    return results
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return results
+
+    def stats(self) -> Dict:
+        c = self.conn
+        return {
+            "entities": c.execute("SELECT COUNT(*) FROM entities").fetchone()[0],
+            "observations": c.execute("SELECT COUNT(*) FROM observations").fetchone()[0],
+            "edges": c.execute("SELECT COUNT(*) FROM edges").fetchone()[0],
+        }
+
+    # ---- Migration ----
+
+    def import_legacy_kv(self, agent_db_path: str) -> Dict:
+        """Copies `kg:entity:*` / `kg:relation:*` rows from the agent_memory `mem` table."""
+        src = sqlite3.connect(agent_db_path)
+        try:
+            rows = src.execute("SELECT k, v FROM mem WHERE k LIKE 'kg:%'").fetchall()
+        except sqlite3.Error:
+            rows = []
+        finally:
+            src.close()
+
+        entities, observations, relations = [], [], []
+        for key, value in rows:
+            if key.startswith("kg:entity:"):
+                name = key[len("kg:entity:"):]
+                try:
+                    data = json.loads(value)
+                except (TypeError, ValueError):
+                    continue
+                entities.append((name, data.get("type")))
+                observations.extend((name, o) for o in data.get("observations", []) if o)
+            elif key.startswith("kg:relation:"):
+                parts = key[len("kg:relation:"):].split(":")
+                if len(parts) == 3 and all(parts):
+                    relations.append(tuple(parts))
+
+        with self.batch():
+            self.add_entities(entities)
+            self.add_observations(observations)
+            self.add_relations(relations)
+        return {"entities": len(entities), "observations": len(observations), "relations": len(relations)}
+
+
+_graph = None
+_graph_lock = threading.Lock()
+
+
+def get_graph() -> GraphStore:
+    """Lazily opened process-wide store; the first open imports legacy kv entries."""
+    global _graph
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                fresh = not GRAPH_DB.exists()
+                store = GraphStore()
+                legacy_db = MEMORY_DIR / "agent_memory.db"
+                if fresh and legacy_db.exists():
+                    counts = store.import_legacy_kv(str(legacy_db))
+                    print(f"[*] Knowledge Graph: imported legacy entries {counts}")
+                _graph = store
+    return _graph
+
+
+if __name__ == "__main__":
+    print(json.dumps(get_graph().stats(), indent=2))
@@ -0,0 +1,158 @@
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+from core_os.memory.sqlite_local import LocalSQLite
+
+MEMORY_DIR = Path(__file__).parent.resolve()
+DB_PATH = MEMORY_DIR / "agent_memory.db"
+
+# Waiters re-check the table at least this often so mail posted by another
+# process (which cannot signal our Condition) is still picked up promptly.
+CROSS_PROCESS_RECHECK = 0.5
+DEFAULT_LEASE = 60.0
+
+# (id, role, content, timestamp) — the row shape AgentMemory.fetch_mail has always returned
+Mail = Tuple[int, str, str, str]
+
+
+class MailboxQueue(LocalSQLite):
+    """SQLite-backed message queue between agents and remote nodes.
+
+    Every thread gets its own connection (WAL mode), so producers and consumers
+    never share a cursor. Messages are claimed atomically, either delivered
+    outright or leased until `ack`/`nack`, and consumers can block in `fetch`
+    until mail arrives instead of polling.
+    """
+
+    def __init__(self, db_path=str(DB_PATH)):
+        super().__init__(db_path)
+        self._cond = threading.Condition()
+        self._generation = 0
+        self._init_db()
+
+    def _init_db(self):
+        conn = self.conn
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS mailbox (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                target TEXT,
+                role TEXT,
+                content TEXT,
+                status TEXT DEFAULT 'pending',
+                timestamp DATETIME
+            )
+        ''')
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(mailbox)")}
+        if "leased_until" not in columns:
+            conn.execute("ALTER TABLE mailbox ADD COLUMN leased_until REAL")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_mailbox_target_status ON mailbox(target, status, id)")
+
+    # ---- Producers ----
+
+    def post(self, target: str, role: str, content: str) -> int:
+        return self.post_many([(target, role, content)])[0]
+
+    def post_many(self, messages: Iterable[Tuple[str, str, str]]) -> List[int]:
+        """Queues messages in one transaction and wakes any waiting consumers."""
+        now = datetime.now()
+        ids = []
+        with self.transaction() as conn:
+            for target, role, content in messages:
+                cur = conn.execute(
+                    "INSERT INTO mailbox (target, role, content, timestamp) VALUES (?, ?, ?, ?)",
+                    (target, role, content, now)
+                )
+                ids.append(cur.lastrowid)
+        self._notify()
+        return ids
+
+    def _notify(self):
+        with self._cond:
+            self._generation += 1
+            self._cond.notify_all()
+
+    # ---- Consumers ----
+
+    def _claim(self, target: str, limit: int, lease: Optional[float]) -> List[Mail]:
+        now = time.time()
+        with self.transaction() as conn:
+            rows = conn.execute(
+                "SELECT id, role, content, timestamp FROM mailbox WHERE target=? AND status='pending' "
+                "UNION ALL "
+                "SELECT id, role, content, timestamp FROM mailbox WHERE target=? AND status='leased' "
+                "AND leased_until < ? "
+                "ORDER BY id LIMIT ?",
+                (target, target, now, limit)
+            ).fetchall()
+            if rows:
+                ids = [(r[0],) for r in rows]
+                if lease is None:
+                    conn.executemany("UPDATE mailbox SET status='delivered', leased_until=NULL WHERE id=?", ids)
+                else:
+                    conn.executemany(
+                        "UPDATE mailbox SET status='leased', leased_until=? WHERE id=?",
+                        [(now + lease, r[0]) for r in rows]
+                    )
+        return rows
+
+    def fetch(self, target: str, limit: int = 100, wait: float = 0.0,
+              auto_ack: bool = True, lease: float = DEFAULT_LEASE) -> List[Mail]:
+        """Claims up to `limit` messages for `target`, blocking up to `wait` seconds for mail.
+
+        With auto_ack the messages are marked delivered immediately; otherwise they
+        are leased and return to the queue unless `ack`ed before the lease expires.
+        """
+        deadline = time.monotonic() + max(0.0, wait)
+        while True:
+            with self._cond:
+                generation = self._generation
+            rows = self._claim(target, limit, None if auto_ack else lease)
+            remaining = deadline - time.monotonic()
+            if rows or remaining <= 0:
+                return rows
+            with self._cond:
+                # Skip the wait if something was posted while we were claiming
+                if self._generation == generation:
+                    self._cond.wait(min(remaining, CROSS_PROCESS_RECHECK))
+
+    def drain(self, target: str, wait: float = 0.0, auto_ack: bool = True,
+              lease: float = DEFAULT_LEASE, batch: int = 100) -> List[Mail]:
+        """Claims every pending message for `target` in batches of `batch`.
+
+        Only the first claim long-polls; the rest return immediately once the
+        queue is empty.
+        """
+        mail = self.fetch(target, limit=batch, wait=wait, auto_ack=auto_ack, lease=lease)
+        last = mail
+        while len(last) == batch:
+            last = self.fetch(target, limit=batch, auto_ack=auto_ack, lease=lease)
+            mail.extend(last)
+        return mail
+
+    def ack(self, ids: Iterable[int]) -> int:
+        """Marks leased messages delivered in one batch. Returns the number acknowledged."""
+        return self._settle(ids, "delivered")
+
+    def nack(self, ids: Iterable[int]) -> int:
+        """Returns leased messages to the queue immediately."""
+        count = self._settle(ids, "pending")
+        if count:
+            self._notify()
+        return count
+
+    def _settle(self, ids: Iterable[int], status: str) -> int:
+        with self.transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE mailbox SET status=?, leased_until=NULL WHERE id=? AND status='leased'",
+                [(status, i) for i in ids]
+            )
+            return conn.total_changes - before
+
+    def pending_count(self, target: str) -> int:
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM mailbox WHERE target=? AND status='pending'", (target,)
+        ).fetchone()[0]
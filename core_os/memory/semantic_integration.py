@@ -127,11 +127,14 @@ def search_index(query: str, limit: int = 5) -> List[Dict]:
     """Compatibility wrapper for existing codebase."""
     return memory_engine.search(query, limit=limit)
 
-def build_index():
-    """Refreshes the entire index from scratch (legacy support)."""
-    # This would involve load_gim_logs and load_chat_logs as before
-    # but for now we'll keep the core search functionality prioritized.
-    print("[!] Use separate build script for full re-indexing.")
+def build_index(workers: int = None, batch_size: int = None) -> Dict:
+    """Incrementally rebuilds the index from every local corpus (see corpus_indexer)."""
+    from core_os.memory.corpus_indexer import CorpusIndexer, WORKERS, BATCH_SIZE
+    indexer = CorpusIndexer(index_path=INDEX_PATH, workers=workers or WORKERS,
+                            batch_size=batch_size or BATCH_SIZE)
+    stats = indexer.run()
+    memory_engine._load_index()
+    return stats
 
 if __name__ == "__main__":
     # Test Search
@@ -0,0 +1,220 @@
+import ast
+import os
+import re
+import time
+import sqlite3
+import hashlib
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+from core_os.memory.sqlite_local import LocalSQLite
+
+MEMORY_DIR = Path(__file__).parent.resolve()
+DB_PATH = MEMORY_DIR / "agent_memory.db"
+
+BATCH_FILES = 200   # files written per transaction during a refresh
+
+# (symbol, path, line, type) — the row shape AgentMemory.search_catalog has always returned
+Symbol = Tuple[str, str, int, str]
+
+_DEF_RE = re.compile(r"^\s*(class|def|async\s+def)\s+([a-zA-Z_][a-zA-Z0-9_]*)", re.MULTILINE)
+
+
+def extract_symbols(source: str) -> List[Tuple[str, int, str]]:
+    """Returns (name, line, type) for every class/function, nested ones included.
+
+    Files that do not parse (Python 2 leftovers, half-written tools) fall back to
+    the regex scan the Librarian used before.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return [
+            (m.group(2), source.count("\n", 0, m.start()) + 1, m.group(1).replace("async ", "").split()[-1])
+            for m in _DEF_RE.finditer(source)
+        ]
+    symbols = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ClassDef):
+            symbols.append((node.name, node.lineno, "class"))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            symbols.append((node.name, node.lineno, "def"))
+    symbols.sort(key=lambda s: s[1])
+    return symbols
+
+
+class SymbolCatalog(LocalSQLite):
+    """The Librarian's card catalog: symbol definitions served from an FTS index.
+
+    Refreshes are incremental (files are skipped when their mtime/size, or failing
+    that their content hash, is unchanged) and written one transaction per batch.
+    Lookups go through an FTS5 trigram index, so substring searches no longer scan.
+    """
+
+    def __init__(self, db_path=str(DB_PATH)):
+        super().__init__(db_path)
+        self.fts_mode = None
+        self._init_db()
+
+    def _init_db(self):
+        conn = self.conn
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS catalog (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                symbol TEXT,
+                path TEXT,
+                line INTEGER,
+                type TEXT,
+                timestamp DATETIME
+            )
+        ''')
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_catalog_path ON catalog(path)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_catalog_symbol ON catalog(symbol)")
+        conn.execute('''
+            CREATE TABLE IF NOT EXISTS catalog_files (
+                path TEXT PRIMARY KEY,
+                mtime REAL,
+                size INTEGER,
+                sha1 TEXT,
+                indexed DATETIME
+            )
+        ''')
+        self.fts_mode = self._init_fts(conn)
+
+    def _init_fts(self, conn) -> str:
+        """Creates the FTS shadow index (trigram where supported) and its sync triggers."""
+        exists = conn.execute("SELECT sql FROM sqlite_master WHERE name='catalog_fts'").fetchone()
+        if exists:
+            return "trigram" if "trigram" in exists[0] else "unicode61"
+        mode = None
+        for tokenizer in ("trigram", "unicode61"):
+            try:
+                conn.execute(
+                    "CREATE VIRTUAL TABLE catalog_fts USING fts5("
+                    f"symbol, content='catalog', content_rowid='id', tokenize='{tokenizer}')"
+                )
+                mode = tokenizer
+                break
+            except sqlite3.OperationalError:
+                continue
+        if mode is None:
+            return "none"   # no FTS5 in this SQLite build; search() falls back to LIKE
+        conn.executescript('''
+            CREATE TRIGGER IF NOT EXISTS catalog_ai AFTER INSERT ON catalog BEGIN
+                INSERT INTO catalog_fts(rowid, symbol) VALUES (new.id, new.symbol);
+            END;
+            CREATE TRIGGER IF NOT EXISTS catalog_ad AFTER DELETE ON catalog BEGIN
+                INSERT INTO catalog_fts(catalog_fts, rowid, symbol) VALUES ('delete', old.id, old.symbol);
+            END;
+            CREATE TRIGGER IF NOT EXISTS catalog_au AFTER UPDATE ON catalog BEGIN
+                INSERT INTO catalog_fts(catalog_fts, rowid, symbol) VALUES ('delete', old.id, old.symbol);
+                INSERT INTO catalog_fts(rowid, symbol) VALUES (new.id, new.symbol);
+            END;
+        ''')
+        conn.execute("INSERT INTO catalog_fts(catalog_fts) VALUES ('rebuild')")
+        return mode
+
+    # ---- Refresh ----
+
+    def refresh(self, root: Path, files: Iterable[Path], prune: bool = True) -> Dict:
+        """Re-indexes changed files under `root`. Paths are stored relative to root."""
+        started = time.time()
+        root = Path(root)
+        known = {row[0]: row[1:] for row in self.conn.execute("SELECT path, mtime, size, sha1 FROM catalog_files")}
+        seen = set()
+        stats = {"files": 0, "unchanged": 0, "reindexed": 0, "symbols": 0, "removed": 0}
+        pending = []
+
+        for f_path in files:
+            try:
+                rel = str(Path(f_path).relative_to(root))
+                st = os.stat(f_path)
+            except (OSError, ValueError):
+                continue
+            seen.add(rel)
+            stats["files"] += 1
+            prev = known.get(rel)
+            if prev and prev[0] == st.st_mtime and prev[1] == st.st_size:
+                stats["unchanged"] += 1
+                continue
+            try:
+                data = Path(f_path).read_bytes()
+            except OSError:
+                continue
+            digest = hashlib.sha1(data).hexdigest()
+            if prev and prev[2] == digest:
+                # Touched but identical: just remember the new mtime
+                pending.append((rel, st, digest, None))
+                stats["unchanged"] += 1
+            else:
+                pending.append((rel, st, digest, extract_symbols(data.decode("utf-8", "ignore"))))
+                stats["reindexed"] += 1
+            if len(pending) >= BATCH_FILES:
+                stats["symbols"] += self._write_batch(pending)
+                pending = []
+        stats["symbols"] += self._write_batch(pending)
+
+        if prune:
+            gone = [p for p in known if p not in seen]
+            with self.transaction() as conn:
+                conn.executemany("DELETE FROM catalog WHERE path=?", [(p,) for p in gone])
+                conn.executemany("DELETE FROM catalog_files WHERE path=?", [(p,) for p in gone])
+            stats["removed"] = len(gone)
+
+        stats["elapsed_sec"] = round(time.time() - started, 3)
+        return stats
+
+    def _write_batch(self, pending) -> int:
+        if not pending:
+            return 0
+        now = datetime.now()
+        written = 0
+        with self.transaction() as conn:
+            for rel, st, digest, symbols in pending:
+                if symbols is not None:
+                    conn.execute("DELETE FROM catalog WHERE path=?", (rel,))
+                    conn.executemany(
+                        "INSERT INTO catalog (symbol, path, line, type, timestamp) VALUES (?, ?, ?, ?, ?)",
+                        [(name, rel, line, s_type, now) for name, line, s_type in symbols]
+                    )
+                    written += len(symbols)
+                conn.execute(
+                    "INSERT OR REPLACE INTO catalog_files (path, mtime, size, sha1, indexed) VALUES (?, ?, ?, ?, ?)",
+                    (rel, st.st_mtime, st.st_size, digest, now)
+                )
+        return written
+
+    def clear(self):
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM catalog")
+            conn.execute("DELETE FROM catalog_files")
+
+    # ---- Lookup ----
+
+    def search(self, pattern: str, limit: int = 500) -> List[Symbol]:
+        """Case-insensitive substring match on symbol names."""
+        pattern = pattern.strip()
+        if not pattern:
+            return []
+        if self.fts_mode == "trigram" and len(pattern) >= 3:
+            phrase = '"' + pattern.replace('"', '""') + '"'
+            return self.conn.execute(
+                "SELECT c.symbol, c.path, c.line, c.type FROM catalog_fts f "
+                "JOIN catalog c ON c.id = f.rowid WHERE catalog_fts MATCH ? LIMIT ?",
+                (f"symbol:{phrase}", limit)
+            ).fetchall()
+        if self.fts_mode == "unicode61" and re.fullmatch(r"\w+", pattern):
+            # Whole-token prefix matches only; snake_case names are single tokens here
+            rows = self.conn.execute(
+                "SELECT c.symbol, c.path, c.line, c.type FROM catalog_fts f "
+                "JOIN catalog c ON c.id = f.rowid WHERE catalog_fts MATCH ? LIMIT ?",
+                (f'symbol:"{pattern}"*', limit)
+            ).fetchall()
+            if rows:
+                return rows
+        # Short patterns (< 3 chars) cannot use trigrams; the catalog is small enough to scan
+        return self.conn.execute(
+            "SELECT symbol, path, line, type FROM catalog WHERE symbol LIKE ? LIMIT ?",
+            (f"%{pattern}%", limit)
+        ).fetchall()
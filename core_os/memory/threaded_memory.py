@@ -1,13 +1,19 @@
 import sqlite3
 import json
+import threading
 import time
 from datetime import datetime
+from pathlib import Path
+
+MEMORY_DIR = Path(__file__).parent.resolve()
+THREADS_DB = MEMORY_DIR / "threaded_memory.db"
 
 class ThreadedMemory:
-    def __init__(self, db_path="core_os/memory/threaded_memory.db"):
+    def __init__(self, db_path=str(THREADS_DB)):
         self.db_path = db_path
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self.cursor = self.conn.cursor()
+        self.fts_mode = None
         self._init_db()
 
     def _init_db(self):
@@ -20,8 +26,60 @@ class ThreadedMemory:
                 timestamp DATETIME
             )
         ''')
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_timestamp ON threads(timestamp)")
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_threads_topic ON threads(topic, timestamp)")
+        self.fts_mode = self._init_fts()
         self.conn.commit()
 
+    def _init_fts(self):
+        """FTS5 trigram shadow index over topic + content, kept in sync with `threads` by triggers.
+
+        Only the trigram tokenizer preserves the substring semantics of the LIKE
+        queries it replaces. Without it (SQLite < 3.34) there is no index and
+        every lookup stays on LIKE.
+        """
+        row = self.cursor.execute("SELECT sql FROM sqlite_master WHERE name='threads_fts'").fetchone()
+        if row:
+            if "trigram" in row[0]:
+                return "trigram"
+            # A whole-token index from an earlier build would change matching; drop it
+            self.cursor.executescript('''
+                DROP TRIGGER IF EXISTS threads_ai;
+                DROP TRIGGER IF EXISTS threads_ad;
+                DROP TRIGGER IF EXISTS threads_au;
+                DROP TABLE threads_fts;
+            ''')
+        try:
+            self.cursor.execute(
+                "CREATE VIRTUAL TABLE threads_fts USING fts5("
+                "topic, content, content='threads', content_rowid='id', tokenize='trigram')"
+            )
+        except sqlite3.OperationalError:
+            return None
+        self.cursor.executescript('''
+            CREATE TRIGGER IF NOT EXISTS threads_ai AFTER INSERT ON threads BEGIN
+                INSERT INTO threads_fts(rowid, topic, content) VALUES (new.id, new.topic, new.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS threads_ad AFTER DELETE ON threads BEGIN
+                INSERT INTO threads_fts(threads_fts, rowid, topic, content) VALUES ('delete', old.id, old.topic, old.content);
+            END;
+            CREATE TRIGGER IF NOT EXISTS threads_au AFTER UPDATE ON threads BEGIN
+                INSERT INTO threads_fts(threads_fts, rowid, topic, content) VALUES ('delete', old.id, old.topic, old.content);
+                INSERT INTO threads_fts(rowid, topic, content) VALUES (new.id, new.topic, new.content);
+            END;
+        ''')
+        # Backfill rows written before the index existed
+        self.cursor.execute("INSERT INTO threads_fts(threads_fts) VALUES ('rebuild')")
+        return "trigram"
+
+    def _fts_query(self, text, column=None):
+        """Builds a MATCH expression, or None when the FTS index cannot answer it."""
+        text = text.strip()
+        if self.fts_mode != "trigram" or len(text) < 3:
+            return None   # no index, or too short for a trigram
+        phrase = '"' + text.replace('"', '""') + '"'
+        return f"{column}:{phrase}" if column else phrase
+
     def save_thought(self, topic, content, valence=0.5):
         """Saves a 'Threaded Memory Object'."""
         self.cursor.execute(
@@ -32,10 +90,37 @@ class ThreadedMemory:
         return f"Saved thread: [{topic}]"
 
     def retrieve_relevant(self, query_topic, limit=3):
-        """Retrieves memories matching a topic (simple keyword match for now)."""
+        """Retrieves the newest memories whose topic contains `query_topic`."""
+        match = self._fts_query(query_topic, column="topic")
+        if match:
+            self.cursor.execute(
+                "SELECT content, timestamp FROM threads WHERE id IN "
+                "(SELECT rowid FROM threads_fts WHERE threads_fts MATCH ?) "
+                "ORDER BY timestamp DESC LIMIT ?",
+                (match, limit)
+            )
+        else:
+            self.cursor.execute(
+                "SELECT content, timestamp FROM threads WHERE topic LIKE ? ORDER BY timestamp DESC LIMIT ?",
+                (f"%{query_topic}%", limit)
+            )
+        return self.cursor.fetchall()
+
+    def search(self, query, limit=5):
+        """Full-text search over topics and content, best matches first."""
+        match = self._fts_query(query)
+        if not match:
+            pattern = f"%{query}%"
+            self.cursor.execute(
+                "SELECT content, timestamp FROM threads WHERE topic LIKE ? OR content LIKE ? "
+                "ORDER BY timestamp DESC LIMIT ?",
+                (pattern, pattern, limit)
+            )
+            return self.cursor.fetchall()
         self.cursor.execute(
-            "SELECT content, timestamp FROM threads WHERE topic LIKE ? ORDER BY timestamp DESC LIMIT ?",
-            (f"%{query_topic}%", limit)
+            "SELECT t.content, t.timestamp FROM threads_fts f JOIN threads t ON t.id = f.rowid "
+            "WHERE threads_fts MATCH ? ORDER BY f.rank LIMIT ?",
+            (match, limit)
         )
         return self.cursor.fetchall()
 
@@ -43,8 +128,28 @@ class ThreadedMemory:
         self.cursor.execute("SELECT topic, content FROM threads ORDER BY timestamp DESC LIMIT ?", (limit,))
         return self.cursor.fetchall()
 
-tmo_store = ThreadedMemory()
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_tmo_store() -> ThreadedMemory:
+    """Lazily opened process-wide store, so importing this module touches no files."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ThreadedMemory()
+    return _store
+
+
+def __getattr__(name):
+    # `from core_os.memory.threaded_memory import tmo_store` keeps working, opened on first use
+    if name == "tmo_store":
+        return get_tmo_store()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
+    tmo_store = get_tmo_store()
     tmo_store.save_thought("Identity", "I am a collaborative intelligence, not a finished product.", 0.9)
     print(tmo_store.retrieve_relevant("Identity"))
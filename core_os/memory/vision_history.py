@@ -0,0 +1,108 @@
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from core_os.memory.sqlite_local import LocalSQLite
+
+MEMORY_DIR = Path(__file__).parent.resolve()
+HISTORY_DB = MEMORY_DIR / "vision_history.db"
+LEGACY_JSON = MEMORY_DIR / "visual_history.json"
+CAPACITY = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS vision_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT NOT NULL,
+    source TEXT,
+    description TEXT NOT NULL
+);
+"""
+
+
+class VisionHistory(LocalSQLite):
+    """Fixed-capacity, append-only log of what the vision models saw.
+
+    Each append inserts one row and drops whatever fell out of the window, so
+    the cost does not grow with the history. Reads of the last N entries walk
+    the primary key backwards. Writers in other threads or processes
+    serialize on SQLite's write lock instead of overwriting each other's file.
+    """
+
+    def __init__(self, db_path=str(HISTORY_DB), capacity: int = CAPACITY):
+        super().__init__(db_path)
+        self.capacity = capacity
+        self.conn.executescript(SCHEMA)
+
+    def append(self, description: str, source: Optional[str] = None,
+               timestamp: Optional[str] = None) -> int:
+        return self.extend([(timestamp or datetime.now().isoformat(), source, description)])[-1]
+
+    def extend(self, entries: Iterable[Tuple[str, Optional[str], str]]) -> List[int]:
+        """Appends (timestamp, source, description) rows in one transaction and trims the window."""
+        ids = []
+        with self.transaction() as conn:
+            for timestamp, source, description in entries:
+                cur = conn.execute(
+                    "INSERT INTO vision_history (timestamp, source, description) VALUES (?, ?, ?)",
+                    (timestamp, source, description)
+                )
+                ids.append(cur.lastrowid)
+            if ids:
+                # ids are monotonic, so the window is a primary-key range
+                conn.execute("DELETE FROM vision_history WHERE id <= ?", (ids[-1] - self.capacity,))
+        return ids
+
+    def recent(self, limit: int = 10) -> List[Dict]:
+        """Last `limit` entries, oldest first."""
+        rows = self.conn.execute(
+            "SELECT id, timestamp, source, description FROM vision_history ORDER BY id DESC LIMIT ?",
+            (min(limit, self.capacity),)
+        ).fetchall()
+        return [
+            {"id": r[0], "timestamp": r[1], "source": r[2], "description": r[3]}
+            for r in reversed(rows)
+        ]
+
+    def count(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM vision_history").fetchone()[0]
+
+    # ---- Migration ----
+
+    def import_legacy_json(self, path: str) -> int:
+        """Copies entries from the old read-modify-write visual_history.json."""
+        try:
+            with open(path) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return 0
+        rows = [
+            (e.get("timestamp") or "", None, e["description"])
+            for e in entries if isinstance(e, dict) and e.get("description")
+        ]
+        self.extend(rows[-self.capacity:])
+        return len(rows[-self.capacity:])
+
+
+_history = None
+_history_lock = threading.Lock()
+
+
+def get_vision_history() -> VisionHistory:
+    """Lazily opened process-wide store; the first open imports the legacy JSON log."""
+    global _history
+    if _history is None:
+        with _history_lock:
+            if _history is None:
+                fresh = not HISTORY_DB.exists()
+                store = VisionHistory()
+                if fresh and LEGACY_JSON.exists():
+                    count = store.import_legacy_json(str(LEGACY_JSON))
+                    print(f"[*] Vision History: imported {count} legacy entries")
+                _history = store
+    return _history
+
+
+if __name__ == "__main__":
+    print(json.dumps(get_vision_history().recent(10), indent=2))
@@ -0,0 +1,152 @@
+"""
+metrics.py — per-call latency and resource accounting for skills and tools.
+
+Every instrumented call records wall time, CPU time, outcome and whether it
+raised the process's peak RSS. Each (kind, name) pair keeps cumulative counters,
+a fixed-bucket latency histogram and a rolling window of recent calls for
+percentiles. Recording is a few dict updates under a lock, so it stays on in
+production.
+
+    with metrics.timed("tool", "web_search") as call:
+        result = web_search(q)
+        if result.get("status") == "error":
+            call.fail()
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Upper bounds of the latency buckets, in milliseconds (the last bucket is open-ended)
+BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+WINDOW = 256   # recent calls kept per name for percentiles
+
+
+def _peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+
+
+class _CallStats:
+    __slots__ = ("count", "errors", "wall_sum", "cpu_sum", "wall_max", "rss_growth_kb", "buckets", "recent", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.wall_sum = 0.0
+        self.cpu_sum = 0.0
+        self.wall_max = 0.0
+        self.rss_growth_kb = 0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.recent = deque(maxlen=WINDOW)   # (timestamp, wall, cpu, ok)
+        self.last = 0.0
+
+    def add(self, wall: float, cpu: float, ok: bool, rss_growth_kb: int):
+        self.count += 1
+        self.errors += 0 if ok else 1
+        self.wall_sum += wall
+        self.cpu_sum += cpu
+        self.wall_max = max(self.wall_max, wall)
+        self.rss_growth_kb += max(0, rss_growth_kb)
+        ms = wall * 1000
+        for i, bound in enumerate(BUCKETS_MS):
+            if ms <= bound:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.last = time.time()
+        self.recent.append((self.last, wall, cpu, ok))
+
+    def summary(self) -> dict:
+        walls = sorted(r[1] for r in self.recent)
+        errors = sum(1 for r in self.recent if not r[3])
+
+        def pct(p):
+            return round(walls[min(len(walls) - 1, int(p * len(walls)))] * 1000, 2) if walls else 0.0
+
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "mean_ms": round(self.wall_sum / self.count * 1000, 2) if self.count else 0.0,
+            "max_ms": round(self.wall_max * 1000, 2),
+            "cpu_ms_total": round(self.cpu_sum * 1000, 2),
+            "rss_growth_kb": self.rss_growth_kb,
+            "histogram_ms": {
+                **{f"<={b}": n for b, n in zip(BUCKETS_MS, self.buckets)},
+                f">{BUCKETS_MS[-1]}": self.buckets[-1],
+            },
+            "window": {
+                "calls": len(walls),
+                "p50_ms": pct(0.50),
+                "p95_ms": pct(0.95),
+                "p99_ms": pct(0.99),
+                "error_rate": round(errors / len(walls), 3) if walls else 0.0,
+            },
+            "last_call": self.last,
+        }
+
+
+class _Call:
+    __slots__ = ("ok", "cpu", "rss_growth_kb")
+
+    def __init__(self):
+        self.ok = True
+        # Set by callers whose work ran elsewhere (e.g. in a worker process)
+        self.cpu = None
+        self.rss_growth_kb = None
+
+    def fail(self):
+        self.ok = False
+
+
+class CallMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[Tuple[str, str], _CallStats] = {}
+
+    def record(self, kind: str, name: str, wall: float, cpu: float = 0.0, ok: bool = True, rss_growth_kb: int = 0):
+        with self._lock:
+            stats = self._stats.get((kind, name))
+            if stats is None:
+                stats = self._stats[(kind, name)] = _CallStats()
+            stats.add(wall, cpu, ok, rss_growth_kb)
+
+    @contextmanager
+    def timed(self, kind: str, name: str):
+        """Times the block; an exception or call.fail() marks the call as an error."""
+        call = _Call()
+        rss = _peak_rss_kb()
+        cpu = time.thread_time()
+        started = time.perf_counter()
+        try:
+            yield call
+        except BaseException:
+            call.ok = False
+            raise
+        finally:
+            wall = time.perf_counter() - started
+            used = call.cpu if call.cpu is not None else time.thread_time() - cpu
+            growth = call.rss_growth_kb if call.rss_growth_kb is not None else _peak_rss_kb() - rss
+            self.record(kind, name, wall, used, call.ok, growth)
+
+    def snapshot(self, kind: Optional[str] = None) -> dict:
+        with self._lock:
+            items = [(k, s.summary()) for k, s in self._stats.items() if kind is None or k[0] == kind]
+        out: Dict[str, dict] = {}
+        for (k, name), summary in sorted(items):
+            out.setdefault(k, {})[name] = summary
+        return out
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+
+metrics = CallMetrics()
@@ -0,0 +1,174 @@
+"""
+model_health.py — sticky model selection for fallback chains.
+
+A chain such as milla_vision.VISION_MODELS is ordered best-first. Walking it
+from the top on every call makes each request pay the timeout of every
+unreachable model above the first working one. ModelSelector remembers what
+happened instead:
+
+  * a model that fails is taken out of rotation for a backoff period that
+    doubles with each consecutive failure (BASE_BACKOFF .. MAX_BACKOFF);
+  * once its backoff expires it is re-tested by a background probe, not by a
+    live request, and rejoins the rotation only when the probe succeeds;
+  * live calls try the healthy models in quality order, so the best model is
+    used again as soon as it recovers;
+  * if nothing is healthy, every model is tried, starting with the one that
+    last worked.
+
+    selector = ModelSelector(["big-cloud", "local-7b"], probe=ping)
+    for model in selector.candidates():
+        try:
+            out = call(model)
+        except Exception as e:
+            selector.record_failure(model, e)
+            continue
+        selector.record_success(model)
+        return out
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+BASE_BACKOFF = 15.0
+MAX_BACKOFF = 600.0
+PROBE_INTERVAL = 5.0
+
+
+class _Health:
+    __slots__ = ("failures", "retry_at", "last_ok", "last_error", "latency_ms", "calls")
+
+    def __init__(self):
+        self.failures = 0
+        self.retry_at = 0.0
+        self.last_ok: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.latency_ms: Optional[float] = None
+        self.calls = 0
+
+
+class ModelSelector:
+    def __init__(self, models: List[str], probe: Optional[Callable[[str], bool]] = None,
+                 base_backoff: float = BASE_BACKOFF, max_backoff: float = MAX_BACKOFF,
+                 probe_interval: float = PROBE_INTERVAL, clock: Callable[[], float] = time.monotonic):
+        self.models = list(models)
+        self.probe = probe
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.probe_interval = probe_interval
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._health: Dict[str, _Health] = {m: _Health() for m in self.models}
+        self._sticky: Optional[str] = None
+        self._prober: Optional[threading.Thread] = None
+        self._wake = threading.Event()
+
+    # -- selection ----------------------------------------------------------
+
+    def candidates(self) -> List[str]:
+        """Models to try, in order, for one call."""
+        with self._lock:
+            healthy = [m for m in self.models if self._health[m].failures == 0]
+            if healthy:
+                return healthy
+            # Everything is down: try the last model that worked first, then the rest
+            rest = [m for m in self.models if m != self._sticky]
+            return ([self._sticky] if self._sticky else []) + rest
+
+    @property
+    def current(self) -> Optional[str]:
+        """The model the next call will start with."""
+        candidates = self.candidates()
+        return candidates[0] if candidates else None
+
+    # -- outcomes -----------------------------------------------------------
+
+    def record_success(self, model: str, seconds: Optional[float] = None):
+        with self._lock:
+            h = self._health[model]
+            h.failures = 0
+            h.retry_at = 0.0
+            h.last_ok = time.time()
+            h.calls += 1
+            if seconds is not None:
+                ms = seconds * 1000
+                h.latency_ms = ms if h.latency_ms is None else 0.8 * h.latency_ms + 0.2 * ms
+            self._sticky = model
+
+    def record_failure(self, model: str, error=None):
+        with self._lock:
+            h = self._health[model]
+            h.failures += 1
+            h.calls += 1
+            h.last_error = str(error)[:200] if error is not None else "failed"
+            h.retry_at = self._clock() + self._backoff(h.failures)
+        self._ensure_prober()
+
+    def _backoff(self, failures: int) -> float:
+        return min(self.max_backoff, self.base_backoff * (2 ** (failures - 1)))
+
+    # -- recovery -----------------------------------------------------------
+
+    def probe_due(self) -> List[str]:
+        """Probes every failed model whose backoff has expired; returns the ones that recovered."""
+        now = self._clock()
+        with self._lock:
+            due = [m for m in self.models if self._health[m].failures and self._health[m].retry_at <= now]
+        recovered = []
+        for model in due:
+            started = time.perf_counter()
+            try:
+                ok = bool(self.probe(model)) if self.probe else False
+                error = None if ok else "probe failed"
+            except Exception as e:
+                ok, error = False, e
+            if ok:
+                with self._lock:
+                    h = self._health[model]
+                    h.failures, h.retry_at, h.last_ok = 0, 0.0, time.time()
+                    h.latency_ms = (time.perf_counter() - started) * 1000 if h.latency_ms is None else h.latency_ms
+                recovered.append(model)
+            else:
+                self.record_failure(model, error)
+        return recovered
+
+    def _ensure_prober(self):
+        if self.probe is None or (self._prober is not None and self._prober.is_alive()):
+            return
+        with self._lock:
+            if self._prober is None or not self._prober.is_alive():
+                self._prober = threading.Thread(target=self._probe_loop, name="model-probe", daemon=True)
+                self._prober.start()
+
+    def _probe_loop(self):
+        while True:
+            self._wake.wait(self.probe_interval)
+            self._wake.clear()
+            try:
+                self.probe_due()
+            except Exception:
+                pass
+            with self._lock:
+                if not any(h.failures for h in self._health.values()):
+                    self._prober = None
+                    return
+
+    # -- reporting ----------------------------------------------------------
+
+    def status(self) -> dict:
+        now = self._clock()
+        with self._lock:
+            models = {}
+            for m in self.models:
+                h = self._health[m]
+                models[m] = {
+                    "state": "healthy" if not h.failures else "backoff",
+                    "consecutive_failures": h.failures,
+                    "retry_in_sec": round(max(0.0, h.retry_at - now), 1) if h.failures else 0,
+                    "last_error": h.last_error,
+                    "last_ok": h.last_ok,
+                    "latency_ms": round(h.latency_ms, 1) if h.latency_ms is not None else None,
+                    "calls": h.calls,
+                }
+            sticky = self._sticky
+        return {"current": self.current, "last_working": sticky, "models": models}
@@ -0,0 +1,227 @@
+"""
+ocr_cache.py — tile-level OCR reuse between consecutive frames.
+
+Each caller keeps its own stream ("screen", "desktop", "camera"). A frame is
+cut into TILE x TILE tiles and each tile gets a digest of its pixel bytes.
+Only a tile whose bytes are identical to the previous frame's tile counts as
+unchanged. A perceptual hash would be too coarse here: a one-character edit
+("12 tests" -> "13 tests") barely moves it, and the old text would be returned.
+Text from the previous frame that lies only on unchanged tiles is reused. Changed tiles are merged into regions, and only those regions go
+through the shared OCR service (core_os.ocr_service). A frame whose tiles all
+match is answered without OCR.
+
+    from core_os.ocr_cache import ocr_cache
+    results = ocr_cache.readtext("/tmp/screen.png", stream="screen")
+
+Results have the same shape as easyocr's detail=1 output,
+[(bbox, text, confidence), ...], in frame coordinates and reading order.
+
+Config (env):
+    OCR_TILE            tile edge in pixels (default 160)
+    OCR_FULL_RATIO      changed-tile fraction above which the whole frame is re-read (default 0.5)
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from core_os.lazy import lazy_module
+
+# Imported on first frame so that importing core_os.actions stays light
+_Image = lazy_module("PIL.Image")
+_np = lazy_module("numpy")
+
+TILE = int(os.getenv("OCR_TILE", "160"))
+FULL_RATIO = float(os.getenv("OCR_FULL_RATIO", "0.5"))
+MARGIN = 8          # px of context added around re-read regions
+MAX_STREAMS = 16
+
+Box = Tuple[int, int, int, int]   # left, top, right, bottom
+
+
+def dhash(image, size: int = 16) -> int:
+    """Difference hash: size*size bits, one per horizontally adjacent pixel pair."""
+    pixels = list(image.convert("L").resize((size + 1, size)).getdata())
+    bits = 0
+    for row in range(size):
+        base = row * (size + 1)
+        for col in range(size):
+            bits = (bits << 1) | (pixels[base + col] > pixels[base + col + 1])
+    return bits
+
+
+def hamming(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def tile_digest(image) -> bytes:
+    """Exact content hash of an image's pixels."""
+    return hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+
+
+def _bbox_box(bbox) -> Box:
+    xs = [int(p[0]) for p in bbox]
+    ys = [int(p[1]) for p in bbox]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _overlaps(a: Box, b: Box) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _offset(result, dx: int, dy: int):
+    bbox, text, conf = result
+    return [[int(p[0]) + dx, int(p[1]) + dy] for p in bbox], text, conf
+
+
+class _Frame:
+    __slots__ = ("size", "digests", "results")
+
+    def __init__(self, size, digests, results):
+        self.size = size
+        self.digests = digests
+        self.results = results
+
+
+class TiledOCRCache:
+    def __init__(self, readtext: Optional[Callable[..., List]] = None, tile: int = TILE,
+                 full_ratio: float = FULL_RATIO):
+        self._readtext = readtext
+        self.tile = tile
+        self.full_ratio = full_ratio
+        self._frames: "OrderedDict[str, _Frame]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"frames": 0, "full_hits": 0, "full_reads": 0, "region_reads": 0,
+                       "tiles_total": 0, "tiles_reused": 0, "bypass": 0}
+
+    # -- public API ---------------------------------------------------------
+
+    def readtext(self, image, stream: str = "default") -> List:
+        """OCR `image` (path or PIL image), re-reading only tiles that changed since the last frame of `stream`."""
+        if isinstance(image, (str, os.PathLike)):
+            Image = _Image.get()
+            if Image is None:
+                self._count(bypass=1)
+                return self._ocr(os.fspath(image))
+            with Image.open(image) as img:
+                img.load()
+                return self._read_frame(img, stream)
+        return self._read_frame(image, stream)
+
+    def forget(self, stream: Optional[str] = None):
+        with self._lock:
+            if stream is None:
+                self._frames.clear()
+            else:
+                self._frames.pop(stream, None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["streams"] = list(self._frames)
+        total = stats["tiles_total"]
+        stats["tile_hit_rate"] = round(stats["tiles_reused"] / total, 3) if total else 0.0
+        frames = stats["frames"]
+        stats["frame_hit_rate"] = round(stats["full_hits"] / frames, 3) if frames else 0.0
+        return stats
+
+    # -- internals ----------------------------------------------------------
+
+    def _ocr(self, image) -> List:
+        if self._readtext is None:
+            from core_os.ocr_service import ocr
+            self._readtext = ocr.readtext
+        return self._readtext(image, detail=1)
+
+    def _ocr_region(self, image, box: Box) -> List:
+        crop = image.crop(box)
+        Image, np = _Image.get(), _np.get()
+        if np is not None and Image is not None and isinstance(crop, Image.Image):
+            crop = np.asarray(crop.convert("RGB"))
+        return [_offset(r, box[0], box[1]) for r in self._ocr(crop)]
+
+    def _count(self, **deltas):
+        with self._lock:
+            for key, value in deltas.items():
+                self._stats[key] += value
+
+    def _grid(self, size) -> List[Box]:
+        width, height = size
+        return [(x, y, min(x + self.tile, width), min(y + self.tile, height))
+                for y in range(0, height, self.tile) for x in range(0, width, self.tile)]
+
+    def _read_frame(self, image, stream: str) -> List:
+        size = tuple(image.size)
+        tiles = self._grid(size)
+        digests = [tile_digest(image.crop(box)) for box in tiles]
+        with self._lock:
+            prev = self._frames.get(stream)
+            self._stats["frames"] += 1
+            self._stats["tiles_total"] += len(tiles)
+
+        comparable = prev is not None and prev.size == size
+        if comparable:
+            changed = [i for i, (a, b) in enumerate(zip(digests, prev.digests)) if a != b]
+        else:
+            changed = list(range(len(tiles)))
+        self._count(tiles_reused=len(tiles) - len(changed))
+
+        if not changed:
+            self._count(full_hits=1)
+            results = prev.results
+        elif not comparable or len(changed) > self.full_ratio * len(tiles):
+            # Nothing to patch: a new stream or a resolution change always reads the whole frame
+            self._count(full_reads=1)
+            results = self._ocr_region(image, (0, 0) + size)
+        else:
+            results = self._reread(image, size, tiles, changed, prev.results)
+
+        with self._lock:
+            self._frames[stream] = _Frame(size, digests, results)
+            self._frames.move_to_end(stream)
+            while len(self._frames) > MAX_STREAMS:
+                self._frames.popitem(last=False)
+        return list(results)
+
+    def _reread(self, image, size, tiles: List[Box], changed: List[int], previous: List) -> List:
+        dirty = [tiles[i] for i in changed]
+        kept, stale = [], []
+        for result in previous:
+            (stale if any(_overlaps(_bbox_box(result[0]), d) for d in dirty) else kept).append(result)
+
+        fresh = []
+        for region in self._regions(dirty, [_bbox_box(r[0]) for r in stale], size):
+            self._count(region_reads=1)
+            fresh.extend(self._ocr_region(image, region))
+
+        # Text cut at a region edge may duplicate a reused result; the fresh read wins
+        fresh_boxes = [_bbox_box(r[0]) for r in fresh]
+        kept = [r for r in kept if not any(_overlaps(_bbox_box(r[0]), b) for b in fresh_boxes)]
+        return sorted(kept + fresh, key=lambda r: (_bbox_box(r[0])[1], _bbox_box(r[0])[0]))
+
+    @staticmethod
+    def _regions(dirty: List[Box], stale: List[Box], size) -> List[Box]:
+        """Merges overlapping/adjacent dirty tiles and the stale text boxes touching them."""
+        boxes = [list(b) for b in dirty + stale]
+        merged = True
+        while merged:
+            merged = False
+            out: List[List[int]] = []
+            for box in boxes:
+                for other in out:
+                    if box[0] <= other[2] and other[0] <= box[2] and box[1] <= other[3] and other[1] <= box[3]:
+                        other[0], other[1] = min(other[0], box[0]), min(other[1], box[1])
+                        other[2], other[3] = max(other[2], box[2]), max(other[3], box[3])
+                        merged = True
+                        break
+                else:
+                    out.append(box)
+            boxes = out
+        width, height = size
+        return [(max(0, b[0] - MARGIN), max(0, b[1] - MARGIN), min(width, b[2] + MARGIN), min(height, b[3] + MARGIN))
+                for b in boxes]
+
+
+ocr_cache = TiledOCRCache()
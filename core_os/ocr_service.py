@@ -0,0 +1,232 @@
+"""
+ocr_service.py — one EasyOCR reader for the whole process.
+
+The server (/api/ocr), the control plane (desktop snapshots), core_os.actions
+(find_on_screen) and the vision tool all submit work here instead of building
+their own easyocr.Reader; each reader holds a full copy of the detection and
+recognition models.
+
+    from core_os.ocr_service import ocr
+    results = ocr.readtext("/tmp/frame.png", detail=1)
+
+Requests go through a bounded queue to a single worker thread that owns the
+reader. The worker drains up to OCR_BATCH requests at a time, answers duplicate
+requests for the same file once, and runs same-sized in-memory frames through
+readtext_batched. Torch intra-op threads are capped at OCR_THREADS so concurrent
+callers queue up instead of oversubscribing the CPU.
+
+Config (env):
+    OCR_THREADS     torch threads for the reader (default: half the cores)
+    OCR_QUEUE_SIZE  pending requests before callers get OCRBusy (default 32)
+    OCR_BATCH       requests drained per worker pass (default 8)
+    OCR_TIMEOUT     seconds a caller waits for its result (default 120)
+    OCR_GPU         auto | 1 | 0 — auto uses the GPU when torch sees one, else CPU (default auto)
+"""
+
+import importlib.util
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from typing import Any, Callable, Dict, List, Optional
+
+from core_os.lazy import LazyResource
+
+THREADS = int(os.getenv("OCR_THREADS", str(max(1, (os.cpu_count() or 2) // 2))))
+QUEUE_SIZE = int(os.getenv("OCR_QUEUE_SIZE", "32"))
+BATCH = int(os.getenv("OCR_BATCH", "8"))
+TIMEOUT = float(os.getenv("OCR_TIMEOUT", "120"))
+GPU = os.getenv("OCR_GPU", "auto").lower()
+
+
+class OCRBusy(RuntimeError):
+    """The request queue is full."""
+
+
+class OCRUnavailable(RuntimeError):
+    """EasyOCR (or its models) could not be loaded."""
+
+
+def _want_gpu(torch) -> bool:
+    if GPU in ("0", "false", "no"):
+        return False
+    if GPU in ("1", "true", "yes"):
+        return True
+    try:
+        return bool(torch is not None and torch.cuda.is_available())
+    except Exception:
+        return False
+
+
+def _load_easyocr():
+    try:
+        import torch
+        torch.set_num_threads(THREADS)
+    except Exception:
+        torch = None
+    import easyocr
+    if _want_gpu(torch):
+        try:
+            return easyocr.Reader(["en"], gpu=True, verbose=False)
+        except Exception as e:
+            print(f"[!] OCR: GPU reader failed, falling back to CPU. ({e})")
+    return easyocr.Reader(["en"], gpu=False, verbose=False)
+
+
+class _Request:
+    __slots__ = ("image", "detail", "kwargs", "key", "future")
+
+    def __init__(self, image, detail: int, kwargs: dict):
+        self.image = image
+        self.detail = detail
+        self.kwargs = kwargs
+        self.key = self._key(image, detail, kwargs)
+        self.future: Future = Future()
+
+    @staticmethod
+    def _key(image, detail, kwargs):
+        if not isinstance(image, (str, os.PathLike)):
+            return None
+        try:
+            st = os.stat(image)
+        except OSError:
+            return None
+        return (os.fspath(image), st.st_mtime_ns, st.st_size, detail, tuple(sorted(kwargs.items())))
+
+
+class OCRService:
+    def __init__(self, loader: Callable[[], Any] = _load_easyocr, queue_size: int = QUEUE_SIZE,
+                 batch: int = BATCH, timeout: float = TIMEOUT):
+        self.engine = LazyResource("easyocr.Reader", loader)
+        self.batch = max(1, batch)
+        self.timeout = timeout
+        self._queue: "queue.Queue[_Request]" = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self.stats = {"requests": 0, "recognized": 0, "deduplicated": 0, "batched": 0,
+                      "rejected": 0, "errors": 0, "busy_sec": 0.0}
+
+    # -- public API ---------------------------------------------------------
+
+    @property
+    def installed(self) -> bool:
+        """True if easyocr is importable (checked without loading it)."""
+        if self.engine.loaded:
+            return self.engine.error is None
+        return importlib.util.find_spec("easyocr") is not None
+
+    def preload(self) -> bool:
+        """Loads the reader now (blocking); returns whether it is usable."""
+        return self.engine.get() is not None
+
+    def submit(self, image, detail: int = 1, **kwargs) -> Future:
+        """Queues `image` (path, ndarray or encoded bytes) for recognition."""
+        req = _Request(image, detail, kwargs)
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(req)
+        except queue.Full:
+            with self._lock:
+                self.stats["rejected"] += 1
+            raise OCRBusy(f"OCR queue full ({self._queue.maxsize} pending)")
+        with self._lock:
+            self.stats["requests"] += 1
+        return req.future
+
+    def readtext(self, image, detail: int = 1, timeout: Optional[float] = None, **kwargs) -> List:
+        """Same results as easyocr.Reader.readtext, via the shared worker."""
+        future = self.submit(image, detail, **kwargs)
+        try:
+            return future.result(timeout=self.timeout if timeout is None else timeout)
+        except FutureTimeout:
+            future.cancel()
+            raise TimeoutError("OCR request timed out")
+
+    def status(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+        stats["busy_sec"] = round(stats["busy_sec"], 3)
+        if not self.engine.loaded:
+            state = "pending"
+        else:
+            state = "ready" if self.engine.error is None else self.engine.error
+        return {"reader": state, "queued": self._queue.qsize(), "threads": THREADS, **stats}
+
+    # -- worker -------------------------------------------------------------
+
+    def _ensure_worker(self):
+        if self._worker is not None and self._worker.is_alive():
+            return
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._loop, name="ocr-service", daemon=True)
+                self._worker.start()
+
+    def _loop(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.batch:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            started = time.perf_counter()
+            try:
+                self._process([r for r in batch if r.future.set_running_or_notify_cancel()])
+            finally:
+                with self._lock:
+                    self.stats["busy_sec"] += time.perf_counter() - started
+
+    def _process(self, batch: List[_Request]):
+        if not batch:
+            return
+        reader = self.engine.get()
+        if reader is None:
+            err = OCRUnavailable(self.engine.error or "easyocr unavailable")
+            for req in batch:
+                req.future.set_exception(err)
+            return
+
+        # Identical file requests are recognized once
+        groups: Dict[Any, List[_Request]] = {}
+        for i, req in enumerate(batch):
+            groups.setdefault(req.key if req.key is not None else ("req", i), []).append(req)
+        leaders = [reqs[0] for reqs in groups.values()]
+        with self._lock:
+            self.stats["deduplicated"] += len(batch) - len(leaders)
+
+        for reqs, result in zip(groups.values(), self._recognize(reader, leaders)):
+            for req in reqs:
+                if isinstance(result, BaseException):
+                    req.future.set_exception(result)
+                else:
+                    req.future.set_result(result)
+
+    def _recognize(self, reader, reqs: List[_Request]) -> List[Any]:
+        shapes = {getattr(r.image, "shape", None) for r in reqs}
+        same_options = len({(r.detail, tuple(sorted(r.kwargs.items()))) for r in reqs}) == 1
+        if (len(reqs) > 1 and same_options and len(shapes) == 1 and None not in shapes
+                and hasattr(reader, "readtext_batched")):
+            try:
+                out = reader.readtext_batched([r.image for r in reqs], detail=reqs[0].detail, **reqs[0].kwargs)
+                with self._lock:
+                    self.stats["batched"] += len(reqs)
+                    self.stats["recognized"] += len(reqs)
+                return list(out)
+            except Exception:
+                pass   # fall back to one at a time
+        results = []
+        for req in reqs:
+            try:
+                results.append(reader.readtext(req.image, detail=req.detail, **req.kwargs))
+                with self._lock:
+                    self.stats["recognized"] += 1
+            except Exception as e:
+                with self._lock:
+                    self.stats["errors"] += 1
+                results.append(e)
+        return results
+
+
+ocr = OCRService()
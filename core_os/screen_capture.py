@@ -0,0 +1,243 @@
+"""
+screen_capture.py — in-process screen grabs with a shared ring buffer of recent frames.
+
+Replaces the gnome-screenshot / ImageMagick round trips: the display is read
+in-process (mss, falling back to Pillow's ImageGrab), kept as an in-memory
+image, and cropped, resized and encoded without touching disk. The external
+tools remain the last resort when neither backend can open the display.
+
+    from core_os.screen_capture import screen
+    frame = screen.grab()                    # reuses a frame younger than FRESH_MS
+    b64 = frame.b64(scale=0.5)               # in-memory resize + PNG encode
+    pixels = frame.array()                   # numpy array, no encode at all
+
+Concurrent callers share one capture: while a grab is in flight the others
+wait for it instead of starting their own.
+
+Config (env):
+    SCREEN_BACKEND   auto | mss | pil | external (default auto)
+    SCREEN_FRESH_MS  age under which a buffered frame is reused (default 250)
+    SCREEN_RING      frames kept in the ring buffer (default 8)
+"""
+
+import base64
+import io
+import os
+import subprocess
+import tempfile
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core_os.lazy import lazy_module
+
+BACKEND = os.getenv("SCREEN_BACKEND", "auto")
+FRESH_MS = float(os.getenv("SCREEN_FRESH_MS", "250"))
+RING_SIZE = int(os.getenv("SCREEN_RING", "8"))
+
+_Image = lazy_module("PIL.Image")
+_np = lazy_module("numpy")
+
+
+class Frame:
+    """One captured screen image (PIL, RGB) with its capture time."""
+
+    __slots__ = ("image", "timestamp", "seq", "backend", "capture_ms")
+
+    def __init__(self, image, seq: int, backend: str, capture_ms: float):
+        self.image = image
+        self.timestamp = time.time()
+        self.seq = seq
+        self.backend = backend
+        self.capture_ms = capture_ms
+
+    @property
+    def size(self) -> Tuple[int, int]:
+        return tuple(self.image.size)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.timestamp
+
+    def view(self, scale: float = 1.0, region: Optional[Tuple[int, int, int, int]] = None):
+        """The image cropped to region=(x, y, w, h) and scaled; the frame itself is untouched."""
+        image = self.image
+        if region:
+            x, y, w, h = region
+            image = image.crop((x, y, x + w, y + h))
+        if 0 < scale < 1.0:
+            width, height = image.size
+            image = image.resize((max(1, int(width * scale)), max(1, int(height * scale))))
+        return image
+
+    def encode(self, fmt: str = "PNG", scale: float = 1.0, region=None, quality: int = 85) -> bytes:
+        image = self.view(scale, region)
+        buf = io.BytesIO()
+        if fmt.upper() in ("JPEG", "JPG"):
+            image.convert("RGB").save(buf, format="JPEG", quality=quality)
+        else:
+            image.save(buf, format="PNG", compress_level=1)   # speed over size; still lossless
+        return buf.getvalue()
+
+    def b64(self, scale: float = 1.0, region=None, fmt: str = "PNG") -> str:
+        return base64.b64encode(self.encode(fmt, scale, region)).decode()
+
+    def array(self, scale: float = 1.0, region=None):
+        np = _np.get()
+        if np is None:
+            raise RuntimeError("numpy unavailable")
+        return np.asarray(self.view(scale, region))
+
+    def save(self, path: str):
+        self.image.save(path, format="PNG", compress_level=1)
+
+
+# ---------------------------------------------------------------------------
+# Backends — each returns a PIL RGB image or raises
+# ---------------------------------------------------------------------------
+
+def _display_env() -> dict:
+    return {**os.environ, "DISPLAY": os.getenv("DISPLAY", ":0.0")}
+
+
+class _MSSBackend:
+    name = "mss"
+
+    def __init__(self):
+        self._local = threading.local()   # mss handles are per-thread
+
+    def __call__(self):
+        Image = _Image.get()
+        sct = getattr(self._local, "sct", None)
+        if sct is None:
+            import mss
+            os.environ.setdefault("DISPLAY", ":0.0")
+            sct = self._local.sct = mss.mss()
+        shot = sct.grab(sct.monitors[0])
+        return Image.frombytes("RGB", shot.size, shot.bgra, "raw", "BGRX")
+
+
+def _grab_pil():
+    from PIL import ImageGrab
+    return ImageGrab.grab(xdisplay=os.getenv("DISPLAY", ":0.0")).convert("RGB")
+
+
+_grab_pil.name = "pil"
+
+
+def _grab_external():
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as handle:
+        path = handle.name
+    try:
+        try:
+            subprocess.run(["gnome-screenshot", "-f", path], timeout=5, check=True,
+                           env=_display_env(), capture_output=True)
+        except Exception:
+            subprocess.run(["import", "-window", "root", path], timeout=5, check=True,
+                           env=_display_env(), capture_output=True)
+        with _Image.get().open(path) as image:
+            return image.convert("RGB")
+    finally:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+_grab_external.name = "external"
+
+
+def _name(backend) -> str:
+    return getattr(backend, "name", None) or getattr(backend, "__name__", repr(backend))
+
+
+def _backends(choice: str) -> List[Callable]:
+    available = {"mss": _MSSBackend(), "pil": _grab_pil, "external": _grab_external}
+    if choice in available:
+        return [available[choice]]
+    return list(available.values())
+
+
+# ---------------------------------------------------------------------------
+# Capture + ring buffer
+# ---------------------------------------------------------------------------
+
+class ScreenCapture:
+    def __init__(self, backends: Optional[List[Callable]] = None, fresh_ms: float = FRESH_MS,
+                 ring_size: int = RING_SIZE):
+        self._backends = backends if backends is not None else _backends(BACKEND)
+        self.fresh_ms = fresh_ms
+        self._ring: deque = deque(maxlen=ring_size)
+        self._ring_lock = threading.Lock()
+        self._grab_lock = threading.Lock()   # single-flight: one capture at a time
+        self._seq = 0
+        self._failed: Dict[str, str] = {}
+        self.stats = {"captures": 0, "reused": 0, "failures": 0, "capture_ms_total": 0.0}
+
+    def latest(self) -> Optional[Frame]:
+        with self._ring_lock:
+            return self._ring[-1] if self._ring else None
+
+    def recent(self, max_age: Optional[float] = None) -> List[Frame]:
+        """Buffered frames, oldest first, optionally only those younger than max_age seconds."""
+        with self._ring_lock:
+            frames = list(self._ring)
+        return [f for f in frames if max_age is None or f.age <= max_age]
+
+    def grab(self, max_age_ms: Optional[float] = None) -> Optional[Frame]:
+        """A frame no older than max_age_ms (default FRESH_MS); captures only when none is fresh enough."""
+        limit = (self.fresh_ms if max_age_ms is None else max_age_ms) / 1000.0
+        frame = self._fresh(limit)
+        if frame is not None:
+            return frame
+        with self._grab_lock:
+            # Another caller may have captured while we waited
+            frame = self._fresh(limit)
+            if frame is not None:
+                return frame
+            return self._capture()
+
+    def status(self) -> dict:
+        latest = self.latest()
+        captures = self.stats["captures"]
+        return {
+            "backends": [_name(b) for b in self._backends],
+            "failed_backends": dict(self._failed),
+            "buffered": len(self._ring),
+            "latest_age_ms": round(latest.age * 1000, 1) if latest else None,
+            "latest_backend": latest.backend if latest else None,
+            "mean_capture_ms": round(self.stats["capture_ms_total"] / captures, 2) if captures else None,
+            **{k: v for k, v in self.stats.items() if k != "capture_ms_total"},
+        }
+
+    def _fresh(self, limit: float) -> Optional[Frame]:
+        frame = self.latest()
+        if frame is not None and frame.age <= limit:
+            self.stats["reused"] += 1
+            return frame
+        return None
+
+    def _capture(self) -> Optional[Frame]:
+        for backend in list(self._backends):
+            name = _name(backend)
+            started = time.perf_counter()
+            try:
+                image = backend()
+            except Exception as e:
+                self._failed[name] = f"{type(e).__name__}: {e}"
+                continue
+            elapsed = (time.perf_counter() - started) * 1000
+            self._failed.pop(name, None)
+            self._seq += 1
+            frame = Frame(image, self._seq, name, round(elapsed, 2))
+            with self._ring_lock:
+                self._ring.append(frame)
+            self.stats["captures"] += 1
+            self.stats["capture_ms_total"] += elapsed
+            return frame
+        self.stats["failures"] += 1
+        return None
+
+
+screen = ScreenCapture()
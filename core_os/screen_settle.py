@@ -0,0 +1,142 @@
+"""
+screen_settle.py — wait for the screen to react and settle, measured by frame difference.
+
+The computer-use agent used to sleep a fixed STEP_DELAY after every action.
+That was too long when a click redraws instantly and too short when a window
+takes a second to open. ScreenSettler polls cheap in-process grabs instead,
+and compares 32x32 difference hashes of the frames:
+
+    settler = ScreenSettler()
+    before = settler.snapshot()
+    execute_action(...)
+    result = settler.wait(baseline=before.signature)
+    result.changed, result.settled, result.waited_ms, result.frame
+
+wait() first waits up to CHANGE_TIMEOUT for the frame to differ from the
+baseline; an action may take a moment to have any visible effect. Once it
+differs, wait() waits until STABLE_FRAMES consecutive polls agree. MAX_WAIT
+bounds the whole thing, so a blinking cursor or a video cannot stall a step.
+
+The hashes only time the wait. They cannot tell whether two frames show the
+same thing: typing "ls" into a dark 1080p terminal moves a 32x32 dhash by
+0 bits. Callers that need identity compare frame_digest(), an exact hash of
+the frame's pixels.
+
+Without Pillow no signature can be computed; wait() then sleeps `fallback`
+seconds, as the agent did before.
+
+Config (env):
+    SETTLE_POLL_MS         interval between polls (default 100)
+    SETTLE_STABLE_FRAMES   consecutive matching polls that count as settled (default 2)
+    SETTLE_CHANGE_TIMEOUT  seconds to wait for an action to show any effect (default 1.0)
+    SETTLE_MAX_WAIT        hard cap on one wait() in seconds (default 3.0)
+    SETTLE_TOLERANCE       hash bits two frames may differ by and still match (default 2)
+"""
+
+import os
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from core_os.ocr_cache import dhash, hamming, tile_digest
+
+POLL = float(os.getenv("SETTLE_POLL_MS", "100")) / 1000.0
+STABLE_FRAMES = int(os.getenv("SETTLE_STABLE_FRAMES", "2"))
+CHANGE_TIMEOUT = float(os.getenv("SETTLE_CHANGE_TIMEOUT", "1.0"))
+MAX_WAIT = float(os.getenv("SETTLE_MAX_WAIT", "3.0"))
+TOLERANCE = int(os.getenv("SETTLE_TOLERANCE", "2"))
+HASH_SIZE = 32              # 1024 bits: a few typed characters still flip some of them
+
+
+def _fresh_grab():
+    from core_os.screen_capture import screen
+    return screen.grab(max_age_ms=0)      # always a new capture, never the buffered frame
+
+
+def frame_signature(frame) -> Optional[int]:
+    """Difference hash of a screen_capture Frame, None when it cannot be computed."""
+    if frame is None:
+        return None
+    try:
+        return dhash(frame.image, size=HASH_SIZE)
+    except Exception:
+        return None
+
+
+def frame_digest(frame) -> Optional[bytes]:
+    """Exact content hash of a screen_capture Frame, None when it cannot be computed."""
+    if frame is None:
+        return None
+    try:
+        return tile_digest(frame.image)
+    except Exception:
+        return None
+
+
+class SettleResult(NamedTuple):
+    frame: Any
+    signature: Optional[int]
+    changed: bool       # differs from the baseline (True when there was no baseline to compare)
+    settled: bool       # consecutive polls agreed before MAX_WAIT
+    waited_ms: float
+
+
+class ScreenSettler:
+    def __init__(self, grab: Optional[Callable[[], Any]] = None,
+                 signature: Callable[[Any], Optional[int]] = frame_signature,
+                 poll: float = POLL, stable_frames: int = STABLE_FRAMES,
+                 change_timeout: float = CHANGE_TIMEOUT, max_wait: float = MAX_WAIT,
+                 tolerance: int = TOLERANCE, fallback: float = 0.6,
+                 clock: Callable[[], float] = time.monotonic, sleep: Callable[[float], None] = time.sleep):
+        if grab is None:
+            grab = _fresh_grab
+        self._grab = grab
+        self._signature = signature
+        self.poll = poll
+        self.stable_frames = max(1, stable_frames)
+        self.change_timeout = change_timeout
+        self.max_wait = max_wait
+        self.tolerance = tolerance
+        self.fallback = fallback
+        self._clock = clock
+        self._sleep = sleep
+
+    def same(self, a: Optional[int], b: Optional[int]) -> bool:
+        return a is not None and b is not None and hamming(a, b) <= self.tolerance
+
+    def snapshot(self) -> SettleResult:
+        """One capture, no waiting."""
+        frame = self._grab()
+        return SettleResult(frame, self._signature(frame), True, False, 0.0)
+
+    def wait(self, baseline: Optional[int] = None, change_timeout: Optional[float] = None,
+             max_wait: Optional[float] = None) -> SettleResult:
+        """Wait until the screen has changed from `baseline` (if given) and then stopped changing."""
+        change_timeout = self.change_timeout if change_timeout is None else change_timeout
+        max_wait = self.max_wait if max_wait is None else max_wait
+        started = self._clock()
+        changed = baseline is None
+        previous, stable = None, 0
+        while True:
+            frame = self._grab()
+            sig = self._signature(frame)
+            elapsed = self._clock() - started
+            if sig is None:
+                self._sleep(self.fallback)
+                return SettleResult(frame, None, True, False, (self._clock() - started) * 1000)
+
+            if not changed:
+                if not self.same(sig, baseline):
+                    changed, previous, stable = True, sig, 0
+                elif elapsed >= change_timeout:
+                    # No visible effect; the screen is as settled as it was before
+                    return SettleResult(frame, sig, False, True, elapsed * 1000)
+            elif self.same(sig, previous):
+                stable += 1
+                if stable >= self.stable_frames:
+                    return SettleResult(frame, sig, True, True, elapsed * 1000)
+            else:
+                previous, stable = sig, 0
+
+            if elapsed >= max_wait:
+                return SettleResult(frame, sig, changed, False, elapsed * 1000)
+            self._sleep(self.poll)
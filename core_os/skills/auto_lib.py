@@ -1,6 +1,5 @@
 import os
 import requests
-import json
 import base64
 import time
 from dotenv import load_dotenv
@@ -548,10 +547,8 @@ def recall_memory(key: str):
 def create_entity(name: str, entity_type: str, observation: str):
     """Creates a new entity in the knowledge graph with an initial observation."""
     try:
-        from core_os.memory.agent_memory import memory
-        key = f"kg:entity:{name}"
-        data = {"type": entity_type, "observations": [observation]}
-        memory.remember(key, json.dumps(data))
+        from core_os.memory.graph_store import get_graph
+        get_graph().add_entity(name, entity_type, observation)
         return f"Entity '{name}' created."
     except Exception as e:
         return f"KG Error: {e}"
@@ -559,13 +556,9 @@ def create_entity(name: str, entity_type: str, observation: str):
 def add_observation(entity_name: str, observation: str):
     """Adds a new observation to an existing entity."""
     try:
-        from core_os.memory.agent_memory import memory
-        key = f"kg:entity:{entity_name}"
-        res = memory.recall(key)
-        if res == "None.": return f"Entity '{entity_name}' not found."
-        data = json.loads(res)
-        data["observations"].append(observation)
-        memory.remember(key, json.dumps(data))
+        from core_os.memory.graph_store import get_graph
+        if not get_graph().add_observation(entity_name, observation):
+            return f"Entity '{entity_name}' not found."
         return f"Observation added to '{entity_name}'."
     except Exception as e:
         return f"KG Error: {e}"
@@ -573,13 +566,30 @@ def add_observation(entity_name: str, observation: str):
 def create_relation(source: str, relation: str, target: str):
     """Creates a relation between two entities (e.g., 'Dray' 'owns' 'Milla')."""
     try:
-        from core_os.memory.agent_memory import memory
-        key = f"kg:relation:{source}:{relation}:{target}"
-        memory.remember(key, "exists")
+        from core_os.memory.graph_store import get_graph
+        get_graph().add_relation(source, relation, target)
         return f"Relation created: {source} --({relation})--> {target}"
     except Exception as e:
         return f"KG Error: {e}"
 
+def query_graph(entity_name: str, depth: int = 1, relation: Optional[str] = None, direction: str = "both"):
+    """Describes an entity and everything reachable from it within `depth` hops."""
+    try:
+        from core_os.memory.graph_store import get_graph
+        graph = get_graph()
+        entity = graph.get_entity(entity_name)
+        if not entity:
+            return f"Entity '{entity_name}' not found."
+        lines = [f"{entity_name} [{entity['type'] or 'untyped'}]"]
+        lines += [f"  - {o}" for o in entity["observations"][-10:]]
+        for hit in graph.traverse(entity_name, max_depth=max(1, min(int(depth), 4)),
+                                  relation=relation, direction=direction, limit=50):
+            arrow = f"--({hit['relation']})-->" if hit["direction"] == "out" else f"<--({hit['relation']})--"
+            lines.append(f"{'  ' * hit['depth']}{arrow} {hit['name']} [{hit['type'] or 'untyped'}]")
+        return "\n".join(lines)
+    except Exception as e:
+        return f"KG Error: {e}"
+
 def fetch_recent_files(limit: int = 10) -> List[Dict[str, Any]]:
     try:
         service = get_drive_service()
@@ -616,6 +626,7 @@ __all__ = [
     "create_entity",
     "add_observation",
     "create_relation",
+    "query_graph",
     "get_drive_service",
     "fetch_recent_files",
     "upload_file_to_drive"
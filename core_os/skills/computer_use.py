@@ -4,9 +4,11 @@ Exposes atomic actions: screenshot, click, type, key, scroll, drag,
 browser_goto, browser_click, browser_fill, browser_text, shell.
 """
 from __future__ import annotations
-import base64, os, subprocess, tempfile, time
+import base64, os, subprocess, time
 from typing import Any
 
+from core_os.screen_capture import screen
+
 import pyautogui
 
 pyautogui.FAILSAFE = True   # move mouse to corner to abort
@@ -45,36 +47,15 @@ def close_browser():
 
 
 # ── Screenshot util ───────────────────────────────────────────────────────────
-def take_screenshot(scale: float = 0.5) -> str:
-    """Return a base64 PNG screenshot, downscaled for vision API efficiency."""
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        path = f.name
-    try:
-        subprocess.run(
-            ["gnome-screenshot", "-f", path],
-            timeout=5, check=True,
-            env={**os.environ, "DISPLAY": os.getenv("DISPLAY", ":0.0")}
-        )
-    except Exception:
-        # fallback to ImageMagick import
-        subprocess.run(["import", "-window", "root", path], timeout=5, check=True,
-                       env={**os.environ, "DISPLAY": os.getenv("DISPLAY", ":0.0")})
-
-    # downscale with ImageMagick for smaller payload
-    if scale < 1.0:
-        scaled = path.replace(".png", "_s.png")
-        subprocess.run(
-            ["convert", path, "-resize", f"{int(scale*100)}%", scaled],
-            timeout=5
-        )
-        if os.path.exists(scaled):
-            os.unlink(path)
-            path = scaled
-
-    with open(path, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode()
-    os.unlink(path)
-    return b64
+def take_screenshot(scale: float = 0.5, max_age_ms: float = 0) -> str:
+    """Return a base64 PNG screenshot, downscaled for vision API efficiency.
+
+    Captures a new frame by default: a buffered one may predate the last action.
+    """
+    frame = screen.grab(max_age_ms=max_age_ms)
+    if frame is None:
+        raise RuntimeError("screen capture unavailable")
+    return frame.b64(scale=scale)
 
 
 # ── Action executor ───────────────────────────────────────────────────────────
@@ -3,14 +3,20 @@ computer_use_agent.py — Grok-4 vision agentic loop for computer control.
 Yields SSE-compatible dicts for each step.
 """
 from __future__ import annotations
-import json, time
+import json
 from typing import Generator, Any
 
+from core_os.screen_settle import ScreenSettler, frame_digest
 from core_os.skills.auto_lib import UnifiedModelManager
 from core_os.skills.computer_use import take_screenshot, execute_action
 
 MAX_STEPS  = 20
-STEP_DELAY = 0.6  # seconds between screenshot and next action
+STEP_DELAY = 0.6  # fallback settle time when frames cannot be compared (no Pillow)
+IDLE_WAIT  = 5.0  # after a passive action, how long to wait for the screen to change before re-asking
+
+# Actions that do not change the screen themselves; re-asking the model about
+# an identical frame right after one of these only repeats the last decision.
+PASSIVE_ACTIONS = {"wait", "move", "screenshot"}
 
 SYSTEM_PROMPT = """You are Milla's Computer Use module. You control a Linux desktop.
 You receive a screenshot and must decide ONE action to take toward the user's goal.
@@ -44,19 +50,42 @@ Rules:
 def run_agent(task: str, max_steps: int = MAX_STEPS) -> Generator[dict[str, Any], None, None]:
     """
     Generator — yields step dicts for SSE streaming:
-    {"step": int, "action": str, "reasoning": str, "result": str, "screenshot": b64}
-    On completion: {"step": n, "action": "done", "result": str, "done": true}
+    {"step": int, "action": str, "reasoning": str, "result": str, "screenshot": b64,
+     "screen_changed": bool, "settle_ms": float}
+    On completion: {"step": n, "action": "done", "result": str, "done": true, "stats": {...}}
     On error:      {"error": str}
     """
     model_manager = UnifiedModelManager()
     history: list[dict] = []
+    settler = ScreenSettler(fallback=STEP_DELAY)
+    stats = {"model_calls": 0, "gated_steps": 0, "settle_ms": 0.0}
+    last_action = None
+    asked_sig = None     # dhash of the frame the model last saw; times the settle waits only
+    asked_digest = None  # exact content hash of that frame; decides whether it is the same frame
+    asked_b64 = ""
 
     yield {"step": 0, "action": "start", "reasoning": f"Starting task: {task}", "result": "", "screenshot": ""}
 
+    screen_now = settler.wait()   # let whatever launched the task finish drawing
+
     for step in range(1, max_steps + 1):
         try:
-            # 1. Screenshot
-            b64 = take_screenshot(scale=0.5)
+            # 1. Screenshot — after a passive action, hold the model call until the frame changes
+            digest = frame_digest(screen_now.frame)
+            passive = last_action in PASSIVE_ACTIONS
+            if passive and digest is not None and digest == asked_digest:
+                stats["gated_steps"] += 1
+                screen_now = settler.wait(baseline=asked_sig, change_timeout=IDLE_WAIT,
+                                          max_wait=IDLE_WAIT + settler.max_wait)
+                stats["settle_ms"] += screen_now.waited_ms
+                digest = frame_digest(screen_now.frame)
+            if screen_now.frame is None:
+                b64 = take_screenshot(scale=0.5)
+            elif passive and digest is not None and digest == asked_digest and asked_b64:
+                b64 = asked_b64    # byte-identical frame; skip the resize + encode
+            else:
+                b64 = screen_now.frame.b64(scale=0.5)
+            asked_sig, asked_digest, asked_b64 = screen_now.signature, digest, b64
 
             # 2. Build vision message
             messages = [
@@ -83,6 +112,7 @@ def run_agent(task: str, max_steps: int = MAX_STEPS) -> Generator[dict[str, Any]
             ]
 
             # 3. Call vision model
+            stats["model_calls"] += 1
             try:
                 client = model_manager._get_client()
                 resp   = client.chat.completions.create(
@@ -111,11 +141,17 @@ def run_agent(task: str, max_steps: int = MAX_STEPS) -> Generator[dict[str, Any]
             reasoning = action_dict.get("reasoning", "")
             action_name = action_dict.get("action", "unknown")
 
-            # 5. Execute action
+            # 5. Execute action, then wait for the screen to react and settle
             try:
                 result = execute_action(action_dict)
             except Exception as e:
                 result = f"execution error: {e}"
+            last_action = action_name
+            changed, settle_ms = False, 0.0
+            if action_name != "done":
+                screen_now = settler.wait(baseline=asked_sig)
+                changed, settle_ms = screen_now.changed, screen_now.waited_ms
+                stats["settle_ms"] += settle_ms
 
             # 6. Add to history for context
             history.append({"role": "assistant", "content": raw})
@@ -131,19 +167,20 @@ def run_agent(task: str, max_steps: int = MAX_STEPS) -> Generator[dict[str, Any]
                 "reasoning":  reasoning,
                 "result":     result,
                 "screenshot": b64,
+                "screen_changed": changed,
+                "settle_ms":  round(settle_ms, 1),
             }
 
             # 7. Done?
             if action_name == "done":
-                yield {"step": step, "action": "done", "result": result, "done": True, "screenshot": b64}
+                yield {"step": step, "action": "done", "result": result, "done": True, "screenshot": b64,
+                       "stats": _round_stats(stats)}
                 return
 
             # 8. Keep history bounded
             if len(history) > 20:
                 history = history[-20:]
 
-            time.sleep(STEP_DELAY)
-
         except Exception as e:
             yield {"error": f"Agent step {step} error: {e}"}
             return
@@ -153,5 +190,10 @@ def run_agent(task: str, max_steps: int = MAX_STEPS) -> Generator[dict[str, Any]
         "action": "timeout",
         "result": f"Reached max steps ({max_steps}) without completing task.",
         "done": True,
-        "screenshot": ""
+        "screenshot": "",
+        "stats": _round_stats(stats),
     }
+
+
+def _round_stats(stats: dict) -> dict:
+    return {**stats, "settle_ms": round(stats["settle_ms"], 1)}
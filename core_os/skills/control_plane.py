@@ -3,7 +3,6 @@ from __future__ import annotations
 import json
 import os
 import shutil
-import subprocess
 import tempfile
 from pathlib import Path
 from typing import Any, Literal
@@ -15,23 +14,20 @@ try:
 except Exception:
     FastMCP = None
 
-try:
-    import easyocr
-except Exception:
-    easyocr = None
-
 try:
     from PIL import Image
 except Exception:
     Image = None
 
+from core_os.ocr_cache import ocr_cache
+from core_os.ocr_service import ocr
+from core_os.screen_capture import screen
 from core_os.skills.milla_vision import analyze_visuals
+from core_os.vision_fanout import VisionTask, fan_out
 
 VisionProfile = Literal["bitvla", "vlm-3r", "v2drop"]
 AgentRole = Literal["Milla-System-Admin", "Milla-Coder"]
 
-_OCR_READER = None
-
 
 class FocusRegion(BaseModel):
     label: str
@@ -109,41 +105,16 @@ class AgentHandoffResult(BaseModel):
     final_summary: str
 
 
-def _get_ocr_reader():
-    global _OCR_READER
-    if _OCR_READER is None and easyocr is not None:
-        _OCR_READER = easyocr.Reader(["en"], gpu=False, verbose=False)
-    return _OCR_READER
-
-
-def _capture_display_frame() -> str | None:
+def _capture_display_frame(max_age_ms: float | None = None) -> str | None:
+    """Saves the screen to a temp PNG; max_age_ms=0 forces a new capture."""
     with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as handle:
         path = handle.name
 
-    env = {**os.environ, "DISPLAY": os.getenv("DISPLAY", ":0.0")}
-    try:
-        subprocess.run(
-            ["gnome-screenshot", "-f", path],
-            timeout=5,
-            check=True,
-            env=env,
-            capture_output=True,
-            text=True,
-        )
-        return path
-    except Exception:
-        pass
-
     try:
-        subprocess.run(
-            ["import", "-window", "root", path],
-            timeout=5,
-            check=True,
-            env=env,
-            capture_output=True,
-            text=True,
-        )
-        return path
+        frame = screen.grab(max_age_ms=max_age_ms)
+        if frame is not None:
+            frame.save(path)
+            return path
     except Exception:
         pass
 
@@ -217,10 +188,9 @@ def _collect_focus_regions(
     ocr_text = ""
 
     if include_ocr and image_path:
-        reader = _get_ocr_reader()
-        if reader is not None:
+        if ocr.installed:
             try:
-                raw_results = reader.readtext(image_path, detail=1)
+                raw_results = ocr_cache.readtext(image_path, stream="desktop")
                 text_lines = []
                 for bbox, text, confidence in raw_results[:60]:
                     text_lines.append(text)
@@ -299,21 +269,35 @@ def _crop_focus_regions(image_path: str, regions: list[FocusRegion], limit: int
     return crops
 
 
-def build_desktop_context(request: DesktopContextRequest) -> DesktopContextSnapshot:
-    screenshot_path = _capture_display_frame()
+def _remove_crop(task: VisionTask) -> None:
+    if task.key == "screen":
+        return
+    try:
+        os.unlink(task.image_path)
+    except OSError:
+        pass
+
+
+def build_desktop_context(request: DesktopContextRequest, max_age_ms: float | None = None) -> DesktopContextSnapshot:
+    # Passive snapshots may reuse a frame buffered in the last FRESH_MS; callers
+    # that just changed the screen pass max_age_ms=0
+    screenshot_path = _capture_display_frame(max_age_ms)
     image_size = _get_image_size(screenshot_path)
     focus_regions, ocr_text = _collect_focus_regions(screenshot_path, image_size, request.include_ocr)
     terminal_log_excerpt = _read_terminal_excerpt(request.terminal_log_path, request.tail_lines)
 
+    vision_metadata: dict[str, Any] = {}
     if screenshot_path:
-        summary_parts = [
-            analyze_visuals(screenshot_path, _profile_prompt(request.prompt, request.vision_profile))
-        ]
+        tasks = [VisionTask("screen", screenshot_path, _profile_prompt(request.prompt, request.vision_profile))]
+        # Keyed by position: two regions may carry the same label (two "OK" buttons)
+        focus_labels: dict[str, str] = {}
         if request.use_focus_regions and focus_regions:
-            focus_crops = _crop_focus_regions(screenshot_path, focus_regions)
-            try:
-                for region, crop_path in focus_crops:
-                    crop_summary = analyze_visuals(
+            for i, (region, crop_path) in enumerate(_crop_focus_regions(screenshot_path, focus_regions)):
+                key = f"focus{i}"
+                focus_labels[key] = region.label
+                tasks.append(
+                    VisionTask(
+                        key,
                         crop_path,
                         _profile_prompt(
                             f"{request.prompt}\nFocus region: {region.label} at "
@@ -321,13 +305,20 @@ def build_desktop_context(request: DesktopContextRequest) -> DesktopContextSnaps
                             "v2drop" if request.vision_profile != "bitvla" else request.vision_profile,
                         ),
                     )
-                    summary_parts.append(f"[Focus:{region.label}] {crop_summary}")
-            finally:
-                for _, crop_path in focus_crops:
-                    try:
-                        os.unlink(crop_path)
-                    except OSError:
-                        pass
+                )
+        fanout = fan_out(tasks, analyze_visuals, cleanup=_remove_crop)
+        vision_metadata = fanout.as_metadata()
+        summary_parts = []
+        for task in tasks:
+            text = fanout.results.get(task.key)
+            if not text:
+                continue
+            if task.key == "screen":
+                summary_parts.append(text)
+            else:
+                summary_parts.append(f"[Focus:{focus_labels[task.key]}] {text}")
+        if fanout.timed_out:
+            summary_parts.append(f"[Partial: {len(fanout.timed_out)} vision call(s) exceeded the deadline]")
         visual_summary = "\n\n".join(part for part in summary_parts if part)
     else:
         visual_summary = "Desktop capture unavailable."
@@ -345,8 +336,9 @@ def build_desktop_context(request: DesktopContextRequest) -> DesktopContextSnaps
             "vision_profile": request.vision_profile,
             "focus_region_count": len(focus_regions),
             "ocr_enabled": request.include_ocr,
-            "ocr_available": easyocr is not None,
+            "ocr_available": ocr.installed,
             "fastmcp_available": FastMCP is not None,
+            **vision_metadata,
         },
     )
 
@@ -379,7 +371,8 @@ def execute_terminal_with_context(request: TerminalActionRequest) -> TerminalAct
                 include_ocr=request.include_ocr,
                 terminal_log_path=request.terminal_log_path,
                 tail_lines=request.tail_lines,
-            )
+            ),
+            max_age_ms=0,
         )
 
     return TerminalActionResult(
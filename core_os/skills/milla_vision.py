@@ -1,7 +1,6 @@
 import subprocess
 import os
 import time
-import json
 import ollama
 import pickle
 import requests
@@ -14,14 +13,18 @@ try:
     import pyautogui
 except Exception:
     pyautogui = None
-from datetime import datetime
+
+from core_os.camera_manager import cameras, open_capture
+from core_os.image_prep import prepare, profile_for
+from core_os.memory.vision_history import get_vision_history
+from core_os.model_health import ModelSelector
+from core_os.vision_cache import vision_cache
 
 # ── Paths ──────────────────────────────────────────────────────────────────
 SCREENSHOT_DIR = "core_os/screenshots"
 LATEST_FRAME   = os.path.join(SCREENSHOT_DIR, "nexus_eye.jpg")
 USB_FRAME      = os.path.join(SCREENSHOT_DIR, "usb_eye.jpg")
 DOME_FRAME     = os.path.join(SCREENSHOT_DIR, "dome_eye.jpg")
-VISION_LOG     = "core_os/memory/visual_history.json"
 TABLET_IP      = os.getenv("TABLET_IP", "192.168.40.115:34213")
 USB_DEVICE_ID  = int(os.getenv("USB_CAMERA_INDEX", 0))
 
@@ -118,11 +121,8 @@ def capture_nest_frame(rtsp_url: str) -> str | None:
         print("[!] opencv-python not installed — cannot capture RTSP frame.")
         return None
     try:
-        cap = cv2.VideoCapture(rtsp_url)
-        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
-        ret, frame = cap.read()
-        cap.release()
-        if ret:
+        frame = cameras.frame(f"rtsp:{rtsp_url}", lambda: open_capture(rtsp_url))
+        if frame is not None:
             cv2.imwrite(LATEST_FRAME, frame)
             return LATEST_FRAME
         print("[!] Nest: RTSP frame capture failed (empty frame)")
@@ -132,18 +132,39 @@ def capture_nest_frame(rtsp_url: str) -> str | None:
         return None
 
 
+_nest_device = None
+
+
 def capture_nest_eye() -> str | None:
-    """High-level: find first Nest camera, get RTSP, grab frame."""
-    cameras = list_nest_cameras()
-    if not cameras:
-        print("[!] No Nest cameras found — falling back to ADB tablet.")
+    """High-level: find first Nest camera, get RTSP, grab frame.
+
+    The stream stays open in the camera manager; a fresh RTSP URL is only
+    generated when the stream is (re)opened.
+    """
+    global _nest_device
+    if cv2 is None:
+        print("[!] opencv-python not installed — cannot capture RTSP frame.")
         return None
-    device_name = cameras[0]["name"]
-    print(f"[*] Vision: Connecting to Nest camera ({device_name.split('/')[-1]})")
-    rtsp = get_nest_rtsp_url(device_name)
-    if not rtsp:
+    if _nest_device is None:
+        nest_cameras = list_nest_cameras()
+        if not nest_cameras:
+            print("[!] No Nest cameras found — falling back to ADB tablet.")
+            return None
+        _nest_device = nest_cameras[0]["name"]
+    device_name = _nest_device
+
+    def _open():
+        print(f"[*] Vision: Connecting to Nest camera ({device_name.split('/')[-1]})")
+        rtsp = get_nest_rtsp_url(device_name)
+        if not rtsp:
+            raise RuntimeError("no RTSP URL from SDM")
+        return open_capture(rtsp)
+
+    frame = cameras.frame(f"nest:{device_name}", _open)
+    if frame is None:
         return None
-    return capture_nest_frame(rtsp)
+    cv2.imwrite(LATEST_FRAME, frame)
+    return LATEST_FRAME
 
 
 # ── Existing capture sources ────────────────────────────────────────────────
@@ -195,14 +216,10 @@ def capture_usb_frame():
         # print(f"[!] Vision: {device_path} not found.")
         return None
 
-    print(f"[*] Vision: Activating local Eye ({device_path})...")
     try:
-        cap = cv2.VideoCapture(USB_DEVICE_ID)
-        # Give the sensor a moment to adjust exposure
-        time.sleep(0.5) 
-        ret, frame = cap.read()
-        cap.release()
-        if ret:
+        # The camera manager keeps the device open, so exposure has long settled
+        frame = cameras.frame(f"usb:{USB_DEVICE_ID}", lambda: open_capture(USB_DEVICE_ID))
+        if frame is not None:
             cv2.imwrite(USB_FRAME, frame)
             # Link to latest
             if os.path.exists(LATEST_FRAME): os.remove(LATEST_FRAME)
@@ -271,49 +288,74 @@ VISION_MODELS = [
     "moondream:latest",    # lightweight local last resort
 ]
 
+def _probe_vision_model(model):
+    """Cheap reachability check used to bring a failed model back into rotation."""
+    response = ollama.generate(model=model, prompt="ping", options={"num_predict": 1})
+    return response is not None
+
+
+# Remembers which models are answering so calls skip the ones in backoff
+vision_models = ModelSelector(VISION_MODELS, probe=_probe_vision_model)
+
+
 def analyze_visuals(image_path, prompt="Describe what you see in detail."):
     """
-    Analyze an image using the best available vision model.
-    Priority: qwen3.5:397b-cloud → qwen2.5vl:7b → moondream
+    Analyze an image (file path or encoded bytes) using the best available vision model.
+    Priority: qwen3.5:397b-cloud → qwen2.5vl:7b → moondream,
+    skipping models that recently failed until a background probe sees them recover.
+    The image is resized and re-encoded in memory to each model's target resolution.
     """
-    if not image_path or not os.path.exists(image_path):
+    if isinstance(image_path, (bytes, bytearray)):
+        img_bytes = bytes(image_path)
+    elif not image_path or not os.path.exists(image_path):
+        return "My eyes are closed or the view is blocked."
+    else:
+        with open(image_path, "rb") as img_file:
+            img_bytes = img_file.read()
+    if not img_bytes:
         return "My eyes are closed or the view is blocked."
 
-    with open(image_path, "rb") as img_file:
-        img_bytes = img_file.read()
+    candidates = vision_models.candidates()
+    fingerprint = vision_cache.fingerprint(img_bytes)
+    cached = vision_cache.get(candidates[0], prompt, fingerprint) if candidates else None
+    if cached is not None:
+        print(f"[*] Vision: reusing {candidates[0]} answer for a near-identical image")
+        return cached
 
-    for model in VISION_MODELS:
+    prepared = {}   # one encode per distinct model profile
+    for model in candidates:
+        started = time.perf_counter()
         try:
             print(f"[*] Vision: trying {model}...")
+            profile = profile_for(model)
+            if profile not in prepared:
+                prepared[profile] = prepare(img_bytes, model)
             response = ollama.generate(
                 model=model,
                 prompt=prompt,
-                images=[img_bytes]
+                images=[prepared[profile].data]
             )
             description = response.get("response", "").strip()
             if description:
+                vision_models.record_success(model, time.perf_counter() - started)
+                vision_cache.put(model, prompt, fingerprint, description)
                 print(f"[*] Vision: got response from {model}")
-                log_vision(description)
+                log_vision(description, source=model)
                 return description
+            vision_models.record_failure(model, "empty response")
         except Exception as e:
+            vision_models.record_failure(model, e)
             print(f"[!] Vision {model} failed: {e}")
             continue
 
     return "[!] All vision models failed — check qwen2.5vl:7b and moondream are pulled."
 
 
-def log_vision(description):
-    history = []
-    if os.path.exists(VISION_LOG):
-        try:
-            with open(VISION_LOG) as f:
-                history = json.load(f)
-        except Exception:
-            pass
-    history.append({"timestamp": datetime.now().isoformat(), "description": description})
-    with open(VISION_LOG, "w") as f:
-        json.dump(history[-100:], f, indent=2)
-
+def log_vision(description, source=None):
+    try:
+        get_vision_history().append(description, source=source)
+    except Exception as e:
+        print(f"[!] Vision: history append failed: {e}")
 
 if __name__ == "__main__":
     frame = capture_frame()
@@ -0,0 +1,118 @@
+"""
+skill_cache.py — result cache for skills that declare themselves cacheable.
+
+A skill opts in through its register() metadata:
+
+    "cacheable": True,            # required to enable caching
+    "cache_ttl": 300,             # seconds a result stays fresh (default DEFAULT_TTL)
+    "cache_key": ["query"],       # payload keys that identify a call (default: whole payload)
+
+Only successful results are stored. Entries are evicted least-recently-used
+once MAX_ENTRIES is reached, and hit/miss counts are kept per skill.
+"""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+MAX_ENTRIES = int(os.getenv("SKILL_CACHE_ENTRIES", "512"))
+DEFAULT_TTL = 300.0
+
+MISSING = object()   # get() sentinel; None is a legitimate cached result
+
+
+def cache_policy(info: dict) -> Optional[Tuple[float, Optional[list]]]:
+    """(ttl, key params) from a registry entry, or None when the skill is not cacheable."""
+    if not info.get("cacheable"):
+        return None
+    try:
+        ttl = float(info.get("cache_ttl", DEFAULT_TTL))
+    except (TypeError, ValueError):
+        ttl = DEFAULT_TTL
+    if ttl <= 0:
+        return None
+    key = info.get("cache_key")
+    return ttl, list(key) if isinstance(key, (list, tuple)) else None
+
+
+def make_key(name: str, payload: dict, key_params: Optional[list]) -> Optional[Tuple[str, str]]:
+    """Canonical cache key, or None when the payload cannot be serialized."""
+    payload = payload or {}
+    if key_params is not None:
+        payload = {k: payload.get(k) for k in key_params}
+    try:
+        return name, json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+
+
+class SkillResultCache:
+    """Thread-safe LRU of skill results with per-entry expiry."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    def _count(self, name: str, field: str):
+        per_skill = self._stats.setdefault(name, {"hits": 0, "misses": 0, "expired": 0, "evicted": 0})
+        per_skill[field] += 1
+
+    def get(self, key: Tuple[str, str]) -> Any:
+        """The cached result, or MISSING."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._count(key[0], "misses")
+                return MISSING
+            expires, result = entry
+            if expires <= now:
+                del self._entries[key]
+                self._count(key[0], "expired")
+                self._count(key[0], "misses")
+                return MISSING
+            self._entries.move_to_end(key)
+            self._count(key[0], "hits")
+            return result
+
+    def put(self, key: Tuple[str, str], result: Any, ttl: float):
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                old_key, _ = self._entries.popitem(last=False)
+                self._count(old_key[0], "evicted")
+
+    def invalidate(self, name: Optional[str] = None) -> int:
+        """Drops every entry (or every entry of one skill). Returns how many were removed."""
+        with self._lock:
+            if name is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            stale = [k for k in self._entries if k[0] == name]
+            for k in stale:
+                del self._entries[k]
+            return len(stale)
+
+    def stats(self) -> dict:
+        with self._lock:
+            skills = {}
+            for name, s in self._stats.items():
+                lookups = s["hits"] + s["misses"]
+                skills[name] = {**s, "hit_rate": round(s["hits"] / lookups, 3) if lookups else 0.0}
+            hits = sum(s["hits"] for s in self._stats.values())
+            lookups = hits + sum(s["misses"] for s in self._stats.values())
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hit_rate": round(hits / lookups, 3) if lookups else 0.0,
+                "skills": skills,
+            }
+
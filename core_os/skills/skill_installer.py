@@ -0,0 +1,179 @@
+"""
+skill_installer.py — background skill installs and a shared wheel cache.
+
+Installing a skill (download, validate, pip requirements, register) runs as a
+job on a small thread pool, so the API call that starts it returns at once and
+the client polls the job for progress. A second request for the same source
+while the first is still running joins the existing job.
+
+Requirements are built into wheels under WHEEL_CACHE once and installed from
+there with --no-index, so a dependency shared by several skills (or reinstalled
+later) never touches the network again. Concurrent installs of the same
+requirement share a single pip run.
+"""
+
+import itertools
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger("skill_manager")
+
+WHEEL_CACHE  = Path(os.getenv("SKILL_WHEEL_CACHE", Path(__file__).parent.parent / "memory" / "wheel_cache"))
+PIP_TIMEOUT  = int(os.getenv("SKILL_PIP_TIMEOUT", "600"))
+JOB_WORKERS  = 2
+KEEP_JOBS    = 100      # finished jobs kept for status queries
+
+# report(stage, progress 0..1, message)
+Reporter = Callable[[str, float, str], None]
+
+
+def _pip(args: List[str], timeout: int = PIP_TIMEOUT) -> subprocess.CompletedProcess:
+    return subprocess.run([sys.executable, "-m", "pip", *args], capture_output=True, text=True, timeout=timeout)
+
+
+# ---------------------------------------------------------------------------
+# Requirements
+# ---------------------------------------------------------------------------
+
+_dep_lock = threading.Lock()
+_dep_inflight: Dict[str, Future] = {}
+
+
+def _install_one(requirement: str) -> dict:
+    WHEEL_CACHE.mkdir(parents=True, exist_ok=True)
+    cache = str(WHEEL_CACHE)
+    # 1. Offline from the wheel cache (also succeeds when already installed)
+    result = _pip(["install", "--quiet", "--no-index", "--find-links", cache, requirement])
+    if result.returncode == 0:
+        return {"requirement": requirement, "ok": True, "source": "cache"}
+    # 2. Build wheels into the cache once, then install offline from it
+    built = _pip(["wheel", "--quiet", "--wheel-dir", cache, requirement])
+    if built.returncode == 0:
+        result = _pip(["install", "--quiet", "--no-index", "--find-links", cache, requirement])
+        if result.returncode == 0:
+            return {"requirement": requirement, "ok": True, "source": "network"}
+    # 3. Some packages cannot be wheeled (or need extra indexes); install directly
+    result = _pip(["install", "--quiet", requirement])
+    return {"requirement": requirement, "ok": result.returncode == 0, "source": "network",
+            "error": result.stderr[-300:] if result.returncode else ""}
+
+
+def install_requirement(requirement: str) -> dict:
+    """Installs one requirement, joining an install of the same requirement already under way."""
+    key = requirement.strip().lower().replace(" ", "")
+    with _dep_lock:
+        future = _dep_inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _dep_inflight[key] = Future()
+    if not owner:
+        return future.result()
+    try:
+        outcome = _install_one(requirement)
+    except Exception as e:
+        outcome = {"requirement": requirement, "ok": False, "source": "error", "error": str(e)}
+    with _dep_lock:
+        _dep_inflight.pop(key, None)
+    future.set_result(outcome)
+    return outcome
+
+
+def install_requirements(requires: List[str], report: Optional[Reporter] = None) -> List[dict]:
+    outcomes = []
+    for i, requirement in enumerate(requires):
+        if report:
+            report("installing_deps", i / max(1, len(requires)), f"Installing {requirement}")
+        outcome = install_requirement(requirement)
+        outcomes.append(outcome)
+        if not outcome["ok"]:
+            logger.warning(f"[SkillManager] pip warning for {requirement}: {outcome.get('error', '')}")
+    return outcomes
+
+
+# ---------------------------------------------------------------------------
+# Jobs
+# ---------------------------------------------------------------------------
+
+class InstallJobs:
+    """Runs skill installs in the background and keeps their status for polling."""
+
+    def __init__(self, workers: int = JOB_WORKERS):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="skill-install")
+        self._lock = threading.Lock()
+        self._jobs: Dict[str, dict] = {}
+        self._active: Dict[str, str] = {}     # source key -> job id
+        self._ids = itertools.count(1)
+
+    def submit(self, source: str, run: Callable[[Reporter], dict]) -> dict:
+        """Queues `run(report)` unless a job for the same source is already running."""
+        key = source.strip()
+        with self._lock:
+            job_id = self._active.get(key)
+            if job_id:
+                return {**self._jobs[job_id], "deduplicated": True}
+            job_id = f"install-{next(self._ids)}"
+            job = {
+                "id": job_id, "source": source, "status": "queued", "stage": "queued",
+                "progress": 0.0, "message": "", "log": [], "result": None,
+                "created": time.time(), "updated": time.time(),
+            }
+            self._jobs[job_id] = job
+            self._active[key] = job_id
+            self._trim()
+            snapshot = {**job, "log": []}
+        self._pool.submit(self._run, job_id, key, run)
+        return snapshot
+
+    def _report(self, job_id: str, stage: str, progress: float, message: str):
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(stage=stage, progress=round(max(job["progress"], progress), 3), updated=time.time())
+            if message:
+                job["message"] = message
+                job["log"].append(message)
+
+    def _run(self, job_id: str, key: str, run: Callable[[Reporter], dict]):
+        with self._lock:
+            self._jobs[job_id]["status"] = "running"
+        try:
+            result = run(lambda stage, progress, message="": self._report(job_id, stage, progress, message))
+            status = "done" if result.get("ok") else "failed"
+        except Exception as e:
+            result, status = {"ok": False, "message": str(e)}, "failed"
+        with self._lock:
+            job = self._jobs[job_id]
+            job.update(status=status, stage=status, result=result,
+                       message=result.get("message", ""), updated=time.time())
+            if status == "done":
+                job["progress"] = 1.0
+            self._active.pop(key, None)
+
+    def _trim(self):
+        finished = [j for j in self._jobs.values() if j["status"] in ("done", "failed")]
+        for job in sorted(finished, key=lambda j: j["updated"])[:max(0, len(self._jobs) - KEEP_JOBS)]:
+            del self._jobs[job["id"]]
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return {**job, "log": list(job["log"])} if job else None
+
+    def list(self) -> List[dict]:
+        with self._lock:
+            return [{k: v for k, v in job.items() if k != "log"} for job in self._jobs.values()]
+
+    def wait(self, job_id: str, timeout: float = 60.0) -> Optional[dict]:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            job = self.get(job_id)
+            if job is None or job["status"] in ("done", "failed"):
+                return job
+            time.sleep(0.05)
+        return self.get(job_id)
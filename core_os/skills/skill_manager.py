@@ -7,22 +7,47 @@ Skill contract: each skill file must expose:
   def execute(payload: dict) -> dict:  # entry point
 
 register() must return at minimum: {name, description, version}
-Optional keys: author, commands (list of /cmd triggers), requires (pip deps)
+Optional keys: author, commands (list of /cmd triggers), requires (pip deps),
+               parameters (JSON schema for the payload),
+               cacheable / cache_ttl / cache_key (see skill_cache.py),
+               isolated (False keeps it out of the worker pool), timeout (seconds)
+
+The registry doubles as the skill manifest: listing skills and building tool
+schemas read it alone, and a skill module is only imported when it first runs
+(or when the optional background prewarm gets to it).
 """
 
 import os
-import sys
+import ast
 import json
 import importlib
 import importlib.util
-import subprocess
 import re
 import logging
+import copy
+import tempfile
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
+from core_os.metrics import metrics
+from core_os.skills.skill_cache import MISSING, SkillResultCache, cache_policy, make_key
+from core_os.skills.skill_installer import InstallJobs, install_requirements
+from core_os.skills.skill_workers import get_skill_pool
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
 SKILLS_DIR   = Path(__file__).parent                     # core_os/skills/
 REGISTRY_PATH = Path(__file__).parent.parent / "memory" / "skills_registry.json"
+PREWARM       = os.getenv("SKILL_PREWARM", "1") != "0"   # import enabled skills in the background after boot
+
+# register() keys copied into the manifest entry
+MANIFEST_KEYS = ("description", "version", "author", "commands", "requires", "cacheable", "cache_ttl", "cache_key",
+                 "isolated", "timeout")
 
 logger = logging.getLogger("skill_manager")
 
@@ -31,18 +56,92 @@ logger = logging.getLogger("skill_manager")
 # Registry helpers
 # ---------------------------------------------------------------------------
 
-def _load_registry() -> dict:
-    if REGISTRY_PATH.exists():
+class _RegistryCache:
+    """In-process copy of skills_registry.json.
+
+    Reads are served from memory and revalidated with a single stat() of the
+    file, so edits made by another process (or by hand) show up on the next
+    lookup. Writes re-read the file under an exclusive lock, apply the change and
+    atomically replace the file, so concurrent writers never drop each other's
+    updates and readers never see a half-written registry.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._lock = threading.RLock()
+        self._data: dict = {}
+        self._stamp = None
+
+    def _stat(self):
         try:
-            return json.loads(REGISTRY_PATH.read_text())
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def _read(self, stamp) -> dict:
+        if stamp is None:
+            return {}
+        try:
+            data = json.loads(self.path.read_text())
         except Exception:
-            pass
-    return {}
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def get(self) -> dict:
+        """The current registry. Treat it as read-only; change it through update()."""
+        stamp = self._stat()
+        if stamp == self._stamp:
+            return self._data
+        with self._lock:
+            stamp = self._stat()
+            if stamp != self._stamp:
+                self._data, self._stamp = self._read(stamp), stamp
+            return self._data
+
+    @contextmanager
+    def update(self):
+        """Yields a fresh copy of the registry to mutate; changes are written through on exit."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.path.with_suffix(".lock"), "a") as lock_file:
+            if fcntl:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                current = self._read(self._stat())
+                reg = copy.deepcopy(current)
+                yield reg
+                if reg != current:
+                    self._write(reg)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _write(self, reg: dict):
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".skills_registry.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(reg, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.unlink(tmp)
+            raise
+        self._data, self._stamp = reg, self._stat()
+
+
+_registry = _RegistryCache(REGISTRY_PATH)
+
+
+def _load_registry() -> dict:
+    return _registry.get()
 
 
 def _save_registry(reg: dict):
-    REGISTRY_PATH.parent.mkdir(parents=True, exist_ok=True)
-    REGISTRY_PATH.write_text(json.dumps(reg, indent=2))
+    with _registry.update() as current:
+        current.clear()
+        current.update(reg)
 
 
 # ---------------------------------------------------------------------------
@@ -51,15 +150,116 @@ def _save_registry(reg: dict):
 _loaded: dict = {}
 
 
+_results = SkillResultCache()
+
+
 def _skill_path(name: str) -> Path:
     return SKILLS_DIR / f"skill_{name}.py"
 
 
+def _pool_for(info: dict):
+    """The worker pool when this skill runs isolated, None when it runs in-process."""
+    if not info.get("isolated", True):
+        return None
+    return get_skill_pool()
+
+
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+def read_manifest(path: Path) -> Optional[dict]:
+    """register()'s metadata read straight from the source, without importing it.
+
+    Only works when register() returns a literal dict (every bundled skill does);
+    returns None otherwise.
+    """
+    try:
+        return _parse_manifest(Path(path).read_text(encoding="utf-8"))
+    except OSError:
+        return None
+
+
+def _parse_manifest(source: str) -> Optional[dict]:
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return None
+    for node in tree.body:
+        if isinstance(node, ast.FunctionDef) and node.name == "register":
+            for stmt in node.body:
+                if isinstance(stmt, ast.Return) and stmt.value is not None:
+                    try:
+                        meta = ast.literal_eval(stmt.value)
+                    except ValueError:
+                        return None
+                    return meta if isinstance(meta, dict) else None
+    return None
+
+
+def _manifest_fields(meta: dict, path: Path) -> dict:
+    fields = {key: meta[key] for key in MANIFEST_KEYS if key in meta}
+    schema = meta.get("parameters") or meta.get("schema")
+    if isinstance(schema, dict):
+        fields["schema"] = schema
+    try:
+        fields["source_mtime"] = path.stat().st_mtime_ns
+    except OSError:
+        pass
+    return fields
+
+
+def refresh_manifests() -> int:
+    """Re-reads the manifest of any skill whose file changed since it was recorded."""
+    stale = [
+        name for name, info in _load_registry().items()
+        if _skill_path(name).exists() and _skill_path(name).stat().st_mtime_ns != info.get("source_mtime")
+    ]
+    if not stale:
+        return 0
+    with _registry.update() as reg:
+        for name in stale:
+            if name not in reg:
+                continue
+            path = _skill_path(name)
+            meta = read_manifest(path)
+            reg[name].update(_manifest_fields(meta or {}, path))
+    for name in stale:
+        _results.invalidate(name)
+    return len(stale)
+
+
+def skill_tool_schema() -> dict:
+    """The run_skill tool definition, generated from the manifest (no skill imports)."""
+    skills = {name: info for name, info in _load_registry().items() if info.get("enabled", True)}
+    entries = []
+    for name, info in sorted(skills.items()):
+        params = ", ".join((info.get("schema") or {}).get("properties", {}))
+        entries.append(f"{name}({params}): {info.get('description', '')}")
+    listing = "; ".join(entries)
+    return {
+        "type": "function",
+        "function": {
+            "name": "run_skill",
+            "description": "Execute an installed Nexus skill plugin" + (f". Available: {listing}" if listing else ""),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "skill_name": {"type": "string", "description": "The skill name (e.g. daily_quote)",
+                                   **({"enum": sorted(skills)} if skills else {})},
+                    "payload": {"type": "object", "description": "Arguments for the skill"},
+                },
+                "required": ["skill_name"],
+            },
+        },
+    }
+
+
 # ---------------------------------------------------------------------------
 # Install
 # ---------------------------------------------------------------------------
 
-def install_from_github(url: str) -> dict:
+def install_from_github(url: str, report=None) -> dict:
     """
     Accepts:
       - Full raw URL:  https://raw.githubusercontent.com/user/repo/main/skill_thing.py
@@ -67,6 +267,8 @@ def install_from_github(url: str) -> dict:
       - Short form:    user/repo/path/to/skill.py
     Returns: {"ok": bool, "name": str, "message": str}
     """
+    if report:
+        report("downloading", 0.05, f"Fetching {url}")
     raw_url = _resolve_raw_url(url)
     if not raw_url:
         return {"ok": False, "name": "", "message": f"Cannot resolve raw URL from: {url}"}
@@ -79,31 +281,57 @@ def install_from_github(url: str) -> dict:
     except Exception as e:
         return {"ok": False, "name": "", "message": f"Download failed: {e}"}
 
-    return _install_from_source(source, origin=raw_url)
+    return _install_from_source(source, origin=raw_url, report=report)
 
 
-def install_from_local(file_path: str) -> dict:
+def install_from_local(file_path: str, report=None) -> dict:
     """Install a skill from a local .py file path."""
     p = Path(file_path)
     if not p.exists():
         return {"ok": False, "name": "", "message": f"File not found: {file_path}"}
-    return _install_from_source(p.read_text(encoding="utf-8"), origin=file_path)
+    return _install_from_source(p.read_text(encoding="utf-8"), origin=file_path, report=report)
+
+
+_install_jobs = InstallJobs()
+
+
+def install_async(source: str) -> dict:
+    """Starts installing from a GitHub URL or local path in the background.
 
+    Returns the job straight away; poll install_job(job["id"]) for progress.
+    A request for a source that is already being installed returns that job.
+    """
+    if Path(source).is_file():
+        return _install_jobs.submit(source, lambda report: install_from_local(source, report=report))
+    return _install_jobs.submit(source, lambda report: install_from_github(source, report=report))
+
+
+def install_job(job_id: str) -> Optional[dict]:
+    return _install_jobs.get(job_id)
+
+
+def list_install_jobs() -> list:
+    return _install_jobs.list()
 
-def _install_from_source(source: str, origin: str) -> dict:
+
+def _install_from_source(source: str, origin: str, report=None) -> dict:
+    report = report or (lambda stage, progress, message="": None)
+    report("validating", 0.1, "Validating skill source")
     # Validate: must have register() and execute()
     if "def register(" not in source:
         return {"ok": False, "name": "", "message": "Skill missing register() function"}
     if "def execute(" not in source:
         return {"ok": False, "name": "", "message": "Skill missing execute() function"}
 
-    # Exec in temp namespace to get metadata
-    ns: dict = {}
-    try:
-        exec(compile(source, "<skill>", "exec"), ns)  # noqa: S102
-        meta = ns["register"]()
-    except Exception as e:
-        return {"ok": False, "name": "", "message": f"register() failed: {e}"}
+    # Read metadata statically when register() returns a literal; exec only as a fallback
+    meta = _parse_manifest(source)
+    if meta is None:
+        ns: dict = {}
+        try:
+            exec(compile(source, "<skill>", "exec"), ns)  # noqa: S102
+            meta = ns["register"]()
+        except Exception as e:
+            return {"ok": False, "name": "", "message": f"register() failed: {e}"}
 
     name = meta.get("name", "").strip().lower().replace(" ", "_")
     if not name or not re.match(r'^[a-z0-9_]+$', name):
@@ -113,34 +341,38 @@ def _install_from_source(source: str, origin: str) -> dict:
     requires = meta.get("requires", [])
     if requires:
         logger.info(f"[SkillManager] Installing deps for {name}: {requires}")
-        try:
-            pip = [sys.executable, "-m", "pip", "install", "--quiet"] + requires
-            result = subprocess.run(pip, capture_output=True, text=True, timeout=120)
-            if result.returncode != 0:
-                logger.warning(f"[SkillManager] pip warning: {result.stderr[:300]}")
-        except Exception as e:
-            return {"ok": False, "name": name, "message": f"pip install failed: {e}"}
+        outcomes = install_requirements(
+            requires, lambda stage, progress, message: report(stage, 0.2 + 0.6 * progress, message)
+        )
+        failed = [o for o in outcomes if not o["ok"]]
+        if failed:
+            errors = "; ".join(f"{o['requirement']}: {o.get('error') or 'failed'}" for o in failed)
+            return {"ok": False, "name": name, "message": f"pip install failed: {errors}"}
+
+    report("registering", 0.9, f"Registering {name}")
 
     # Write skill file
     dest = _skill_path(name)
     dest.write_text(source, encoding="utf-8")
 
     # Update registry
-    reg = _load_registry()
-    reg[name] = {
-        "name":        name,
-        "description": meta.get("description", ""),
-        "version":     meta.get("version", "0.0.1"),
-        "author":      meta.get("author", "unknown"),
-        "commands":    meta.get("commands", []),
-        "requires":    requires,
-        "origin":      origin,
-        "enabled":     True,
-    }
-    _save_registry(reg)
-
-    # Hot-load
-    _hot_load(name)
+    with _registry.update() as reg:
+        reg[name] = {
+            "name":        name,
+            "description": meta.get("description", ""),
+            "version":     meta.get("version", "0.0.1"),
+            "author":      meta.get("author", "unknown"),
+            "commands":    meta.get("commands", []),
+            "requires":    requires,
+            "origin":      origin,
+            "enabled":     True,
+        }
+        reg[name].update(_manifest_fields(meta, dest))
+    _results.invalidate(name)
+
+    # Hot-load (isolated workers pick the new file up on their next call)
+    if _pool_for(reg[name]) is None:
+        _hot_load(name)
 
     return {"ok": True, "name": name, "message": f"Skill '{name}' installed and loaded.", "meta": reg[name]}
 
@@ -164,11 +396,36 @@ def _hot_load(name: str) -> bool:
         return False
 
 
-def load_all_enabled():
-    """Called at server startup to load all enabled skills."""
+def load_all_enabled(prewarm: bool = PREWARM) -> int:
+    """Called at server startup. Only refreshes the manifest; no skill is imported here.
+
+    Skills are imported on first execution. With `prewarm`, a background thread
+    imports the enabled ones (into the worker pool when isolation is on) once the
+    server is already serving. Returns the number of enabled skills.
+    """
+    refreshed = refresh_manifests()
+    if refreshed:
+        logger.info(f"[SkillManager] Manifest refreshed for {refreshed} skills")
+    enabled = [name for name, info in _load_registry().items() if info.get("enabled", True)]
+    if prewarm and enabled:
+        threading.Thread(target=prewarm_skills, name="skill-prewarm", daemon=True).start()
+    return len(enabled)
+
+
+def prewarm_skills():
+    """Imports every enabled skill ahead of its first call."""
     reg = _load_registry()
-    for name, info in reg.items():
-        if info.get("enabled", True):
+    enabled = [name for name, info in reg.items()
+               if info.get("enabled", True) and _skill_path(name).exists()]
+    pool = get_skill_pool()
+    isolated = [name for name in enabled if _pool_for(reg[name]) is not None]
+    if pool is not None:
+        pool.start(preload=[(name, _skill_path(name)) for name in isolated])
+        logger.info(f"[SkillManager] {pool.size} skill workers warmed with {len(isolated)} skills")
+    for name in enabled:
+        if name in isolated:
+            continue
+        if name not in _loaded:
             ok = _hot_load(name)
             logger.info(f"[SkillManager] {'✓' if ok else '✗'} {name}")
 
@@ -177,13 +434,51 @@ def load_all_enabled():
 # Execute
 # ---------------------------------------------------------------------------
 
-def execute_skill(name: str, payload: dict) -> dict:
+def execute_skill(name: str, payload: dict, timeout: Optional[float] = None,
+                  cancel: Optional[threading.Event] = None, use_cache: bool = True) -> dict:
+    """Runs a skill, in a worker process when isolation is on (SKILL_WORKERS>0) and the skill allows it.
+
+    `timeout` overrides the per-call deadline (default: the skill's own `timeout`,
+    then SKILL_TIMEOUT) and setting `cancel` aborts the call; both only apply to
+    isolated execution. Skills that declare themselves cacheable
+    are answered from the result cache while a fresh result exists.
+    """
     reg = _load_registry()
     if name not in reg:
         return {"ok": False, "error": f"Skill '{name}' not found"}
     if not reg[name].get("enabled", True):
         return {"ok": False, "error": f"Skill '{name}' is disabled"}
 
+    policy = cache_policy(reg[name]) if use_cache else None
+    key = make_key(name, payload, policy[1]) if policy else None
+    if key is not None:
+        cached = _results.get(key)
+        if cached is not MISSING:
+            return {"ok": True, "result": cached, "cached": True}
+    with metrics.timed("skill", name) as call:
+        reply = _execute(name, reg[name], payload, timeout, cancel)
+        usage = reply.pop("usage", None)
+        if usage:
+            call.cpu, call.rss_growth_kb = usage["cpu"], usage["rss_growth_kb"]
+        result = reply.get("result")
+        if not reply.get("ok") or (isinstance(result, dict) and result.get("ok") is False):
+            call.fail()
+    if key is not None and call.ok:
+        _results.put(key, result, policy[0])
+    return reply
+
+
+def _execute(name: str, info: dict, payload: dict, timeout: Optional[float],
+             cancel: Optional[threading.Event]) -> dict:
+    pool = _pool_for(info)
+    if pool is not None:
+        path = _skill_path(name)
+        if not path.exists():
+            return {"ok": False, "error": f"Skill '{name}' failed to load"}
+        if timeout is None:
+            timeout = info.get("timeout")
+        return pool.run(name, str(path), payload, timeout=timeout, cancel=cancel)
+
     if name not in _loaded:
         if not _hot_load(name):
             return {"ok": False, "error": f"Skill '{name}' failed to load"}
@@ -199,42 +494,66 @@ def execute_skill(name: str, payload: dict) -> dict:
         return {"ok": False, "error": str(e)}
 
 
+def cancel_skill(name: Optional[str] = None) -> dict:
+    """Aborts running calls of one skill (or all skills); their workers are replaced."""
+    pool = get_skill_pool()
+    cancelled = pool.cancel(name) if pool is not None else 0
+    return {"ok": True, "cancelled": cancelled}
+
+
+def invalidate_skill_cache(name: Optional[str] = None) -> dict:
+    return {"ok": True, "removed": _results.invalidate(name)}
+
+
+def skill_cache_stats() -> dict:
+    return _results.stats()
+
+
+def skill_pool_status() -> dict:
+    pool = get_skill_pool()
+    return pool.status() if pool is not None else {"size": 0}
+
+
 # ---------------------------------------------------------------------------
 # List / toggle / uninstall
 # ---------------------------------------------------------------------------
 
 def list_skills() -> list:
     reg = _load_registry()
+    pool = get_skill_pool()
+    preloaded = pool.preloaded() if pool is not None else set()
     out = []
     for name, info in reg.items():
-        out.append({**info, "loaded": name in _loaded})
+        # Isolated skills are imported in the workers, never in this process
+        loaded = name in preloaded if _pool_for(info) is not None else name in _loaded
+        out.append({**info, "loaded": loaded})
     return out
 
 
 def toggle_skill(name: str, enabled: bool) -> dict:
-    reg = _load_registry()
-    if name not in reg:
-        return {"ok": False, "error": f"Skill '{name}' not found"}
-    reg[name]["enabled"] = enabled
-    _save_registry(reg)
+    with _registry.update() as reg:
+        if name not in reg:
+            return {"ok": False, "error": f"Skill '{name}' not found"}
+        reg[name]["enabled"] = enabled
+    _results.invalidate(name)
     if not enabled and name in _loaded:
         del _loaded[name]
-    elif enabled:
+    elif enabled and _pool_for(reg[name]) is None:
         _hot_load(name)
     return {"ok": True, "name": name, "enabled": enabled}
 
 
 def uninstall_skill(name: str) -> dict:
-    reg = _load_registry()
-    if name not in reg:
-        return {"ok": False, "error": f"Skill '{name}' not found"}
-    # Remove file
-    p = _skill_path(name)
-    if p.exists():
-        p.unlink()
-    # Remove from registry + memory
-    del reg[name]
-    _save_registry(reg)
+    with _registry.update() as reg:
+        if name not in reg:
+            return {"ok": False, "error": f"Skill '{name}' not found"}
+        # Remove file
+        p = _skill_path(name)
+        if p.exists():
+            p.unlink()
+        # Remove from registry + memory
+        del reg[name]
+    _results.invalidate(name)
     _loaded.pop(name, None)
     return {"ok": True, "message": f"Skill '{name}' uninstalled."}
 
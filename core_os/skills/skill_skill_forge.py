@@ -19,6 +19,9 @@ def register() -> dict:
         "version": "1.0.0",
         "author": "M.I.L.L.A.",
         "commands": ["/forge", "/makeskill"],
+        # Calls the model and may pip-install the generated skill's deps:
+        # too long-running for a worker's deadline and rlimits
+        "isolated": False,
     }
 
 
@@ -5,6 +5,10 @@ def register() -> dict:
         "version": "1.0.0",
         "author": "M.I.L.L.A.",
         "commands": ["/test"],
+        "parameters": {
+            "type": "object",
+            "properties": {"text": {"type": "string", "description": "Text to echo back in upper case"}},
+        },
     }
 
 def execute(payload: dict) -> dict:
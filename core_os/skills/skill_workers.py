@@ -0,0 +1,350 @@
+"""
+skill_workers.py — isolated execution for skill plugins.
+
+Skills run in a small pool of long-lived worker processes instead of inside
+the server. Workers are started ahead of time with the enabled skills already
+imported, so a call costs one pipe round trip rather than an interpreter start.
+Each call has a wall-clock deadline and can be cancelled; a worker that overruns
+is killed and replaced. Workers run under CPU and address-space rlimits and are
+retired after a fixed number of calls so leaks cannot accumulate.
+
+Isolation is opt-in (SKILL_WORKERS=N). Even then, a skill that orchestrates
+long work of its own (model calls, pip installs) can declare `isolated: False`
+in register() to keep running in the server process, and any skill can set its
+own `timeout` in seconds.
+"""
+
+import atexit
+import importlib.util
+import itertools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows: no rlimits
+    resource = None
+
+logger = logging.getLogger("skill_manager")
+
+POOL_SIZE      = int(os.getenv("SKILL_WORKERS", "0"))                # 0 = run skills in the server process
+MAX_CALLS      = int(os.getenv("SKILL_WORKER_MAX_CALLS", "200"))    # recycle a worker after this many calls
+CALL_TIMEOUT   = float(os.getenv("SKILL_TIMEOUT", "120"))           # wall-clock seconds per call
+CPU_LIMIT      = int(os.getenv("SKILL_CPU_LIMIT", "60"))            # CPU seconds per call, 0 = unlimited
+MEMORY_LIMIT_MB = int(os.getenv("SKILL_MEMORY_MB", "2048"))         # address space per worker, 0 = unlimited
+POLL_INTERVAL  = 0.05
+
+_IN_WORKER = False      # set in worker processes, which must never start a pool of their own
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+def _apply_memory_limit(memory_mb: int):
+    if resource and memory_mb > 0:
+        limit = memory_mb * 1024 * 1024
+        try:
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ValueError, OSError) as e:
+            logger.warning(f"[SkillWorker] Could not set memory limit: {e}")
+
+
+def _arm_cpu_limit(cpu_sec: int):
+    """Sets the soft CPU limit `cpu_sec` past what this worker has used so far.
+
+    RLIMIT_CPU counts the whole process lifetime, so it is re-armed before every
+    call; the hard limit is left alone because it can never be raised again.
+    """
+    if not resource or cpu_sec <= 0:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + cpu_sec + 1
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _peak_rss_kb() -> int:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else 0
+
+
+def _load_module(name: str, path: str, modules: Dict):
+    """Imports a skill file once, re-importing it when the file changes on disk."""
+    mtime = os.stat(path).st_mtime_ns
+    cached = modules.get(path)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    spec = importlib.util.spec_from_file_location(f"skill_{name}", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    modules[path] = (mtime, mod)
+    return mod
+
+
+def _worker_main(conn, preload: Iterable[Tuple[str, str]], memory_mb: int, cpu_sec: int):
+    global _IN_WORKER
+    _IN_WORKER = True
+    _apply_memory_limit(memory_mb)
+    modules: Dict = {}
+    for name, path in preload:
+        try:
+            _load_module(name, path, modules)
+        except Exception as e:
+            logger.warning(f"[SkillWorker] Preload failed for {name}: {e}")
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, KeyboardInterrupt):
+            break
+        if job is None:
+            break
+        name, path, payload = job
+        cpu, rss = time.process_time(), _peak_rss_kb()
+        try:
+            mod = _load_module(name, path, modules)
+            if not hasattr(mod, "execute"):
+                reply = {"ok": False, "error": f"Skill '{name}' has no execute() function"}
+            else:
+                _arm_cpu_limit(cpu_sec)
+                reply = {"ok": True, "result": mod.execute(payload)}
+        except BaseException as e:
+            reply = {"ok": False, "error": str(e) or type(e).__name__}
+        reply["usage"] = {"cpu": time.process_time() - cpu, "rss_growth_kb": _peak_rss_kb() - rss}
+        try:
+            conn.send(reply)
+        except Exception as e:
+            # Result could not be pickled; send back something the server can show
+            conn.send({"ok": True, "result": repr(reply.get("result")), "usage": reply["usage"]} if reply.get("ok")
+                      else {"ok": False, "error": f"Unsendable error: {e}", "usage": reply["usage"]})
+
+
+# ---------------------------------------------------------------------------
+# Server side
+# ---------------------------------------------------------------------------
+
+def _context():
+    methods = multiprocessing.get_all_start_methods()
+    if "forkserver" in methods:
+        # Fork from a clean single-threaded server rather than from the threaded web process
+        ctx = multiprocessing.get_context("forkserver")
+        ctx.set_forkserver_preload([__name__])
+        return ctx
+    return multiprocessing.get_context("spawn")
+
+
+class _Worker:
+    def __init__(self, ctx, preload, memory_mb: int, cpu_sec: int):
+        self.conn, child = ctx.Pipe()
+        self.proc = ctx.Process(
+            target=_worker_main, args=(child, list(preload), memory_mb, cpu_sec),
+            name="skill-worker", daemon=True,
+        )
+        self.proc.start()
+        child.close()
+        self.calls = 0
+
+    def kill(self):
+        if self.proc.is_alive():
+            self.proc.kill()
+        self.proc.join(1)
+        self.conn.close()
+
+    def retire(self):
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.proc.join(1)
+        self.kill()
+
+
+class SkillWorkerPool:
+    """Pre-started worker processes that execute skills with deadlines and cancellation."""
+
+    def __init__(self, size: int = POOL_SIZE, max_calls: int = MAX_CALLS, timeout: float = CALL_TIMEOUT,
+                 cpu_limit: int = CPU_LIMIT, memory_mb: int = MEMORY_LIMIT_MB):
+        self.size = max(1, size)
+        self.max_calls = max_calls
+        self.timeout = timeout
+        self.cpu_limit = cpu_limit
+        self.memory_mb = memory_mb
+        self._ctx = _context()
+        self._preload = []
+        self._idle = []
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._active: Dict[int, Tuple[str, threading.Event]] = {}
+        self._ids = itertools.count(1)
+        self._closed = False
+        self._started = False
+        self.stats = {"calls": 0, "timeouts": 0, "cancelled": 0, "crashed": 0, "recycled": 0, "spawned": 0}
+
+    def _spawn(self) -> _Worker:
+        self.stats["spawned"] += 1
+        return _Worker(self._ctx, self._preload, self.memory_mb, self.cpu_limit)
+
+    def start(self, preload: Iterable[Tuple[str, str]] = ()):
+        """Sets the skills every worker imports up front and fills the pool."""
+        with self._lock:
+            self._preload = [(name, str(path)) for name, path in preload]
+            self._started = True
+            while len(self._idle) < self.size:
+                self._idle.append(self._spawn())
+
+    def preloaded(self) -> set:
+        """Names of the skills the workers import at start, once the pool has been started."""
+        with self._lock:
+            return {name for name, _ in self._preload} if self._started else set()
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.proc.is_alive():
+                    return worker
+                worker.kill()
+            return self._spawn()
+
+    def _checkin(self, worker: _Worker):
+        worker.calls += 1
+        if worker.calls >= self.max_calls:
+            self.stats["recycled"] += 1
+            worker.retire()
+            self._replenish()
+            return
+        with self._lock:
+            if self._closed:
+                worker.retire()
+            else:
+                self._idle.append(worker)
+
+    def _discard(self, worker: _Worker):
+        worker.kill()
+        self._replenish()
+
+    def _replenish(self):
+        """Starts a replacement worker in the background so the next call finds it warm."""
+        def _add():
+            worker = self._spawn()
+            with self._lock:
+                if self._closed or len(self._idle) >= self.size:
+                    worker.retire()
+                else:
+                    self._idle.append(worker)
+        if not self._closed:
+            threading.Thread(target=_add, name="skill-worker-spawn", daemon=True).start()
+
+    def run(self, name: str, path: str, payload: dict, timeout: Optional[float] = None,
+            cancel: Optional[threading.Event] = None) -> dict:
+        """Executes one skill call in a worker. Returns execute_skill's {ok, result|error} shape."""
+        timeout = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        cancel = cancel or threading.Event()
+        if not self._slots.acquire(timeout=timeout):
+            return {"ok": False, "error": f"Skill '{name}' timed out waiting for a free worker"}
+        call_id = next(self._ids)
+        self._active[call_id] = (name, cancel)
+        worker = None
+        try:
+            worker = self._checkout()
+            self.stats["calls"] += 1
+            try:
+                worker.conn.send((name, str(path), payload))
+            except Exception as e:
+                self._checkin(worker)
+                return {"ok": False, "error": f"Could not send payload to skill '{name}': {e}"}
+            while True:
+                if worker.conn.poll(POLL_INTERVAL):
+                    try:
+                        reply = worker.conn.recv()
+                    except EOFError:
+                        return self._crashed(name, worker)
+                    self._checkin(worker)
+                    return reply
+                if cancel.is_set():
+                    self.stats["cancelled"] += 1
+                    self._discard(worker)
+                    return {"ok": False, "error": f"Skill '{name}' was cancelled"}
+                if time.monotonic() >= deadline:
+                    self.stats["timeouts"] += 1
+                    self._discard(worker)
+                    return {"ok": False, "error": f"Skill '{name}' timed out after {timeout:g}s"}
+                if not worker.proc.is_alive() and not worker.conn.poll():
+                    return self._crashed(name, worker)
+        finally:
+            self._active.pop(call_id, None)
+            self._slots.release()
+
+    def _crashed(self, name: str, worker: _Worker) -> dict:
+        self.stats["crashed"] += 1
+        worker.proc.join(1)
+        code = worker.proc.exitcode
+        self._discard(worker)
+        reason = f"exit code {code}"
+        if resource and code is not None and code < 0:
+            import signal
+            sig = -code
+            if sig == signal.SIGXCPU:
+                reason = f"exceeded CPU limit of {self.cpu_limit}s"
+            elif sig == signal.SIGKILL:
+                reason = "killed (likely out of memory)"
+            else:
+                reason = f"killed by signal {sig}"
+        return {"ok": False, "error": f"Skill '{name}' worker crashed: {reason}"}
+
+    def cancel(self, name: Optional[str] = None) -> int:
+        """Cancels running calls (of one skill, or all). Returns how many were signalled."""
+        count = 0
+        for skill, event in list(self._active.values()):
+            if name is None or skill == name:
+                event.set()
+                count += 1
+        return count
+
+    def recycle(self):
+        """Retires idle workers so the next calls start from a fresh import."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.retire()
+        for _ in idle:
+            self._replenish()
+
+    def shutdown(self):
+        self._closed = True
+        self.cancel()
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.retire()
+
+    def status(self) -> dict:
+        return {
+            "size": self.size,
+            "idle": len(self._idle),
+            "active": [name for name, _ in list(self._active.values())],
+            **self.stats,
+        }
+
+
+_pool: Optional[SkillWorkerPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_skill_pool() -> Optional[SkillWorkerPool]:
+    """The shared pool, or None when isolation is disabled (SKILL_WORKERS=0) or inside a worker."""
+    global _pool
+    if POOL_SIZE <= 0 or _IN_WORKER:
+        return None
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = SkillWorkerPool()
+                atexit.register(_pool.shutdown)
+    return _pool
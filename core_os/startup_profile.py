@@ -0,0 +1,230 @@
+"""
+startup_profile.py — measure and budget start-up of the Nexus entry points.
+
+In-process, entry points wrap their boot steps in `startup.phase(name)`. The
+recorded durations are served at /api/system/startup and written as JSON when
+MILLA_STARTUP_REPORT=<path> is set.
+
+As a harness, it imports an entry point in a fresh interpreter under
+`-X importtime`, runs its FastAPI startup hooks (if any), times each one, and
+emits a machine-readable report. It exits non-zero when a budget is exceeded:
+
+    python -m core_os.startup_profile src.core.nexus_server --budget-ms 4000 --hook-budget-ms 1500
+    python -m core_os.startup_profile nexus_aio --no-hooks --json startup.json
+"""
+
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).parent.parent.resolve()
+REPORT_ENV = "MILLA_STARTUP_REPORT"
+HOOK_TIMEOUT = 120.0
+
+
+class StartupTimer:
+    """Collects named start-up phase durations for the current process."""
+
+    def __init__(self):
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._phases: Dict[str, dict] = {}
+        self.finished: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        started = time.perf_counter()
+        ok = True
+        try:
+            yield
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            self.mark(name, time.perf_counter() - started, ok)
+
+    def mark(self, name: str, seconds: float, ok: bool = True):
+        with self._lock:
+            self._phases[name] = {"ms": round(seconds * 1000, 2), "ok": ok, "at": round(time.time() - self.started, 3)}
+
+    def finish(self):
+        """Marks start-up complete and writes the report if MILLA_STARTUP_REPORT is set."""
+        self.finished = time.time()
+        path = os.getenv(REPORT_ENV)
+        if path:
+            try:
+                Path(path).write_text(json.dumps(self.report(), indent=2))
+            except OSError as e:
+                print(f"[!] Startup report not written: {e}")
+
+    def report(self) -> dict:
+        with self._lock:
+            phases = dict(self._phases)
+        return {
+            "pid": os.getpid(),
+            "argv": sys.argv,
+            "boot_ms": round((self.finished - self.started) * 1000, 2) if self.finished else None,
+            "phases": phases,
+        }
+
+
+startup = StartupTimer()
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+def _run_hooks(module) -> List[dict]:
+    """Runs a FastAPI app's startup hooks one by one, timing each."""
+    app = getattr(module, "app", None)
+    handlers = getattr(getattr(app, "router", None), "on_startup", None) or []
+    results = []
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    for handler in handlers:
+        started = time.perf_counter()
+        entry = {"hook": getattr(handler, "__name__", repr(handler)), "ok": True}
+        try:
+            if inspect.iscoroutinefunction(handler):
+                loop.run_until_complete(asyncio.wait_for(handler(), HOOK_TIMEOUT))
+            else:
+                handler()
+        except Exception as e:
+            entry.update(ok=False, error=f"{type(e).__name__}: {e}")
+        entry["ms"] = round((time.perf_counter() - started) * 1000, 2)
+        results.append(entry)
+    return results
+
+
+def _child(target: str, hooks: bool):
+    """Runs inside the profiled interpreter; prints one JSON line on stdout."""
+    sys.path.insert(0, str(PROJECT_ROOT))
+    started = time.perf_counter()
+    out = {"target": target, "ok": True}
+    try:
+        __import__(target)   # not importlib.import_module: that bypasses -X importtime
+        module = sys.modules[target]
+    except BaseException as e:   # entry points may sys.exit() on missing deps
+        out.update(ok=False, error=f"{type(e).__name__}: {e}")
+        module = None
+    out["import_ms"] = round((time.perf_counter() - started) * 1000, 2)
+    out["hooks"] = _run_hooks(module) if hooks and module is not None else []
+    # Under `-m` this file is __main__; the target records into the importable copy
+    timer = getattr(sys.modules.get("core_os.startup_profile"), "startup", startup)
+    out["phases"] = timer.report()["phases"]
+    try:
+        import resource
+        out["maxrss_kb"] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        pass
+    sys.stdout.write("\n" + json.dumps(out) + "\n")
+    sys.stdout.flush()
+    os._exit(0)   # skip atexit handlers and non-daemon threads the target may have started
+
+
+def parse_importtime(stderr: str) -> List[dict]:
+    """Rows of `-X importtime` output as {module, self_ms, cumulative_ms, depth}."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        head, cumulative, name = line.split("|", 2)
+        self_us = head.split(":", 1)[1]
+        rows.append({
+            "module": name.strip(),
+            "depth": (len(name) - len(name.lstrip()) - 1) // 2,
+            "self_ms": round(int(self_us) / 1000, 2),
+            "cumulative_ms": round(int(cumulative) / 1000, 2),
+        })
+    return rows
+
+
+def profile(target: str, hooks: bool = True, timeout: float = 600.0) -> dict:
+    """Profiles one entry point in a fresh interpreter."""
+    cmd = [sys.executable, "-X", "importtime", "-m", "core_os.startup_profile", "--child", target]
+    if not hooks:
+        cmd.append("--no-hooks")
+    started = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=PROJECT_ROOT, capture_output=True, text=True, timeout=timeout)
+    wall_ms = round((time.perf_counter() - started) * 1000, 2)
+    result = None
+    for line in reversed(proc.stdout.splitlines()):
+        if line.startswith("{"):
+            result = json.loads(line)
+            break
+    if result is None:
+        result = {"target": target, "ok": False, "error": proc.stderr.strip()[-500:], "hooks": [], "phases": {}}
+    modules = parse_importtime(proc.stderr)
+    # The harness itself is imported first; leave it out of the target's numbers
+    own = {"core_os.startup_profile", "core_os"}
+    result["modules"] = sorted((m for m in modules if m["module"] not in own),
+                               key=lambda m: m["self_ms"], reverse=True)
+    result["wall_ms"] = wall_ms
+    result["total_ms"] = round(result.get("import_ms", 0) + sum(h["ms"] for h in result["hooks"]), 2)
+    return result
+
+
+def check_budget(result: dict, budget_ms: Optional[float] = None, hook_budget_ms: Optional[float] = None,
+                 module_budget_ms: Optional[float] = None) -> List[str]:
+    """Human-readable budget violations (empty when within budget)."""
+    violations = []
+    if budget_ms is not None and result["total_ms"] > budget_ms:
+        violations.append(f"start-up {result['total_ms']:.0f} ms > budget {budget_ms:.0f} ms")
+    if hook_budget_ms is not None:
+        for hook in result["hooks"]:
+            if hook["ms"] > hook_budget_ms:
+                violations.append(f"hook {hook['hook']} {hook['ms']:.0f} ms > budget {hook_budget_ms:.0f} ms")
+    if module_budget_ms is not None:
+        for mod in result["modules"]:
+            if mod["self_ms"] > module_budget_ms:
+                violations.append(f"import {mod['module']} {mod['self_ms']:.0f} ms > budget {module_budget_ms:.0f} ms")
+    return violations
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Profile start-up of a Nexus entry point")
+    parser.add_argument("target", help="module to import, e.g. src.core.nexus_server, nexus_aio, main")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--no-hooks", action="store_true", help="only measure the import")
+    parser.add_argument("--budget-ms", type=float, default=float(os.getenv("STARTUP_BUDGET_MS", "0")) or None)
+    parser.add_argument("--hook-budget-ms", type=float, default=None)
+    parser.add_argument("--module-budget-ms", type=float, default=None)
+    parser.add_argument("--top", type=int, default=15, help="slowest modules to print")
+    parser.add_argument("--json", dest="json_path", help="write the full report here")
+    args = parser.parse_args(argv)
+
+    if args.child:
+        _child(args.target, hooks=not args.no_hooks)
+        return 0
+
+    result = profile(args.target, hooks=not args.no_hooks)
+    result["budget_violations"] = check_budget(result, args.budget_ms, args.hook_budget_ms, args.module_budget_ms)
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, indent=2))
+
+    status = "OK" if result.get("ok") else f"FAILED ({result.get('error', '')})"
+    print(f"[*] [StartupProfile]: {args.target}: import {result.get('import_ms', 0):.0f} ms, "
+          f"total {result['total_ms']:.0f} ms, {status}")
+    for hook in result["hooks"]:
+        print(f"[*] [StartupProfile]:   hook {hook['hook']:<24} {hook['ms']:9.1f} ms{'' if hook['ok'] else '  ' + hook.get('error', '')}")
+    for name, phase in result["phases"].items():
+        print(f"[*] [StartupProfile]:   phase {name:<23} {phase['ms']:9.1f} ms")
+    for mod in result["modules"][:args.top]:
+        print(f"[*] [StartupProfile]:   {mod['self_ms']:9.1f} ms self {mod['cumulative_ms']:9.1f} ms cum  {mod['module']}")
+    for violation in result["budget_violations"]:
+        print(f"[!] [StartupProfile]: {violation}")
+    return 1 if result["budget_violations"] or not result.get("ok") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
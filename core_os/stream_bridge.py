@@ -0,0 +1,103 @@
+"""
+stream_bridge.py — drive a blocking generator from async code, one item at a time.
+
+The computer-use agent is a plain generator that blocks on screenshots, model
+calls and desktop actions. iterate_in_thread() runs it on a dedicated thread
+and hands each item to the event loop as soon as it is produced:
+
+    async for step in iterate_in_thread(lambda: run_agent(task, max_steps)):
+        yield f"data: {json.dumps(step)}\\n\\n"
+
+Items pass through a bounded asyncio.Queue. When the consumer falls behind, the
+producer thread blocks before it asks the generator for the next item, so at
+most `maxsize` items are ever held. If the consumer stops early (the client
+disconnected and the response task was cancelled), the producer closes the
+generator at its current yield. GeneratorExit is raised there and no further
+steps run.
+
+Config (env):
+    STREAM_BRIDGE_QUEUE  items buffered between producer and consumer (default 4)
+"""
+
+import asyncio
+import concurrent.futures
+import os
+import threading
+from typing import AsyncIterator, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+QUEUE_SIZE = int(os.getenv("STREAM_BRIDGE_QUEUE", "4"))
+POLL_INTERVAL = 0.25        # how often a blocked producer re-checks for cancellation
+
+_DONE = object()
+
+
+class _Raised:
+    def __init__(self, exc: BaseException):
+        self.exc = exc
+
+
+def _produce(factory: Callable[[], Iterator[T]], queue: "asyncio.Queue", loop: asyncio.AbstractEventLoop,
+             stop: threading.Event):
+    def deliver(item) -> bool:
+        try:
+            fut = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        except RuntimeError:        # loop closed underneath us
+            return False
+        while True:
+            try:
+                fut.result(POLL_INTERVAL)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    fut.cancel()
+                    return False
+            except concurrent.futures.CancelledError:
+                return False
+
+    gen = None
+    try:
+        gen = factory()
+        for item in gen:
+            if stop.is_set() or not deliver(item):
+                return
+            if stop.is_set():
+                return
+        deliver(_DONE)
+    except BaseException as e:
+        deliver(_Raised(e))
+    finally:
+        close = getattr(gen, "close", None)
+        if close is not None:
+            try:
+                close()
+            except Exception:
+                pass
+
+
+async def iterate_in_thread(factory: Callable[[], Iterator[T]], maxsize: int = QUEUE_SIZE,
+                            name: str = "stream-bridge") -> AsyncIterator[T]:
+    """Yield the items of `factory()` as they are produced on a worker thread.
+
+    Exceptions raised by the generator are re-raised here. Closing or
+    cancelling this async iterator stops and closes the generator.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max(1, maxsize))
+    stop = threading.Event()
+    worker = threading.Thread(target=_produce, args=(factory, queue, loop, stop), name=name, daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Raised):
+                raise item.exc
+            yield item
+    finally:
+        stop.set()
+        # Unblock a producer waiting on a full queue so it notices `stop` promptly
+        while not queue.empty():
+            queue.get_nowait()
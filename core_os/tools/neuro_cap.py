@@ -6,6 +6,17 @@ except Exception:
 
 import ollama
 
+# Ensure project root is in path (this file is also run directly)
+import sys
+from pathlib import Path
+PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.append(str(PROJECT_ROOT))
+
+from core_os.vision_cache import vision_cache
+
+GLANCE_PROMPT = 'Describe this screen briefly.'
+
 # For Idle Detection (Linux/Windows compat)
 try:
     # Windows
@@ -41,16 +52,24 @@ class NeuroSyntheticCAP:
             # Use local Moondream for vision (much faster/private)
             with open("current_view.png", "rb") as img_file:
                 image_bytes = img_file.read()
+
+            # An unchanged screen gets the previous glance back instead of a new inference
+            fingerprint = vision_cache.fingerprint(image_bytes)
+            cached = vision_cache.get("moondream:latest", GLANCE_PROMPT, fingerprint)
+            if cached is not None:
+                return cached
                 
             response = ollama.chat(
                 model="moondream:latest",
                 messages=[{
                     'role': 'user',
-                    'content': 'Describe this screen briefly.',
+                    'content': GLANCE_PROMPT,
                     'images': [image_bytes]
                 }]
             )
-            return response['message']['content']
+            description = response['message']['content']
+            vision_cache.put("moondream:latest", GLANCE_PROMPT, fingerprint, description)
+            return description
         except Exception as e:
             return f"Vision Error: {e}"
 
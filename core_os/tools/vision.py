@@ -2,7 +2,6 @@
 import os
 import sys
 import pyautogui
-import easyocr
 from datetime import datetime
 from pathlib import Path
 
@@ -11,13 +10,8 @@ PROJECT_ROOT = Path(__file__).parent.parent.parent.resolve()
 if str(PROJECT_ROOT) not in sys.path:
     sys.path.append(str(PROJECT_ROOT))
 
-# Initialize Vision (OCR) with GPU support if available
-try:
-    reader = easyocr.Reader(['en'], gpu=True)
-    print("[+] Vision Engine: GPU Acceleration Active (RX 550).")
-except Exception as e:
-    reader = easyocr.Reader(['en'], gpu=False)
-    print(f"[!] Vision Engine: GPU failed, falling back to CPU. ({e})")
+# Vision (OCR) runs on the process-wide reader, on the GPU when one is available
+from core_os.ocr_service import ocr
 
 def screen_vision(detail=0):
     """
@@ -32,7 +26,7 @@ def screen_vision(detail=0):
     
     try:
         pyautogui.screenshot().save(str(path))
-        results = reader.readtext(str(path), detail=detail)
+        results = ocr.readtext(str(path), detail=detail)
         
         if detail == 0:
             text = "\n".join(results[-50:]) # Last 50 lines for terminal context
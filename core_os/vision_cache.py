@@ -0,0 +1,168 @@
+"""
+vision_cache.py — reuse vision-model answers for near-identical images.
+
+Entries are keyed by (model, prompt, perceptual fingerprint of the image).
+The fingerprint is a GRID x GRID set of 64-bit difference hashes, one per tile.
+A lookup matches a fresh entry for the same model and prompt only if EVERY
+tile is within TOLERANCE bits. An idle desktop or a static camera scene still
+returns the earlier description. A dialog, a notification or new text in one
+pane changes its tile, so the lookup misses. A single hash over the whole frame
+would absorb such a change into its tolerance.
+
+    fp = vision_cache.fingerprint(img_bytes)
+    cached = vision_cache.get(model, prompt, fp)
+    if cached is None:
+        cached = call_model(...)
+        vision_cache.put(model, prompt, fp, cached)
+
+Without Pillow the fingerprint falls back to an exact content hash, so only
+byte-identical images are reused.
+
+Config (env):
+    VISION_CACHE_SIZE       entries kept, least recently used evicted (default 256)
+    VISION_CACHE_TTL        seconds an answer stays reusable (default 60; 0 disables the cache)
+    VISION_CACHE_GRID       tiles per side of the fingerprint grid (default 8)
+    VISION_CACHE_TOLERANCE  bits each tile's hash may differ by and still match (default 2)
+"""
+
+import hashlib
+import io
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from core_os.lazy import lazy_module
+from core_os.ocr_cache import hamming
+
+MAX_ENTRIES = int(os.getenv("VISION_CACHE_SIZE", "256"))
+TTL = float(os.getenv("VISION_CACHE_TTL", "60"))
+GRID = int(os.getenv("VISION_CACHE_GRID", "8"))
+TOLERANCE = int(os.getenv("VISION_CACHE_TOLERANCE", "2"))
+TILE_HASH = 8               # each tile hashes to 8x8 = 64 bits
+
+_Image = lazy_module("PIL.Image")
+
+# ("tiles", (bits, ...)) or ("sha", digest) — only tiles support tolerance
+Fingerprint = Tuple[str, Any]
+
+
+def tile_hashes(image, grid: int = GRID, size: int = TILE_HASH) -> Tuple[int, ...]:
+    """Difference hash of each tile in a grid x grid split, row-major, from a single downscale."""
+    width = grid * (size + 1)
+    pixels = list(image.convert("L").resize((width, grid * size)).getdata())
+    hashes = []
+    for ty in range(grid):
+        for tx in range(grid):
+            bits = 0
+            for row in range(ty * size, (ty + 1) * size):
+                base = row * width + tx * (size + 1)
+                for col in range(size):
+                    bits = (bits << 1) | (pixels[base + col] > pixels[base + col + 1])
+            hashes.append(bits)
+    return tuple(hashes)
+
+
+def tile_distance(a: Tuple[int, ...], b: Tuple[int, ...], tolerance: int) -> Optional[int]:
+    """Total differing bits if every tile is within `tolerance`, else None."""
+    if len(a) != len(b):
+        return None
+    total = 0
+    for x, y in zip(a, b):
+        dist = hamming(x, y)
+        if dist > tolerance:
+            return None
+        total += dist
+    return total
+
+
+class VisionResultCache:
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl: float = TTL, tolerance: int = TOLERANCE):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.tolerance = tolerance
+        self._entries: "OrderedDict[Tuple[str, str, Fingerprint], Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "near_hits": 0, "misses": 0, "expired": 0, "evicted": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.max_entries > 0
+
+    @staticmethod
+    def fingerprint(image) -> Optional[Fingerprint]:
+        """Perceptual hash of encoded image bytes or a file path (None if unreadable)."""
+        try:
+            if isinstance(image, (str, os.PathLike)):
+                with open(image, "rb") as f:
+                    image = f.read()
+            Image = _Image.get()
+            if Image is not None:
+                with Image.open(io.BytesIO(image)) as img:
+                    return VisionResultCache.fingerprint_image(img)
+            return "sha", int.from_bytes(hashlib.blake2b(image, digest_size=16).digest(), "big")
+        except Exception:
+            return None
+
+    @staticmethod
+    def fingerprint_image(img) -> Fingerprint:
+        """Fingerprint of an already decoded PIL image."""
+        return "tiles", tile_hashes(img)
+
+    def get(self, model: str, prompt: str, fp: Optional[Fingerprint]) -> Optional[Any]:
+        if fp is None or not self.enabled:
+            return None
+        now = time.time()
+        with self._lock:
+            key = (model, prompt, fp)
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry[1]
+            if fp[0] == "tiles" and self.tolerance > 0:
+                best, best_dist = None, None
+                for (m, p, other), (stamp, _) in self._entries.items():
+                    if m != model or p != prompt or other[0] != "tiles" or now - stamp > self.ttl:
+                        continue
+                    dist = tile_distance(fp[1], other[1], self.tolerance)
+                    if dist is not None and (best_dist is None or dist < best_dist):
+                        best, best_dist = (m, p, other), dist
+                if best is not None:
+                    self._entries.move_to_end(best)
+                    self._stats["near_hits"] += 1
+                    return self._entries[best][1]
+            self._stats["misses"] += 1
+            return None
+
+    def put(self, model: str, prompt: str, fp: Optional[Fingerprint], result: Any):
+        if fp is None or not self.enabled:
+            return
+        with self._lock:
+            key = (model, prompt, fp)
+            self._entries[key] = (time.time(), result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats["evicted"] += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["near_hits"] + stats["misses"]
+        stats["hit_rate"] = round((stats["hits"] + stats["near_hits"]) / lookups, 3) if lookups else 0.0
+        stats.update(ttl=self.ttl, tolerance=self.tolerance, grid=GRID, max_entries=self.max_entries)
+        return stats
+
+
+vision_cache = VisionResultCache()
@@ -0,0 +1,82 @@
+"""
+vision_fanout.py — run several vision-model calls at once under a cap and a deadline.
+
+A desktop snapshot asks the vision model about the full screenshot and about
+each focus-region crop. Run one after another, snapshot latency is the sum of
+those round trips. Here they run concurrently, at most `max_workers` at a
+time. Whatever has finished when `deadline` expires is returned, and the rest
+is reported as timed out.
+
+    result = fan_out([VisionTask("screen", path, prompt), ...], analyze_visuals)
+    result.results["screen"], result.timed_out, result.errors
+
+Config (env):
+    VISION_FANOUT_WORKERS   concurrent model calls per snapshot (default 3)
+    VISION_FANOUT_DEADLINE  seconds before partial results are returned (default 60)
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+MAX_WORKERS = int(os.getenv("VISION_FANOUT_WORKERS", "3"))
+DEADLINE = float(os.getenv("VISION_FANOUT_DEADLINE", "60"))
+
+
+class VisionTask(NamedTuple):
+    key: str
+    image_path: str
+    prompt: str
+
+
+class FanOutResult(NamedTuple):
+    results: Dict[str, str]     # key -> model answer, in task order, finished tasks only
+    timed_out: List[str]
+    errors: Dict[str, str]
+    elapsed_ms: float
+
+    def as_metadata(self) -> dict:
+        return {
+            "vision_ms": self.elapsed_ms,
+            "vision_completed": len(self.results),
+            "vision_timed_out": self.timed_out,
+            "vision_errors": self.errors,
+        }
+
+
+def fan_out(tasks: List[VisionTask], analyze: Callable[[str, str], str], max_workers: int = MAX_WORKERS,
+            deadline: float = DEADLINE, cleanup: Optional[Callable[[VisionTask], None]] = None) -> FanOutResult:
+    """Runs analyze(image_path, prompt) for every task; returns what finished within `deadline` seconds.
+
+    `cleanup(task)` runs exactly once per task, after its call finishes or when it is
+    dropped unstarted, so callers can delete crop files without racing the model.
+    """
+    started = time.perf_counter()
+    if not tasks:
+        return FanOutResult({}, [], {}, 0.0)
+
+    def _run(task: VisionTask) -> str:
+        try:
+            return analyze(task.image_path, task.prompt)
+        finally:
+            if cleanup is not None:
+                cleanup(task)
+
+    pool = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks))), thread_name_prefix="vision-fanout")
+    futures = [(task, pool.submit(_run, task)) for task in tasks]
+    wait([f for _, f in futures], timeout=deadline)
+
+    results, timed_out, errors = {}, [], {}
+    for task, future in futures:
+        if not future.done():
+            timed_out.append(task.key)
+            if future.cancel() and cleanup is not None:
+                cleanup(task)       # never started, so _run's finally will not run
+        elif future.exception() is not None:
+            errors[task.key] = f"{type(future.exception()).__name__}: {future.exception()}"
+        else:
+            results[task.key] = future.result()
+    # Calls already in flight cannot be interrupted; let them finish in the background
+    pool.shutdown(wait=False, cancel_futures=True)
+    return FanOutResult(results, timed_out, errors, round((time.perf_counter() - started) * 1000, 1))
@@ -68,8 +68,20 @@ export default function Skills() {
     setInstallMsg(null);
     try {
       const { data } = await axios.post('/api/skills/install', { url: installUrl.trim() });
-      setInstallMsg({ ok: data.ok, text: data.message || data.error || 'Done' });
-      if (data.ok) { setInstallUrl(''); fetchSkills(); }
+      if (!data.ok || !data.job) {
+        setInstallMsg({ ok: false, text: data.message || data.error || 'Install failed' });
+      } else {
+        // Installs run in the background — poll the job until it settles
+        let job = data.job;
+        while (job.status === 'queued' || job.status === 'running') {
+          setInstallMsg({ ok: true, text: `${job.stage} ${Math.round(job.progress * 100)}% ${job.message || ''}`.trim() });
+          await new Promise(r => setTimeout(r, 1000));
+          job = (await axios.get(`/api/skills/jobs/${job.id}`)).data;
+        }
+        const ok = job.status === 'done';
+        setInstallMsg({ ok, text: job.message || (ok ? 'Done' : 'Install failed') });
+        if (ok) { setInstallUrl(''); fetchSkills(); }
+      }
     } catch (e: unknown) {
       const msg = e instanceof Error ? e.message : String(e);
       setInstallMsg({ ok: false, text: msg });
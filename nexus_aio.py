@@ -53,6 +53,7 @@ try:
     from core_os.skills.google_calendar import fetch_upcoming_events
     from RAYNE_Admin.milla_telegram_relay import send_telegram_message, process_telegram_updates
     from core_os.interfaces.neural_mesh import NeuralMesh
+    from core_os.startup_profile import startup
 except ImportError as e:
     print(f"[!] Error: Nexus-AIO Brain not found ({e})")
     print("[*] Please ensure you are running from the project root and all dependencies are installed.")
@@ -494,15 +495,18 @@ async def main_loop():
     try:
         from core_os.interfaces.neural_mesh import NeuralMesh
         mesh = NeuralMesh()
-        mesh.animate(duration=7, message="ASSEMBLING NEXUS KINGDOM")
+        with startup.phase("neural_mesh_boot"):
+            mesh.animate(duration=7, message="ASSEMBLING NEXUS KINGDOM")
     except: pass
 
     print_banner()
     print("[*] Console Ready. Type '/help' for options.")
     
     # Initialize Safety Monitor
-    safe_monitor = SafeWordMonitor()
-    safe_monitor.start()
+    with startup.phase("safe_word_monitor"):
+        safe_monitor = SafeWordMonitor()
+        safe_monitor.start()
+    startup.finish()
     
     # Start Background Pulse
     asyncio.create_task(system_pulse_loop())
@@ -32,12 +32,13 @@ except ImportError as e:
     pyautogui_control = lambda *a, **k: "GUI Control Unavailable"
     find_on_screen = lambda *a, **k: None
     draw_laser_pointer = lambda *a, **k: None
+from core_os.startup_profile import startup
 from core_os.skills.auto_lib import (
     model_manager, query_local_knowledge_base, 
     authenticate_gmail, fetch_recent_emails, send_email,
     fetch_recent_files, upload_file_to_drive,
     save_memory, recall_memory,
-    create_entity, add_observation, create_relation
+    create_entity, add_observation, create_relation, query_graph
 )
 from core_os.skills import dynamic_features
 from core_os.memory.agent_memory import memory
@@ -194,6 +195,15 @@ MILLA_TOOLS = [
             "target": {"type": "string"},
         }, "required": ["source", "relation", "target"]},
     }},
+    {"type": "function", "function": {
+        "name": "query_graph",
+        "description": "Look up a knowledge graph entity and its related entities up to N hops away",
+        "parameters": {"type": "object", "properties": {
+            "entity_name": {"type": "string"},
+            "depth": {"type": "integer", "description": "Hops to follow (1-4, default 1)"},
+            "relation": {"type": "string", "description": "Optional relation filter"},
+        }, "required": ["entity_name"]},
+    }},
     {"type": "function", "function": {
         "name": "millAlyze_video",
         "description": "Extract insights, code, and instructions from a YouTube video URL",
@@ -273,6 +283,8 @@ def _dispatch_tool(name: str, args: dict) -> str:
             return str(add_observation(args.get("entity_name", ""), args.get("observation", "")))
         elif name == "create_relation":
             return str(create_relation(args.get("source", ""), args.get("relation", ""), args.get("target", "")))
+        elif name == "query_graph":
+            return str(query_graph(args.get("entity_name", ""), depth=args.get("depth", 1), relation=args.get("relation")))
         elif name == "millAlyze_video":
             return str(millAlyze_video(args.get("url", "")))
         elif name == "capture_tablet_frame":
@@ -537,13 +549,16 @@ def run_agent():
     args = parser.parse_args()
 
     # Register Dynamic Features (Starts Flask)
-    dynamic_features.register_dynamic_features(MILLA_TOOLS)
+    with startup.phase("register_dynamic_features"):
+        dynamic_features.register_dynamic_features(MILLA_TOOLS)
 
-    monitor = SafeWordMonitor()
-    monitor.start()
+    with startup.phase("safe_word_monitor"):
+        monitor = SafeWordMonitor()
+        monitor.start()
     
     # Start background task queue
     threading.Thread(target=process_task_queue, daemon=True).start()
+    startup.finish()
 
     print(f"[*] Regulator Agent Online | Lean Mode | Model: {model_manager.current_model}")
     print("[*] Emergency Stop: Double-tap SPACEBAR")
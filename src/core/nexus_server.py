@@ -23,6 +23,11 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(_
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
+from core_os.metrics import metrics
+from core_os.startup_profile import startup
+from core_os.ocr_service import ocr, OCRBusy
+from core_os.ocr_cache import ocr_cache
+
 # Load core_os modules
 try:
     from core_os.skills.auto_lib import model_manager
@@ -35,17 +40,16 @@ except ImportError as e:
 
 try:
     from core_os.skills.skill_manager import (
-        install_from_github, install_from_local, execute_skill,
+        install_from_local, execute_skill,
         list_skills, toggle_skill, uninstall_skill, load_all_enabled,
+        cancel_skill, skill_pool_status, skill_cache_stats, invalidate_skill_cache,
+        skill_tool_schema, install_async, install_job, list_install_jobs,
     )
     _skills_available = True
 except ImportError as e:
     logging.warning(f"SkillManager unavailable: {e}")
     _skills_available = False
 
-# EasyOCR reader — loaded in background thread at startup (non-blocking)
-_ocr_reader = None
-
 app = FastAPI(title="Nexus Forever Morth Platform")
 
 app.add_middleware(
@@ -58,15 +62,15 @@ app.add_middleware(
 
 @app.on_event("startup")
 async def _preload_ocr():
+    # Shared reader (core_os.ocr_service) — loaded in background thread at startup (non-blocking)
     import concurrent.futures
     def _load():
-        global _ocr_reader
-        try:
-            import easyocr as _easyocr
-            _ocr_reader = _easyocr.Reader(['en'], gpu=False, verbose=False)
+        with startup.phase("preload_ocr"):
+            ok = ocr.preload()
+        if ok:
             logging.info("EasyOCR reader pre-loaded OK")
-        except Exception as _e:
-            logging.warning(f"EasyOCR pre-load skipped: {_e}")
+        else:
+            logging.warning(f"EasyOCR pre-load skipped: {ocr.engine.error}")
     loop = asyncio.get_event_loop()
     loop.run_in_executor(concurrent.futures.ThreadPoolExecutor(max_workers=1), _load)
 
@@ -74,9 +78,12 @@ async def _preload_ocr():
 async def _load_skills():
     if _skills_available:
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, load_all_enabled)
-        logging.info("[SkillManager] All enabled skills loaded.")
-    _load_push_tokens()
+        with startup.phase("load_skills"):
+            count = await loop.run_in_executor(None, load_all_enabled)
+        logging.info(f"[SkillManager] {count} enabled skills registered (imported on first use).")
+    with startup.phase("load_push_tokens"):
+        _load_push_tokens()
+    startup.finish()
 
 # --- GLOBAL STATE ---
 STATE = {
@@ -205,7 +212,7 @@ async def chat_endpoint(chat: ChatMessage):
                 },
             },
         },
-        {
+        skill_tool_schema() if _skills_available else {
             "type": "function",
             "function": {
                 "name": "run_skill",
@@ -316,7 +323,14 @@ async def chat_endpoint(chat: ChatMessage):
     ]
 
     def _dispatch_tool(name: str, args: dict) -> str:
-        """Execute a tool call and return result as string."""
+        """Execute a tool call and return result as string, recording its latency."""
+        with metrics.timed("tool", name) as call:
+            result = _run_tool(name, args)
+            if result.startswith("Tool error") or result == "Unknown tool.":
+                call.fail()
+        return result
+
+    def _run_tool(name: str, args: dict) -> str:
         try:
             if name == "web_search":
                 from core_os.actions import web_search
@@ -1029,16 +1043,20 @@ async def ocr_endpoint():
         frame_path = capture_frame()
         if not frame_path:
             return {"text": "", "error": "No visual input available (no USB cam, tablet, or display)"}
-        reader = _ocr_reader
-        if reader is None:
-            import easyocr
-            reader = easyocr.Reader(['en'], gpu=False, verbose=False)
-        results = reader.readtext(frame_path)
+        loop = asyncio.get_event_loop()
+        results = await loop.run_in_executor(None, ocr_cache.readtext, frame_path, "camera")
         text = "\n".join(r[1] for r in results)
         return {"text": text}
+    except OCRBusy as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         return {"text": "", "error": str(e)}
 
+@app.get("/api/ocr/status")
+async def ocr_status():
+    """Shared OCR engine (reader state, queue depth, batching) and tile cache hit rates."""
+    return {**ocr.status(), "cache": ocr_cache.stats()}
+
 
 # ── Computer Use ──────────────────────────────────────────────────────────────
 class ComputerActionRequest(BaseModel):
@@ -1110,23 +1128,16 @@ async def computer_run_agent(task: str, max_steps: int = 20):
     Each event is a JSON step dict.
     """
     from core_os.skills.computer_use_agent import run_agent
+    from core_os.stream_bridge import iterate_in_thread
 
-    def _event_stream():
-        import concurrent.futures
-        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
-            future = pool.submit(lambda: list(run_agent(task, max_steps)))
-            steps = future.result(timeout=300)
-        for step in steps:
-            yield f"data: {json.dumps(step)}\n\n"
-        yield "data: [DONE]\n\n"
-
-    # Run synchronously in thread to avoid blocking event loop during vision calls
+    # The agent runs on its own thread; each step is sent as soon as it is produced
+    # and a client disconnect closes the generator before the next step starts.
     async def _async_stream():
-        loop = asyncio.get_event_loop()
-        steps_future = loop.run_in_executor(None, lambda: list(run_agent(task, max_steps)))
-        steps = await steps_future
-        for step in steps:
-            yield f"data: {json.dumps(step)}\n\n"
+        try:
+            async for step in iterate_in_thread(lambda: run_agent(task, max_steps), name="computer-agent"):
+                yield f"data: {json.dumps(step)}\n\n"
+        except Exception as e:
+            yield f"data: {json.dumps({'error': f'Agent crashed: {e}'})}\n\n"
         yield "data: [DONE]\n\n"
 
     return StreamingResponse(
@@ -1181,30 +1192,20 @@ async def macro_status():
 @app.get("/api/computer/screenshot")
 async def computer_screenshot(scale: float = 0.5, x: int = 0, y: int = 0, w: int = 0, h: int = 0):
     """Return a base64 screenshot, optionally cropped to a region."""
-    import tempfile, subprocess as _sp, base64 as _b64
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        path = f.name
-    env = {**os.environ, "DISPLAY": os.getenv("DISPLAY", ":0.0")}
-    try:
-        _sp.run(["gnome-screenshot", "-f", path], timeout=5, check=True, env=env)
-    except Exception:
-        _sp.run(["import", "-window", "root", path], timeout=5, check=True, env=env)
-    if w > 0 and h > 0:
-        cropped = path.replace(".png", "_c.png")
-        _sp.run(["convert", path, "-crop", f"{w}x{h}+{x}+{y}", "+repage", cropped], timeout=5)
-        if os.path.exists(cropped):
-            os.unlink(path)
-            path = cropped
-    if scale < 1.0:
-        scaled = path.replace(".png", "_s.png")
-        _sp.run(["convert", path, "-resize", f"{int(scale*100)}%", scaled], timeout=5)
-        if os.path.exists(scaled):
-            os.unlink(path)
-            path = scaled
-    with open(path, "rb") as f:
-        b64 = _b64.b64encode(f.read()).decode()
-    os.unlink(path)
-    return {"screenshot": b64}
+    from core_os.screen_capture import screen
+    def _grab():
+        frame = screen.grab(max_age_ms=0)   # explicit request: never a buffered frame
+        if frame is None:
+            raise HTTPException(status_code=503, detail="Screen capture unavailable")
+        return frame.b64(scale=scale, region=(x, y, w, h) if w > 0 and h > 0 else None)
+    loop = asyncio.get_event_loop()
+    return {"screenshot": await loop.run_in_executor(None, _grab)}
+
+@app.get("/api/computer/screen/status")
+async def computer_screen_status():
+    """Capture backend, ring buffer occupancy and reuse counters."""
+    from core_os.screen_capture import screen
+    return screen.status()
 
 
 @app.get("/api/control/mcp")
@@ -1307,9 +1308,23 @@ async def api_list_skills():
 async def api_install_skill(req: SkillInstallRequest):
     if not _skills_available:
         return {"ok": False, "message": "SkillManager not loaded"}
-    loop = asyncio.get_event_loop()
-    result = await loop.run_in_executor(None, install_from_github, req.url)
-    return result
+    # Runs in the background; poll /api/skills/jobs/{id} for progress
+    return {"ok": True, "job": install_async(req.url)}
+
+@app.get("/api/skills/jobs")
+async def api_skill_install_jobs():
+    if not _skills_available:
+        return {"jobs": [], "error": "SkillManager not loaded"}
+    return {"jobs": list_install_jobs()}
+
+@app.get("/api/skills/jobs/{job_id}")
+async def api_skill_install_job(job_id: str):
+    if not _skills_available:
+        return {"ok": False, "error": "SkillManager not loaded"}
+    job = install_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"No install job {job_id}")
+    return job
 
 @app.post("/api/skills/{name}/run")
 async def api_run_skill(name: str, req: SkillRunRequest):
@@ -1319,6 +1334,30 @@ async def api_run_skill(name: str, req: SkillRunRequest):
     result = await loop.run_in_executor(None, execute_skill, name, req.payload)
     return result
 
+@app.post("/api/skills/{name}/cancel")
+async def api_cancel_skill(name: str):
+    if not _skills_available:
+        return {"ok": False, "error": "SkillManager not loaded"}
+    return cancel_skill(name)
+
+@app.get("/api/skills/cache")
+async def api_skill_cache():
+    if not _skills_available:
+        return {"ok": False, "error": "SkillManager not loaded"}
+    return skill_cache_stats()
+
+@app.delete("/api/skills/cache")
+async def api_clear_skill_cache(name: str = None):
+    if not _skills_available:
+        return {"ok": False, "error": "SkillManager not loaded"}
+    return invalidate_skill_cache(name)
+
+@app.get("/api/skills/workers")
+async def api_skill_workers():
+    if not _skills_available:
+        return {"ok": False, "error": "SkillManager not loaded"}
+    return skill_pool_status()
+
 @app.put("/api/skills/{name}/toggle")
 async def api_toggle_skill(name: str, req: SkillToggleRequest):
     if not _skills_available:
@@ -1912,20 +1951,32 @@ async def neuro_patch(updates: dict):
 # ---------------------------------------------------------------------------
 # VISION / IMAGE ANALYSIS
 # ---------------------------------------------------------------------------
+@app.get("/api/vision/models")
+async def vision_models_status():
+    """Health of each vision model in the fallback chain and which one calls start with."""
+    from core_os.skills.milla_vision import vision_models
+    return vision_models.status()
+
+@app.get("/api/vision/cache")
+async def vision_cache_stats():
+    """Hit / near-hit / miss counts of the perceptual-hash vision result cache."""
+    from core_os.vision_cache import vision_cache
+    return vision_cache.stats()
+
+@app.delete("/api/vision/cache")
+async def vision_cache_clear():
+    from core_os.vision_cache import vision_cache
+    vision_cache.clear()
+    return {"ok": True}
+
 @app.post("/api/vision/analyze")
 async def vision_analyze(image: UploadFile = File(...), prompt: str = "Describe what you see in detail."):
-    import shutil
-    suffix = ".jpg"
-    if image.filename and "." in image.filename:
-        suffix = "." + image.filename.rsplit(".", 1)[1].lower()
-    tmp = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
     try:
-        shutil.copyfileobj(image.file, tmp)
-        tmp.close()
+        img_bytes = await image.read()
         loop = asyncio.get_event_loop()
         from core_os.skills.milla_vision import analyze_visuals
         description = await asyncio.wait_for(
-            loop.run_in_executor(None, lambda: analyze_visuals(tmp.name, prompt)),
+            loop.run_in_executor(None, lambda: analyze_visuals(img_bytes, prompt)),
             timeout=60
         )
         return {"ok": True, "description": description}
@@ -1933,9 +1984,26 @@ async def vision_analyze(image: UploadFile = File(...), prompt: str = "Describe
         return {"ok": False, "description": "Vision timed out — moondream model may be loading"}
     except Exception as e:
         return {"ok": False, "description": f"Vision error: {e}"}
-    finally:
-        try: os.unlink(tmp.name)
-        except Exception: pass
+
+@app.get("/api/vision/prep")
+async def vision_prep_stats():
+    """Bytes in / out / saved by in-memory image preprocessing, per vision model."""
+    from core_os.image_prep import prep_stats
+    return prep_stats()
+
+
+@app.get("/api/vision/cameras")
+async def vision_cameras():
+    """Background camera readers: frames read, opens, frame age and idle time per source."""
+    from core_os.camera_manager import cameras
+    return cameras.status()
+
+
+@app.get("/api/vision/history")
+async def vision_history(limit: int = 20):
+    """Most recent vision descriptions, oldest first."""
+    from core_os.memory.vision_history import get_vision_history
+    return {"history": get_vision_history().recent(limit)}
 
 # ---------------------------------------------------------------------------
 # SYSTEM UPDATER
@@ -1958,24 +2026,20 @@ async def vision_screen_chat(req: ScreenChatRequest):
     if not req.image:
         return {"ok": False, "error": "No image provided"}
 
-    # Decode base64 → temp file
+    # Decode base64 in memory; analyze_visuals resizes it per model without a tempfile
     try:
         raw = req.image.split(",", 1)[-1]  # strip data:image/png;base64, prefix if present
         img_bytes = _b64.b64decode(raw)
     except Exception as e:
         return {"ok": False, "error": f"Image decode failed: {e}"}
 
-    tmp = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
     try:
-        tmp.write(img_bytes)
-        tmp.close()
-
         loop = asyncio.get_event_loop()
 
         # Step 1: moondream describes the screen
         from core_os.skills.milla_vision import analyze_visuals
         vision_desc = await asyncio.wait_for(
-            loop.run_in_executor(None, lambda: analyze_visuals(tmp.name, req.message)),
+            loop.run_in_executor(None, lambda: analyze_visuals(img_bytes, req.message)),
             timeout=60
         )
 
@@ -2000,9 +2064,6 @@ async def vision_screen_chat(req: ScreenChatRequest):
         return {"ok": False, "error": "Vision timed out — moondream loading"}
     except Exception as e:
         return {"ok": False, "error": str(e)}
-    finally:
-        try: os.unlink(tmp.name)
-        except Exception: pass
 
 # ---------------------------------------------------------------------------
 # SYSTEM UPDATER
@@ -2123,6 +2184,16 @@ async def docker_logs(container: str, tail: int = 50):
 # ═══════════════════════════════════════════════════════
 # SYSTEM STATS
 # ═══════════════════════════════════════════════════════
+@app.get("/api/metrics/calls")
+async def call_metrics(kind: str = None):
+    """Latency histograms and rolling percentiles per skill / tool / dynamic_tool."""
+    return metrics.snapshot(kind)
+
+@app.get("/api/system/startup")
+async def startup_report():
+    """Durations of the boot phases (OCR preload, skill manifest, ...) of this process."""
+    return startup.report()
+
 @app.get("/api/system/stats")
 async def system_stats():
     loop = asyncio.get_event_loop()
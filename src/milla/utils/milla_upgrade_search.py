@@ -10,7 +10,6 @@ sys.path.insert(0, str(PROJECT_ROOT))
 
 try:
     from core_os.actions import web_search
-    from core_os.memory.agent_memory import memory
     from core_os.skills.auto_lib import model_manager
 except ImportError:
     print("[Error] Could not import core_os modules.")
@@ -97,7 +96,8 @@ def save_findings(sys_updates: str, summary: str, raw_results: list):
     # 3. Store as a memory observation so Milla can recall it
     if summary:
         try:
-            memory.add_observation("NexusKingdom", f"Tech Radar {timestamp}: {summary[:500]}")
+            from core_os.memory.graph_store import get_graph
+            get_graph().add_observations([("NexusKingdom", f"Tech Radar {timestamp}: {summary[:500]}")])
         except Exception:
             pass
 
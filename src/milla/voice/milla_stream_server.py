@@ -23,6 +23,7 @@ import main
 HOST = "0.0.0.0"
 PORT = 9000
 POLL_INTERVAL = 1.0
+MAIL_MAX_WAIT = 30.0
 
 
 def _load_lines() -> list[dict]:
@@ -120,9 +121,17 @@ class StreamHandler(BaseHTTPRequestHandler):
         
         if parsed.path == "/api/mail":
             if not memory: return self._send_json({"error": "Memory core offline"}, status=500)
-            mail = memory.fetch_mail("mobile")
+            # ?wait=N long-polls up to N seconds (capped) instead of the client re-polling
+            query = parse_qs(parsed.query)
+            try: wait = min(float(query.get("wait", ["0"])[0]), MAIL_MAX_WAIT)
+            except ValueError: wait = 0.0
+            # ?limit=N caps the batch; "remaining" tells the client to fetch again right away
+            try: limit = int(query["limit"][0]) if "limit" in query else None
+            except ValueError: limit = None
+            mail = memory.fetch_mail("mobile", wait=wait, limit=limit)
             formatted_mail = [{"id": m[0], "role": m[1], "content": m[2], "timestamp": str(m[3])} for m in mail]
-            return self._send_json({"status": "ok", "mail": formatted_mail})
+            remaining = memory.pending_mail("mobile") if limit is not None else 0
+            return self._send_json({"status": "ok", "mail": formatted_mail, "remaining": remaining})
 
         if parsed.path == "/" or parsed.path == "/mobile_link.html":
             try:
@@ -0,0 +1,67 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parents[2].resolve()
+
+# Importing the package must not pull any of these in
+HEAVY = ("easyocr", "torch", "tkinter", "pyautogui", "pynput", "speech_recognition", "duckduckgo_search", "ollama")
+BUDGET_SEC = float(os.getenv("BENCH_ACTIONS_IMPORT_BUDGET", "1.0"))
+RUNS = 5
+
+PROBE = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+import core_os.actions
+elapsed = time.perf_counter() - t0
+print(json.dumps({
+    "elapsed": elapsed,
+    "maxrss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "heavy": [m for m in %r if m in sys.modules],
+}))
+""" % (HEAVY,)
+
+
+def log(msg):
+    print(f"[*] [ImportBench]: {msg}")
+
+
+def measure(env: dict = None) -> dict:
+    """Imports core_os.actions in a fresh interpreter and reports time, RSS and heavy modules loaded."""
+    out = subprocess.run([sys.executable, "-c", PROBE], cwd=ROOT, capture_output=True, text=True, timeout=120,
+                         env={**os.environ, **(env or {})})
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1] if out.stderr.strip() else "import failed")
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(limit: int = 8):
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", "import core_os.actions"],
+                         cwd=ROOT, capture_output=True, text=True, timeout=120)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line.split("|")
+        rows.append((int(cumulative_us), name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+def run_bench():
+    results = [measure() for _ in range(RUNS)]
+    best = min(r["elapsed"] for r in results)
+    rss = max(r["maxrss_kb"] for r in results)
+    heavy = sorted({m for r in results for m in r["heavy"]})
+    log(f"import core_os.actions: best {best * 1e3:.0f} ms over {RUNS} runs, peak RSS {rss / 1024:.0f} MB")
+    for cumulative_us, name in slowest_imports():
+        log(f"  {cumulative_us / 1e3:8.1f} ms  {name}")
+    if heavy:
+        log(f"Heavy modules imported eagerly: {', '.join(heavy)}")
+    return best, heavy
+
+
+if __name__ == "__main__":
+    best, heavy = run_bench()
+    sys.exit(0 if best <= BUDGET_SEC and not heavy else 1)
@@ -0,0 +1,69 @@
+import os
+import sys
+import time
+import random
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2].resolve()))
+
+from core_os.memory.graph_store import GraphStore
+
+N_ENTITIES = int(os.getenv("BENCH_ENTITIES", "20000"))
+N_EDGES = int(os.getenv("BENCH_EDGES", "120000"))
+N_LOOKUPS = 2000
+RELATIONS = ["knows", "owns", "mentions", "runs_on", "depends_on"]
+
+
+def log(msg):
+    print(f"[*] [GraphBench]: {msg}")
+
+
+def legacy_scan(conn, name):
+    """What a neighbour lookup costs against the old kg:relation:* key/value rows."""
+    return conn.execute("SELECT k FROM mem WHERE k LIKE ?", (f"kg:relation:{name}:%",)).fetchall()
+
+
+def run_bench():
+    tmp = tempfile.mkdtemp()
+    graph = GraphStore(os.path.join(tmp, "graph.db"))
+    rng = random.Random(7)
+    names = [f"entity_{i}" for i in range(N_ENTITIES)]
+    edges = [(rng.choice(names), rng.choice(RELATIONS), rng.choice(names)) for _ in range(N_EDGES)]
+
+    t0 = time.perf_counter()
+    with graph.batch():
+        graph.add_entities((n, "bench") for n in names)
+        graph.add_relations(edges)
+    log(f"Batched insert: {graph.stats()} in {time.perf_counter() - t0:.2f}s")
+
+    probes = [rng.choice(names) for _ in range(N_LOOKUPS)]
+    t0 = time.perf_counter()
+    hits = sum(len(graph.neighbors(p, direction="both")) for p in probes)
+    per = (time.perf_counter() - t0) / N_LOOKUPS * 1e6
+    log(f"Neighbour lookup (both directions): {per:.1f} us/query, {hits / N_LOOKUPS:.1f} avg neighbours")
+
+    t0 = time.perf_counter()
+    reached = sum(len(graph.traverse(p, max_depth=2)) for p in probes[:200])
+    log(f"2-hop traversal: {(time.perf_counter() - t0) / 200 * 1e3:.2f} ms/query, {reached / 200:.0f} avg nodes")
+
+    plan = graph.conn.execute(
+        "EXPLAIN QUERY PLAN SELECT target_id FROM edges WHERE target_id = 1").fetchall()
+    log(f"Reverse lookup plan: {plan[0][-1]}")
+
+    # Baseline: the same edges as kg:relation:* keys in a mem-style table
+    import sqlite3
+    legacy = sqlite3.connect(os.path.join(tmp, "legacy.db"))
+    legacy.execute("CREATE TABLE mem (k TEXT PRIMARY KEY, v TEXT, t DATETIME)")
+    legacy.executemany("INSERT OR IGNORE INTO mem VALUES (?, 'exists', NULL)",
+                       [(f"kg:relation:{s}:{r}:{t}",) for s, r, t in edges])
+    legacy.commit()
+    t0 = time.perf_counter()
+    for p in probes[:200]:
+        legacy_scan(legacy, p)
+    log(f"Legacy kv key scan: {(time.perf_counter() - t0) / 200 * 1e6:.1f} us/query (outgoing only)")
+    return per
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_bench() < 1000 else 1)
@@ -0,0 +1,84 @@
+import os
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2].resolve()))
+
+from core_os.screen_capture import ScreenCapture, _MSSBackend, _grab_external, _grab_pil
+
+RUNS = int(os.getenv("BENCH_SCREEN_RUNS", "20"))
+VFB_DISPLAY = ":97"
+VFB_SIZE = "1920x1080x24"
+
+
+def log(msg):
+    print(f"[*] [ScreenBench]: {msg}")
+
+
+def start_framebuffer():
+    """Starts Xvfb on VFB_DISPLAY when no display is available; returns the process (or None)."""
+    if os.getenv("DISPLAY") and not os.getenv("BENCH_SCREEN_XVFB"):
+        return None
+    if not shutil.which("Xvfb"):
+        return None
+    proc = subprocess.Popen(["Xvfb", VFB_DISPLAY, "-screen", "0", VFB_SIZE, "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ["DISPLAY"] = VFB_DISPLAY
+    time.sleep(1.0)
+    return proc
+
+
+def time_backend(backend, runs=RUNS):
+    capture = ScreenCapture(backends=[backend], fresh_ms=0)
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        frame = capture.grab()
+        if frame is None:
+            return None, capture.status()["failed_backends"]
+        frame.b64(scale=0.5)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return timings[len(timings) // 2], frame.size
+
+
+def time_reuse(backend, consumers=8):
+    """Eight consumers asking within the freshness window share one capture."""
+    capture = ScreenCapture(backends=[backend], fresh_ms=250)
+    started = time.perf_counter()
+    for _ in range(consumers):
+        capture.grab()
+    return (time.perf_counter() - started) * 1000, capture.status()
+
+
+def run_bench():
+    xvfb = start_framebuffer()
+    results = {}
+    try:
+        log(f"DISPLAY={os.getenv('DISPLAY')} ({'Xvfb ' + VFB_SIZE if xvfb else 'existing display'})")
+        for name, backend in (("mss", _MSSBackend()), ("pil", _grab_pil), ("external", _grab_external)):
+            median, info = time_backend(backend, runs=RUNS if name != "external" else max(3, RUNS // 4))
+            if median is None:
+                log(f"{name:<9} unavailable: {info}")
+                continue
+            results[name] = median
+            log(f"{name:<9} capture + 50% PNG encode: median {median:7.1f} ms ({info[0]}x{info[1]})")
+        if results:
+            best = min(results, key=results.get)
+            elapsed, status = time_reuse({"mss": _MSSBackend(), "pil": _grab_pil, "external": _grab_external}[best])
+            log(f"8 consumers within freshness window: {elapsed:.1f} ms total, "
+                f"{status['captures']} capture(s), {status['reused']} reused")
+            if "external" in results and best != "external":
+                log(f"In-process speed-up over gnome-screenshot/import: {results['external'] / results[best]:.1f}x")
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    return results
+
+
+if __name__ == "__main__":
+    results = run_bench()
+    sys.exit(0 if results else 1)
@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import random
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[2].resolve()))
+
+from core_os.memory.threaded_memory import ThreadedMemory
+
+N_ROWS = int(os.getenv("BENCH_THREADS", "300000"))
+N_QUERIES = 200
+TOPICS = ["Identity", "Storm", "Pearl Leaf", "Mayhem", "The Tree", "Dreams", "Nexus", "Arena", "Covenant", "Rain"]
+WORDS = "glitch resonance scaffold texture bridge signal memory echo ritual heartbeat lattice ember".split()
+
+
+def log(msg):
+    print(f"[*] [ThreadBench]: {msg}")
+
+
+def run_bench():
+    db = os.path.join(tempfile.mkdtemp(), "threaded_memory.db")
+    store = ThreadedMemory(db)
+    rng = random.Random(11)
+    start = datetime(2026, 1, 1)
+    rows = [
+        (f"{rng.choice(TOPICS)} {i % 5000}", " ".join(rng.choices(WORDS, k=30)), rng.random(), start + timedelta(seconds=i))
+        for i in range(N_ROWS)
+    ]
+    t0 = time.perf_counter()
+    store.cursor.executemany("INSERT INTO threads (topic, content, valence, timestamp) VALUES (?, ?, ?, ?)", rows)
+    store.conn.commit()
+    log(f"Inserted {N_ROWS} threads (FTS via triggers, mode={store.fts_mode}) in {time.perf_counter() - t0:.1f}s")
+
+    probes = [f"{rng.choice(TOPICS)} {rng.randrange(5000)}" for _ in range(N_QUERIES)]
+
+    t0 = time.perf_counter()
+    for p in probes:
+        store.retrieve_relevant(p)
+    fts = (time.perf_counter() - t0) / N_QUERIES * 1e3
+    log(f"retrieve_relevant (FTS): {fts:.2f} ms/query")
+
+    raw = sqlite3.connect(db)
+    t0 = time.perf_counter()
+    for p in probes[:20]:
+        raw.execute("SELECT content, timestamp FROM threads WHERE topic LIKE ? ORDER BY timestamp DESC LIMIT 3",
+                    (f"%{p}%",)).fetchall()
+    like = (time.perf_counter() - t0) / 20 * 1e3
+    log(f"Legacy LIKE scan:        {like:.2f} ms/query ({like / fts:.0f}x slower)")
+
+    t0 = time.perf_counter()
+    for _ in range(N_QUERIES):
+        store.get_recent_threads()
+    log(f"get_recent_threads (timestamp index): {(time.perf_counter() - t0) / N_QUERIES * 1e3:.3f} ms/query")
+    return fts, like
+
+
+if __name__ == "__main__":
+    fts, like = run_bench()
+    sys.exit(0 if fts < like else 1)
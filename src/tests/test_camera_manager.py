@@ -0,0 +1,119 @@
+import importlib.util
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+from core_os.camera_manager import CameraManager, open_capture
+
+HAS_CV2 = importlib.util.find_spec("cv2") is not None and importlib.util.find_spec("numpy") is not None
+
+
+class FakeCapture:
+    """VideoCapture stand-in: numbered frames, optionally failing after `fail_after` reads."""
+
+    opens = 0
+
+    def __init__(self, fail_after=None):
+        FakeCapture.opens += 1
+        self.reads = 0
+        self.fail_after = fail_after
+        self.released = threading.Event()
+
+    def read(self):
+        self.reads += 1
+        if self.fail_after is not None and self.reads > self.fail_after:
+            return False, None
+        return True, ("frame", FakeCapture.opens, self.reads)
+
+    def release(self):
+        self.released.set()
+
+
+class TestCameraManager(unittest.TestCase):
+
+    def setUp(self):
+        FakeCapture.opens = 0
+        self.manager = CameraManager(idle_timeout=30, max_fps=200, warmup=2)
+
+    def tearDown(self):
+        self.manager.release_all()
+
+    def test_frames_come_from_one_open_capture(self):
+        first = self.manager.frame("usb:0", FakeCapture, timeout=2)
+        self.assertIsNotNone(first)
+        time.sleep(0.05)
+        second = self.manager.frame("usb:0", FakeCapture, timeout=2)
+        self.assertEqual(FakeCapture.opens, 1)
+        self.assertGreater(second[2], first[2])
+        status = self.manager.status()["usb:0"]
+        self.assertTrue(status["alive"])
+        self.assertEqual(status["opens"], 1)
+
+    def test_idle_source_is_released_and_reopened(self):
+        manager = CameraManager(idle_timeout=0.1, max_fps=200, warmup=0)
+        caps = []
+
+        def opener():
+            caps.append(FakeCapture())
+            return caps[-1]
+
+        self.assertIsNotNone(manager.frame("rtsp:x", opener, timeout=2))
+        self.assertTrue(caps[0].released.wait(2))
+        time.sleep(0.05)
+        self.assertFalse(manager.status()["rtsp:x"]["alive"])
+        self.assertIsNotNone(manager.frame("rtsp:x", opener, timeout=2))
+        self.assertEqual(len(caps), 2)
+        manager.release_all()
+
+    def test_read_failures_trigger_reopen(self):
+        urls = []
+
+        def opener():
+            urls.append(f"rtsp://cam/token{len(urls)}")    # a fresh URL per open, like SDM
+            return FakeCapture(fail_after=3)
+
+        self.assertIsNotNone(self.manager.frame("nest:cam", opener, timeout=2))
+        deadline = time.monotonic() + 3
+        while len(urls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertGreaterEqual(len(urls), 2)
+
+    def test_failed_open_reports_no_frame(self):
+        def opener():
+            raise RuntimeError("camera unplugged")
+
+        self.assertIsNone(self.manager.frame("usb:9", opener, timeout=0.2))
+        self.assertIn("camera unplugged", self.manager.status()["usb:9"]["last_error"])
+
+    def test_stale_frame_is_not_returned(self):
+        stuck = threading.Event()
+
+        class StuckCapture(FakeCapture):
+            def read(self):
+                if self.reads >= 3:    # two warmup reads, then one real frame
+                    stuck.wait(5)
+                return super().read()
+
+        src = self.manager.source("usb:1", StuckCapture)
+        self.assertIsNotNone(src.latest(timeout=2))
+        time.sleep(0.1)
+        self.assertIsNone(src.latest(timeout=2, max_age=0.05))
+        stuck.set()
+
+    @unittest.skipUnless(HAS_CV2, "opencv/numpy not installed")
+    def test_video_file_source(self):
+        import cv2
+        import numpy as np
+        path = os.path.join(tempfile.mkdtemp(), "clip.avi")
+        writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+        for i in range(20):
+            writer.write(np.full((48, 64, 3), i * 10, dtype=np.uint8))
+        writer.release()
+        frame = self.manager.frame("file:clip", lambda: open_capture(path), timeout=3)
+        self.assertEqual(frame.shape, (48, 64, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
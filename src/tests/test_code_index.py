@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from core_os.memory import code_index
+from core_os.memory.code_index import CodeSearchIndex, required_literals
+
+
+class TestCodeSearchIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        for i in range(40):
+            (self.root / f"mod_{i}.py").write_text(f"def helper_{i}():\n    return {i}\n")
+        (self.root / "target.py").write_text("class SemanticMemory:\n    def get_embedding(self): pass\n")
+        self.index = CodeSearchIndex(self.root / "code_index.db", workers=2)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _files(self):
+        return sorted(self.root.glob("*.py"))
+
+    def test_required_literals(self):
+        self.assertEqual(required_literals("SemanticMemory"), ["SemanticMemory"])
+        self.assertEqual(required_literals(r"(class|def)\s+.*get_embedding"), ["get_embedding"])
+        self.assertEqual(required_literals("foo(bar)?baz"), ["foo", "baz"])
+        self.assertEqual(required_literals("a|b"), [])
+        self.assertEqual(required_literals("("), [])
+
+    def test_candidates_narrow_to_matching_files(self):
+        stats = self.index.update(self._files())
+        self.assertEqual(stats["reindexed"], 41)
+        self.assertEqual(self.index.candidates("semanticmemory"), [str(self.root / "target.py")])
+        self.assertEqual(len(self.index.candidates(r"helper_\d")), 40)
+        self.assertIsNone(self.index.candidates("x|y"))
+
+    def test_update_is_incremental(self):
+        self.index.update(self._files())
+        self.assertEqual(self.index.update(self._files())["reindexed"], 0)
+        target = self.root / "target.py"
+        target.write_text("class EpisodicMemory:\n    pass\n")
+        os.utime(target, (1, 1))
+        self.assertEqual(self.index.update(self._files())["reindexed"], 1)
+        self.assertEqual(self.index.candidates("SemanticMemory"), [])
+        (self.root / "mod_0.py").unlink()
+        self.assertEqual(self.index.update(self._files())["removed"], 1)
+
+    def test_oversized_files_are_always_candidates(self):
+        big = self.root / "big.py"
+        big.write_text("x" * 10)
+        original = code_index.MAX_FILE_BYTES
+        code_index.MAX_FILE_BYTES = 5
+        try:
+            self.index.update(self._files())
+            self.assertIn(str(big), self.index.candidates("SemanticMemory"))
+        finally:
+            code_index.MAX_FILE_BYTES = original
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+import json
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from core_os.screen_settle import ScreenSettler
+
+try:
+    from core_os.skills import computer_use_agent
+except ImportError:     # pyautogui needs a display; requests/dotenv may be missing
+    computer_use_agent = None
+
+
+class FakeImage:
+    def __init__(self, content: bytes):
+        self.content = content
+
+    def tobytes(self):
+        return self.content
+
+
+class FakeFrame:
+    """A captured screen whose b64 payload is its content, so tests can see what the model was sent."""
+
+    def __init__(self, content: bytes):
+        self.image = FakeImage(content)
+
+    def b64(self, scale=1.0):
+        return self.image.content.decode()
+
+
+class FakeDesktop:
+    """Screen whose perceptual signature never changes: the edits are too small for a whole-screen dhash."""
+
+    def __init__(self):
+        self.content = b"prompt $ "
+        self.now = 0.0
+
+    def grab(self):
+        return FakeFrame(self.content)
+
+    def execute(self, action):
+        if action["action"] == "type":
+            self.content += action["args"]["text"].encode()
+        return "ok"
+
+    def settler(self, **kw):
+        return ScreenSettler(grab=self.grab, signature=lambda frame: 0, clock=lambda: self.now,
+                             sleep=self.sleep, tolerance=2, **kw)
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+class ScriptedModel:
+    """Returns the scripted actions in order and records the screenshot sent with each call."""
+
+    def __init__(self, actions):
+        self.actions = list(actions)
+        self.seen = []
+        self.default_model = "scripted"
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    def _get_client(self):
+        return self
+
+    def create(self, messages, **kw):
+        image = messages[-1]["content"][0]["image_url"]["url"]
+        self.seen.append(image.split(",", 1)[1])
+        content = json.dumps(self.actions.pop(0))
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+@unittest.skipIf(computer_use_agent is None, "computer-use dependencies not installed")
+class TestComputerUseAgent(unittest.TestCase):
+
+    def run_agent(self, actions):
+        desktop, model = FakeDesktop(), ScriptedModel(actions)
+        with mock.patch.object(computer_use_agent, "UnifiedModelManager", return_value=model), \
+                mock.patch.object(computer_use_agent, "ScreenSettler", side_effect=desktop.settler), \
+                mock.patch.object(computer_use_agent, "execute_action", side_effect=desktop.execute), \
+                mock.patch.object(computer_use_agent, "take_screenshot", return_value=""):
+            steps = list(computer_use_agent.run_agent("list files", max_steps=len(actions)))
+        return model, steps
+
+    def test_small_edit_after_action_sends_new_screenshot(self):
+        model, steps = self.run_agent([
+            {"action": "type", "args": {"text": "ls"}, "reasoning": "list"},
+            {"action": "done", "args": {"result": "listed"}, "reasoning": "done"},
+        ])
+        self.assertEqual(model.seen, ["prompt $ ", "prompt $ ls"])
+        self.assertFalse(steps[1]["screen_changed"])     # the dhash saw nothing; the payload still moved on
+
+    def test_identical_frame_after_passive_action_is_reused(self):
+        model, steps = self.run_agent([
+            {"action": "wait", "args": {"seconds": 1}, "reasoning": "loading"},
+            {"action": "done", "args": {"result": "loaded"}, "reasoning": "done"},
+        ])
+        self.assertEqual(model.seen, ["prompt $ ", "prompt $ "])
+        self.assertEqual(steps[-1]["stats"]["gated_steps"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import os
+import json
+import sqlite3
+import tempfile
+import unittest
+
+from core_os.memory.corpus_indexer import CorpusIndexer, chunk_text
+
+
+def fake_embed(texts):
+    return [[float(len(t)), 1.0, 0.0] for t in texts]
+
+
+class TestCorpusIndexer(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = self.tmp.name
+        os.makedirs(os.path.join(root, "thought_archives"))
+        with open(os.path.join(root, "shared_chat.jsonl"), "w") as f:
+            f.write(json.dumps({"role": "user", "content": "Tell me about the rain."}) + "\n")
+            f.write(json.dumps({"role": "assistant", "content": "The rain hums on the roof."}) + "\n")
+        with open(os.path.join(root, "thought_archives", "2026-01-01_run.md"), "w") as f:
+            f.write("# Run\n\n" + " ".join(f"Archived thought {i}." for i in range(300)))
+        with open(os.path.join(root, "dreams.txt"), "w") as f:
+            f.write("=== DREAM FRAGMENT: 1 ===\nsemicolons\n=== DREAM FRAGMENT: 2 ===\nlibrary books\n")
+        with open(os.path.join(root, "stream_of_consciousness.md"), "w") as f:
+            f.write("first entry\n---\nsecond entry\n")
+        conn = sqlite3.connect(os.path.join(root, "milla_long_term.db"))
+        conn.execute("CREATE VIRTUAL TABLE memories USING fts5(fact, category, topic, is_genesis_era, is_historical_log)")
+        conn.execute("INSERT INTO memories VALUES ('Dray likes storms', 'pref', 'weather', '0', '0')")
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _indexer(self, embed_fn=fake_embed):
+        return CorpusIndexer(memory_dir=self.tmp.name, embed_fn=embed_fn, batch_size=2, workers=2,
+                             checkpoint_every=1)
+
+    def test_chunk_text_overlaps_long_text(self):
+        chunks = chunk_text("word " * 1000, size=300, overlap=50)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(c) <= 300 for c in chunks))
+
+    def test_full_build_covers_every_corpus(self):
+        stats = self._indexer().run()
+        with open(os.path.join(self.tmp.name, "semantic_index.json")) as f:
+            index = json.load(f)
+        types = {e["type"].split(":")[0] for e in index}
+        self.assertEqual(types, {"chat", "archive", "dream", "stream", "LTM"})
+        self.assertEqual(stats["embedded"], len(index))
+        self.assertEqual(stats["skip_ratio"], 0.0)
+
+    def test_rerun_skips_unchanged_chunks(self):
+        self._indexer().run()
+        calls = []
+        stats = self._indexer(lambda texts: calls.append(texts) or fake_embed(texts)).run()
+        self.assertEqual(calls, [])
+        self.assertEqual(stats["skip_ratio"], 1.0)
+
+    def test_failed_embeddings_are_retried_next_run(self):
+        stats = self._indexer(lambda texts: [None] * len(texts)).run()
+        self.assertEqual(stats["embedded"], 0)
+        stats = self._indexer().run()
+        self.assertEqual(stats["skipped"], 0)
+        self.assertGreater(stats["embedded"], 0)
+
+    def test_prune_drops_removed_sources_but_keeps_ad_hoc_entries(self):
+        index_path = os.path.join(self.tmp.name, "semantic_index.json")
+        with open(index_path, "w") as f:
+            json.dump([{"content": "ad hoc", "source": "manual", "type": "note", "vector": [1.0]}], f)
+        self._indexer().run()
+        os.remove(os.path.join(self.tmp.name, "dreams.txt"))
+        self._indexer().run()
+        with open(index_path) as f:
+            index = json.load(f)
+        self.assertIn("note", {e["type"] for e in index})
+        self.assertNotIn("dream", {e["type"] for e in index})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import json
+import sqlite3
+import tempfile
+import unittest
+
+from core_os.memory.graph_store import GraphStore
+
+
+class TestGraphStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.graph = GraphStore(os.path.join(self.tmp.name, "graph.db"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_observations_append_without_rewrite(self):
+        self.graph.add_entity("Milla", "Executive", "Keeps the lights on")
+        self.assertTrue(self.graph.add_observation("Milla", "Dreams between 00:00 and 06:00"))
+        self.assertFalse(self.graph.add_observation("Nobody", "ghost"))
+        entity = self.graph.get_entity("Milla")
+        self.assertEqual(entity["type"], "Executive")
+        self.assertEqual(len(entity["observations"]), 2)
+
+    def test_neighbors_and_multi_hop_traversal(self):
+        with self.graph.batch():
+            self.graph.add_relations([
+                ("Dray", "built", "Milla"),
+                ("Milla", "runs_on", "Nexus"),
+                ("Nexus", "hosts", "Ollama"),
+                ("Ollama", "serves", "Milla"),
+            ])
+        self.assertEqual([n["name"] for n in self.graph.neighbors("Milla")], ["Nexus"])
+        self.assertEqual({n["name"] for n in self.graph.neighbors("Milla", direction="in")}, {"Dray", "Ollama"})
+        walk = {hit["name"]: hit["depth"] for hit in self.graph.traverse("Dray", max_depth=3)}
+        self.assertEqual(walk, {"Milla": 1, "Nexus": 2, "Ollama": 3})
+        self.assertEqual(self.graph.traverse("Dray", max_depth=3, relation="built")[0]["name"], "Milla")
+
+    def test_failed_batch_rolls_back(self):
+        with self.assertRaises(RuntimeError):
+            with self.graph.batch():
+                self.graph.add_relation("A", "knows", "B")
+                raise RuntimeError("boom")
+        self.assertEqual(self.graph.stats()["edges"], 0)
+
+    def test_import_legacy_kv(self):
+        legacy = os.path.join(self.tmp.name, "agent_memory.db")
+        conn = sqlite3.connect(legacy)
+        conn.execute("CREATE TABLE mem (k TEXT PRIMARY KEY, v TEXT, t DATETIME)")
+        conn.executemany("INSERT INTO mem VALUES (?, ?, NULL)", [
+            ("kg:entity:Dray", json.dumps({"type": "Architect", "observations": ["The Storm"]})),
+            ("kg:relation:Dray:owns:Milla", "exists"),
+            ("weather", "rainy"),
+        ])
+        conn.commit()
+        conn.close()
+        counts = self.graph.import_legacy_kv(legacy)
+        self.assertEqual(counts, {"entities": 1, "observations": 1, "relations": 1})
+        self.assertEqual(self.graph.get_entity("Dray")["observations"], ["The Storm"])
+        self.assertEqual(self.graph.neighbors("Dray")[0]["relation"], "owns")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import importlib.util
+import io
+import unittest
+from unittest import mock
+
+from core_os import image_prep
+from core_os.image_prep import prep_stats, prepare, profile_for
+
+HAS_PIL = importlib.util.find_spec("PIL") is not None
+
+
+def png(width, height):
+    from PIL import Image, ImageDraw
+    img = Image.new("RGB", (width, height), "white")
+    draw = ImageDraw.Draw(img)
+    for y in range(0, height, 24):
+        draw.text((10, y), "error: build failed at step %d" % y, fill="black")
+    buf = io.BytesIO()
+    img.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+class TestImagePrep(unittest.TestCase):
+
+    def setUp(self):
+        image_prep._stats.clear()
+
+    def test_passthrough_without_pillow(self):
+        with mock.patch.object(image_prep, "_Image") as lazy:
+            lazy.get.return_value = None
+            out = prepare(b"raw-bytes", "moondream:latest")
+        self.assertEqual(out.data, b"raw-bytes")
+        self.assertFalse(out.changed)
+        self.assertEqual(prep_stats()["moondream:latest"]["bytes_saved"], 0)
+
+    def test_unknown_model_uses_default_profile(self):
+        self.assertEqual(profile_for("some-new-vlm")[0], image_prep.DEFAULT_MAX_SIDE)
+
+    @unittest.skipUnless(HAS_PIL, "Pillow not installed")
+    def test_downsizes_to_model_target(self):
+        from PIL import Image
+        source = png(2560, 1440)
+        out = prepare(source, "moondream:latest")
+        self.assertTrue(out.changed)
+        self.assertEqual(max(out.size), 768)
+        self.assertEqual(Image.open(io.BytesIO(out.data)).size, out.size)
+        self.assertGreater(prep_stats()["moondream:latest"]["bytes_saved"], 0)
+
+    @unittest.skipUnless(HAS_PIL, "Pillow not installed")
+    def test_small_image_is_not_upscaled(self):
+        source = png(320, 200)
+        out = prepare(source, "qwen2.5vl:7b")
+        self.assertEqual(out.size, (320, 200))
+        self.assertLessEqual(len(out.data), len(source))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from core_os.lazy import LazyResource, lazy_module, status
+from src.tests.bench_actions_import import measure
+
+
+class TestLazyResource(unittest.TestCase):
+
+    def test_loads_once_on_first_use(self):
+        calls = []
+        res = LazyResource("thing", lambda: calls.append(1) or "value")
+        self.assertEqual(status({"thing": res}), {"thing": "pending"})
+        self.assertEqual(calls, [])
+        threads = [threading.Thread(target=res.get) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(res.get(), "value")
+        self.assertEqual(calls, [1])
+        self.assertEqual(status({"thing": res}), {"thing": "ready"})
+
+    def test_unavailable_dependency_is_none(self):
+        res = lazy_module("definitely_not_installed_pkg")
+        self.assertIsNone(res.get())
+        self.assertIn("ModuleNotFoundError", res.error)
+
+    def test_module_attribute(self):
+        self.assertIs(lazy_module("json", "dumps").get(), __import__("json").dumps)
+
+
+class TestActionsImport(unittest.TestCase):
+
+    def test_import_pulls_in_no_heavy_dependencies(self):
+        # Laziness is checked through sys.modules in the child, not wall-clock time
+        with tempfile.TemporaryDirectory() as tmp:
+            db = os.path.join(tmp, "agent_memory.db")
+            result = measure(env={"AGENT_MEMORY_DB": db})
+            self.assertTrue(os.path.exists(db))
+        self.assertEqual(result["heavy"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
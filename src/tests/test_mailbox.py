@@ -0,0 +1,95 @@
+import os
+import time
+import tempfile
+import threading
+import unittest
+
+from core_os.memory.mailbox import MailboxQueue
+
+
+class TestMailboxQueue(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.queue = MailboxQueue(os.path.join(self.tmp.name, "agent_memory.db"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_fetch_delivers_once(self):
+        self.queue.post("mobile", "assistant", "hello")
+        mail = self.queue.fetch("mobile")
+        self.assertEqual([m[2] for m in mail], ["hello"])
+        self.assertEqual(self.queue.fetch("mobile"), [])
+
+    def test_drain_returns_everything_past_one_batch(self):
+        self.queue.post_many([("mobile", "assistant", f"m{i}") for i in range(250)])
+        mail = self.queue.drain("mobile", batch=100)
+        self.assertEqual([m[2] for m in mail], [f"m{i}" for i in range(250)])
+        self.assertEqual(self.queue.pending_count("mobile"), 0)
+
+    def test_limited_fetch_leaves_the_rest_pending(self):
+        self.queue.post_many([("mobile", "assistant", f"m{i}") for i in range(5)])
+        self.assertEqual(len(self.queue.fetch("mobile", limit=3)), 3)
+        self.assertEqual(self.queue.pending_count("mobile"), 2)
+
+    def test_long_poll_wakes_on_post(self):
+        threading.Timer(0.2, self.queue.post, args=("mobile", "assistant", "late")).start()
+        started = time.monotonic()
+        mail = self.queue.fetch("mobile", wait=5)
+        self.assertEqual([m[2] for m in mail], ["late"])
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_long_poll_times_out_empty(self):
+        started = time.monotonic()
+        self.assertEqual(self.queue.fetch("nobody", wait=0.3), [])
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
+
+    def test_unacked_lease_is_redelivered(self):
+        self.queue.post("agent", "user", "task")
+        first = self.queue.fetch("agent", auto_ack=False, lease=0.1)
+        self.assertEqual(self.queue.fetch("agent", auto_ack=False), [])
+        time.sleep(0.15)
+        second = self.queue.fetch("agent", auto_ack=False)
+        self.assertEqual([m[0] for m in first], [m[0] for m in second])
+        self.assertEqual(self.queue.ack([m[0] for m in second]), 1)
+        time.sleep(0.1)
+        self.assertEqual(self.queue.fetch("agent"), [])
+
+    def test_many_producers_and_consumers(self):
+        producers, per_producer, consumers = 8, 100, 6
+        received, lock = [], threading.Lock()
+        done = threading.Event()
+
+        def produce(n):
+            for i in range(0, per_producer, 10):
+                self.queue.post_many([("swarm", "agent", f"{n}:{j}") for j in range(i, i + 10)])
+
+        def consume():
+            while not done.is_set():
+                batch = self.queue.fetch("swarm", limit=25, wait=0.2, auto_ack=False)
+                if batch:
+                    self.queue.ack([m[0] for m in batch])
+                    with lock:
+                        received.extend(m[2] for m in batch)
+
+        workers = [threading.Thread(target=consume) for _ in range(consumers)]
+        for w in workers:
+            w.start()
+        started = time.monotonic()
+        feeders = [threading.Thread(target=produce, args=(n,)) for n in range(producers)]
+        for f in feeders:
+            f.start()
+        for f in feeders:
+            f.join()
+        while len(received) < producers * per_producer and time.monotonic() - started < 20:
+            time.sleep(0.05)
+        done.set()
+        for w in workers:
+            w.join()
+        self.assertEqual(len(received), producers * per_producer)
+        self.assertEqual(len(set(received)), producers * per_producer)
+
+
+if __name__ == "__main__":
+    unittest.main()
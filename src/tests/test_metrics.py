@@ -0,0 +1,58 @@
+import time
+import unittest
+
+from core_os.metrics import CallMetrics
+
+
+class TestCallMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = CallMetrics()
+
+    def test_records_outcomes(self):
+        with self.metrics.timed("tool", "web_search"):
+            pass
+        with self.metrics.timed("tool", "web_search") as call:
+            call.fail()
+        with self.assertRaises(ValueError):
+            with self.metrics.timed("tool", "web_search"):
+                raise ValueError("boom")
+        stats = self.metrics.snapshot("tool")["tool"]["web_search"]
+        self.assertEqual(stats["count"], 3)
+        self.assertEqual(stats["errors"], 2)
+        self.assertAlmostEqual(stats["window"]["error_rate"], 0.667, places=3)
+
+    def test_histogram_and_percentiles(self):
+        for wall in [0.0005] * 90 + [0.2] * 10:
+            self.metrics.record("skill", "slow_one", wall)
+        stats = self.metrics.snapshot()["skill"]["slow_one"]
+        self.assertEqual(stats["histogram_ms"]["<=1"], 90)
+        self.assertEqual(stats["histogram_ms"]["<=250"], 10)
+        self.assertEqual(stats["window"]["p50_ms"], 0.5)
+        self.assertEqual(stats["window"]["p95_ms"], 200.0)
+
+    def test_rolling_window_is_bounded(self):
+        for _ in range(1000):
+            self.metrics.record("skill", "busy", 0.001)
+        stats = self.metrics.snapshot("skill")["skill"]["busy"]
+        self.assertEqual(stats["count"], 1000)
+        self.assertLessEqual(stats["window"]["calls"], 256)
+
+    def test_cpu_time_is_measured(self):
+        with self.metrics.timed("skill", "spin"):
+            end = time.perf_counter() + 0.05
+            while time.perf_counter() < end:
+                pass
+        self.assertGreater(self.metrics.snapshot()["skill"]["spin"]["cpu_ms_total"], 20)
+
+    def test_overhead_is_small(self):
+        n = 10000
+        started = time.perf_counter()
+        for _ in range(n):
+            with self.metrics.timed("tool", "noop"):
+                pass
+        self.assertLess((time.perf_counter() - started) / n, 50e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
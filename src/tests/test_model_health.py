@@ -0,0 +1,70 @@
+import time
+import unittest
+
+from core_os.model_health import ModelSelector
+
+CHAIN = ["cloud-397b", "local-7b", "tiny"]
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestModelSelector(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.up = set(CHAIN)
+        self.selector = ModelSelector(CHAIN, probe=lambda m: m in self.up, base_backoff=10,
+                                      max_backoff=40, clock=self.clock)
+        self.selector._ensure_prober = lambda: None   # probes are driven by the test
+
+    def test_quality_order_when_all_healthy(self):
+        self.assertEqual(self.selector.candidates(), CHAIN)
+
+    def test_failed_model_is_skipped_until_probe_recovers_it(self):
+        self.selector.record_failure("cloud-397b", TimeoutError("unreachable"))
+        self.assertEqual(self.selector.candidates(), ["local-7b", "tiny"])
+
+        self.up.discard("cloud-397b")
+        self.clock.now += 11
+        self.assertEqual(self.selector.probe_due(), [])
+        self.assertEqual(self.selector.status()["models"]["cloud-397b"]["retry_in_sec"], 20.0)
+
+        self.up.add("cloud-397b")
+        self.clock.now += 5
+        self.assertEqual(self.selector.probe_due(), [])   # still backing off
+        self.clock.now += 16
+        self.assertEqual(self.selector.probe_due(), ["cloud-397b"])
+        self.assertEqual(self.selector.current, "cloud-397b")
+
+    def test_backoff_is_capped(self):
+        for _ in range(6):
+            self.selector.record_failure("tiny")
+        self.assertEqual(self.selector.status()["models"]["tiny"]["retry_in_sec"], 40.0)
+
+    def test_all_down_starts_with_last_working(self):
+        self.selector.record_success("local-7b", 0.5)
+        for model in CHAIN:
+            self.selector.record_failure(model)
+        self.assertEqual(self.selector.candidates(), ["local-7b", "cloud-397b", "tiny"])
+        self.assertEqual(self.selector.status()["last_working"], "local-7b")
+
+    def test_background_probe(self):
+        up = {"local-7b"}
+        selector = ModelSelector(CHAIN[:2], probe=lambda m: m in up, base_backoff=0.05, probe_interval=0.02)
+        selector.record_failure("cloud-397b")
+        self.assertEqual(selector.candidates(), ["local-7b"])
+        up.add("cloud-397b")
+        deadline = time.time() + 2
+        while selector.current != "cloud-397b" and time.time() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(selector.candidates(), CHAIN[:2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import time
+import unittest
+
+from core_os.ocr_cache import TiledOCRCache, dhash, hamming
+
+
+class FakeImage:
+    """Grayscale image with the slice of the PIL API the cache uses; knows which words it shows."""
+
+    def __init__(self, width, height, words):
+        self.size = (width, height)
+        self.words = words   # [(x, y, text)] — each char is a 10x20 cell, inked width taken from the char
+        self._pixels = None
+
+    @property
+    def pixels(self):
+        if self._pixels is None:
+            width, height = self.size
+            px = [[0] * width for _ in range(height)]
+            for x, y, text in self.words:
+                for i, ch in enumerate(text):
+                    ink = 3 + ord(ch) % 7
+                    for yy in range(y, min(y + 20, height)):
+                        for xx in range(x + i * 10, min(x + i * 10 + ink, width)):
+                            px[yy][xx] = 220
+            self._pixels = px
+        return self._pixels
+
+    def crop(self, box):
+        left, top, right, bottom = box
+        out = FakeImage(right - left, bottom - top,
+                        [(x - left, y - top, t) for x, y, t in self.words
+                         if left <= x and x + 10 * len(t) <= right and top <= y and y + 20 <= bottom])
+        out._pixels = [row[left:right] for row in self.pixels[top:bottom]]
+        return out
+
+    def convert(self, mode):
+        return self
+
+    def resize(self, size):
+        width, height = self.size
+        w, h = size
+        out = []
+        for j in range(h):
+            y0, y1 = j * height // h, max(j * height // h + 1, (j + 1) * height // h)
+            for i in range(w):
+                x0, x1 = i * width // w, max(i * width // w + 1, (i + 1) * width // w)
+                cells = [self.pixels[y][x] for y in range(y0, y1) for x in range(x0, x1)]
+                out.append(sum(cells) // len(cells))
+        img = FakeImage(w, h, [])
+        img._data = out
+        return img
+
+    def getdata(self):
+        return self._data
+
+    def tobytes(self):
+        return bytes(v for row in self.pixels for v in row)
+
+
+class FakeOCR:
+    def __init__(self, delay=0.0):
+        self.calls = 0
+        self.pixels_read = 0
+        self.delay = delay
+
+    def __call__(self, image, detail=1):
+        self.calls += 1
+        self.pixels_read += image.size[0] * image.size[1]
+        time.sleep(self.delay)
+        return [([[x, y], [x + 10 * len(t), y], [x + 10 * len(t), y + 20], [x, y + 20]], t, 0.9)
+                for x, y, t in image.words]
+
+
+DESKTOP = [(20, 20, "File"), (80, 20, "Edit"), (340, 200, "terminal"), (500, 420, "12:00")]
+
+
+def texts(results):
+    return [r[1] for r in results]
+
+
+class TestTiledOCRCache(unittest.TestCase):
+
+    def setUp(self):
+        self.reader = FakeOCR()
+        self.cache = TiledOCRCache(readtext=self.reader, tile=160)
+
+    def test_dhash_distinguishes_content(self):
+        a = FakeImage(160, 160, [(10, 10, "alpha")])
+        b = FakeImage(160, 160, [(10, 10, "omega!!")])
+        self.assertEqual(hamming(dhash(a), dhash(FakeImage(160, 160, [(10, 10, "alpha")]))), 0)
+        self.assertGreater(hamming(dhash(a), dhash(b)), 0)
+
+    def test_static_frame_skips_ocr(self):
+        first = self.cache.readtext(FakeImage(640, 480, DESKTOP), stream="screen")
+        second = self.cache.readtext(FakeImage(640, 480, DESKTOP), stream="screen")
+        self.assertEqual(first, second)
+        self.assertEqual(self.reader.calls, 1)
+        stats = self.cache.stats()
+        self.assertEqual(stats["full_hits"], 1)
+        self.assertEqual(stats["tile_hit_rate"], 0.5)
+
+    def test_only_changed_region_is_reread(self):
+        self.cache.readtext(FakeImage(640, 480, DESKTOP), stream="screen")
+        changed = DESKTOP[:3] + [(500, 420, "12:01")]
+        results = self.cache.readtext(FakeImage(640, 480, changed), stream="screen")
+        self.assertEqual(texts(results), ["File", "Edit", "terminal", "12:01"])
+        self.assertEqual(self.reader.calls, 2)
+        self.assertLess(self.reader.pixels_read, 640 * 480 + 640 * 480 // 4)
+        self.assertEqual(self.cache.stats()["region_reads"], 1)
+
+    def test_single_digit_change_is_reread(self):
+        frame = DESKTOP + [(340, 300, "12 tests"), (20, 440, "PID 4821")]
+        self.cache.readtext(FakeImage(640, 480, frame), stream="screen")
+        edited = DESKTOP + [(340, 300, "13 tests"), (20, 440, "PID 4827")]
+        results = self.cache.readtext(FakeImage(640, 480, edited), stream="screen")
+        self.assertIn("13 tests", texts(results))
+        self.assertIn("PID 4827", texts(results))
+        self.assertNotIn("12 tests", texts(results))
+        self.assertEqual(self.cache.stats()["full_hits"], 0)
+
+    def test_streams_and_sizes_are_independent(self):
+        self.cache.readtext(FakeImage(640, 480, DESKTOP), stream="screen")
+        self.cache.readtext(FakeImage(640, 480, DESKTOP), stream="camera")
+        self.cache.readtext(FakeImage(320, 240, DESKTOP[:2]), stream="screen")
+        self.assertEqual(self.reader.calls, 3)
+
+    def test_first_frame_with_full_ratio_of_one(self):
+        cache = TiledOCRCache(readtext=self.reader, tile=160, full_ratio=1.0)
+        results = cache.readtext(FakeImage(640, 480, DESKTOP), stream="screen")
+        self.assertEqual(len(results), len(DESKTOP))
+        cache.readtext(FakeImage(320, 240, DESKTOP[:2]), stream="screen")
+        self.assertEqual(cache.stats()["full_reads"], 2)
+
+    def test_static_desktop_is_an_order_of_magnitude_faster(self):
+        # The fake hashes in pure Python; PIL makes the hit path far cheaper still
+        cache = TiledOCRCache(readtext=FakeOCR(delay=0.5), tile=160)
+        frames = [FakeImage(320, 240, DESKTOP[:3]) for _ in range(2)]
+        for frame in frames:
+            frame.pixels
+        timings = []
+        for frame in frames:
+            started = time.perf_counter()
+            cache.readtext(frame, stream="screen")
+            timings.append(time.perf_counter() - started)
+        self.assertLess(timings[1] * 10, timings[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
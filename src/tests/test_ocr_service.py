@@ -0,0 +1,109 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from core_os import ocr_service
+from core_os.ocr_service import OCRBusy, OCRService, OCRUnavailable
+
+
+class FakeReader:
+    """Stands in for easyocr.Reader: records calls, optionally blocks on a gate."""
+
+    def __init__(self, gate=None, delay=0.0):
+        self.calls = []
+        self.batched_calls = []
+        self.gate = gate
+        self.delay = delay
+
+    def readtext(self, image, detail=1, **kwargs):
+        if self.gate is not None:
+            self.gate.wait(5)
+        time.sleep(self.delay)
+        self.calls.append(image)
+        return [([[0, 0], [10, 0], [10, 10], [0, 10]], f"text:{os.path.basename(str(image))}", 0.9)]
+
+
+class TestOCRService(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.paths = []
+        for i in range(3):
+            path = os.path.join(self.tmp.name, f"frame{i}.png")
+            with open(path, "wb") as f:
+                f.write(b"png%d" % i)
+            self.paths.append(path)
+
+    def test_reader_is_loaded_once_and_shared(self):
+        loads = []
+        reader = FakeReader()
+        service = OCRService(loader=lambda: loads.append(1) or reader)
+        self.assertEqual(service.status()["reader"], "pending")
+        results = [service.readtext(p) for p in self.paths]
+        self.assertEqual(loads, [1])
+        self.assertEqual(results[1][0][1], "text:frame1.png")
+        self.assertEqual(service.status()["reader"], "ready")
+
+    def test_concurrent_duplicates_are_recognized_once(self):
+        gate = threading.Event()
+        reader = FakeReader(gate=gate)
+        service = OCRService(loader=lambda: reader)
+        blocker = service.submit(self.paths[0])           # occupies the worker
+        time.sleep(0.05)
+        futures = [service.submit(self.paths[1]) for _ in range(5)] + [service.submit(self.paths[2])]
+        gate.set()
+        blocker.result(5)
+        texts = [f.result(5)[0][1] for f in futures]
+        self.assertEqual(texts[:5], ["text:frame1.png"] * 5)
+        self.assertEqual(reader.calls.count(self.paths[1]), 1)
+        self.assertEqual(service.status()["deduplicated"], 4)
+
+    def test_bounded_queue_rejects(self):
+        gate = threading.Event()
+        service = OCRService(loader=lambda: FakeReader(gate=gate), queue_size=2, batch=1)
+        first = service.submit(self.paths[0])
+        time.sleep(0.05)
+        service.submit(self.paths[1])
+        service.submit(self.paths[2])
+        with self.assertRaises(OCRBusy):
+            service.submit(self.paths[0])
+        gate.set()
+        first.result(5)
+        self.assertEqual(service.status()["rejected"], 1)
+
+    def test_unavailable_reader(self):
+        def _missing():
+            raise ImportError("No module named 'easyocr'")
+        service = OCRService(loader=_missing)
+        with self.assertRaises(OCRUnavailable):
+            service.readtext(self.paths[0], timeout=5)
+        self.assertFalse(service.installed)
+
+
+
+class TestGPUSelection(unittest.TestCase):
+
+    def torch(self, cuda):
+        fake = mock.Mock()
+        fake.cuda.is_available.return_value = cuda
+        return fake
+
+    def test_auto_follows_torch(self):
+        with mock.patch.object(ocr_service, "GPU", "auto"):
+            self.assertTrue(ocr_service._want_gpu(self.torch(True)))
+            self.assertFalse(ocr_service._want_gpu(self.torch(False)))
+            self.assertFalse(ocr_service._want_gpu(None))
+
+    def test_explicit_setting_wins(self):
+        with mock.patch.object(ocr_service, "GPU", "0"):
+            self.assertFalse(ocr_service._want_gpu(self.torch(True)))
+        with mock.patch.object(ocr_service, "GPU", "1"):
+            self.assertTrue(ocr_service._want_gpu(self.torch(False)))
+
+
+if __name__ == "__main__":
+    unittest.main()
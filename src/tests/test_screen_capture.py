@@ -0,0 +1,64 @@
+import threading
+import time
+import unittest
+
+from core_os.screen_capture import ScreenCapture
+
+
+class SlowBackend:
+    name = "fake"
+
+    def __init__(self, delay=0.05):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return object()
+
+
+def broken():
+    raise OSError("cannot open display")
+
+
+class TestScreenCapture(unittest.TestCase):
+
+    def test_fresh_frame_is_reused(self):
+        backend = SlowBackend()
+        capture = ScreenCapture(backends=[backend], fresh_ms=500)
+        first = capture.grab()
+        self.assertIs(capture.grab(), first)
+        self.assertEqual(backend.calls, 1)
+        self.assertIsNot(capture.grab(max_age_ms=0), first)
+        self.assertEqual(backend.calls, 2)
+        self.assertEqual(capture.status()["reused"], 1)
+
+    def test_concurrent_consumers_share_one_capture(self):
+        backend = SlowBackend(delay=0.1)
+        capture = ScreenCapture(backends=[backend], fresh_ms=1000)
+        frames = []
+        threads = [threading.Thread(target=lambda: frames.append(capture.grab())) for _ in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(backend.calls, 1)
+        self.assertEqual(len({id(f) for f in frames}), 1)
+
+    def test_ring_buffer_is_bounded_and_ordered(self):
+        capture = ScreenCapture(backends=[SlowBackend(delay=0)], fresh_ms=0, ring_size=3)
+        for _ in range(5):
+            capture.grab()
+        self.assertEqual([f.seq for f in capture.recent()], [3, 4, 5])
+        self.assertEqual(capture.latest().seq, 5)
+
+    def test_falls_through_failing_backends(self):
+        capture = ScreenCapture(backends=[broken, SlowBackend(delay=0)], fresh_ms=0)
+        self.assertEqual(capture.grab().backend, "fake")
+        self.assertIn("broken", capture.status()["failed_backends"])
+        self.assertIsNone(ScreenCapture(backends=[broken]).grab())
+
+
+if __name__ == "__main__":
+    unittest.main()
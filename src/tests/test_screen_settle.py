@@ -0,0 +1,87 @@
+import unittest
+
+from core_os.screen_settle import ScreenSettler
+
+
+class FakeScreen:
+    """Signatures over (fake) time: a list of (from_time, signature) steps."""
+
+    def __init__(self, timeline):
+        self.timeline = timeline
+        self.now = 0.0
+        self.grabs = 0
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def grab(self):
+        self.grabs += 1
+        sig = None
+        for start, value in self.timeline:
+            if self.now >= start:
+                sig = value
+        return ("frame", sig)
+
+
+def settler_for(screen, **kw):
+    kw.setdefault("poll", 0.1)
+    kw.setdefault("stable_frames", 2)
+    kw.setdefault("change_timeout", 1.0)
+    kw.setdefault("max_wait", 3.0)
+    return ScreenSettler(grab=screen.grab, signature=lambda f: f[1], clock=screen.clock,
+                         sleep=screen.sleep, tolerance=2, **kw)
+
+
+A, B, C = 0, 0xFF, 0xFF00     # 8 bits apart from each other
+
+
+class TestScreenSettler(unittest.TestCase):
+
+    def test_instant_redraw_returns_well_before_fixed_delay(self):
+        screen = FakeScreen([(0, B)])
+        result = settler_for(screen).wait(baseline=A)
+        self.assertTrue(result.changed and result.settled)
+        self.assertLess(result.waited_ms, 600)
+
+    def test_waits_through_a_slow_transition(self):
+        # window opens after 0.4 s and redraws every poll until 1.5 s
+        frames = [(0.35 + i * 0.1, B if i % 2 else C) for i in range(12)]
+        screen = FakeScreen([(0, A)] + frames + [(1.55, B)])
+        result = settler_for(screen).wait(baseline=A)
+        self.assertTrue(result.changed and result.settled)
+        self.assertEqual(result.signature, B)
+        self.assertGreaterEqual(result.waited_ms, 1500)
+
+    def test_no_visible_effect_gives_up_after_change_timeout(self):
+        screen = FakeScreen([(0, A | 1)])      # within tolerance of the baseline
+        result = settler_for(screen).wait(baseline=A)
+        self.assertFalse(result.changed)
+        self.assertTrue(result.settled)
+        self.assertAlmostEqual(result.waited_ms, 1000, delta=150)
+
+    def test_constant_animation_is_capped(self):
+        timeline = [(i * 0.1, B if i % 2 else C) for i in range(100)]
+        result = settler_for(FakeScreen(timeline)).wait(baseline=A)
+        self.assertTrue(result.changed)
+        self.assertFalse(result.settled)
+        self.assertAlmostEqual(result.waited_ms, 3000, delta=150)
+
+    def test_without_signature_falls_back_to_fixed_delay(self):
+        screen = FakeScreen([(0, None)])
+        result = settler_for(screen, fallback=0.6).wait(baseline=A)
+        self.assertIsNone(result.signature)
+        self.assertAlmostEqual(result.waited_ms, 600)
+        self.assertEqual(screen.grabs, 1)
+
+    def test_same_respects_tolerance(self):
+        settler = settler_for(FakeScreen([]))
+        self.assertTrue(settler.same(A, 0b11))
+        self.assertFalse(settler.same(A, 0b111))
+        self.assertFalse(settler.same(A, None))
+
+
+if __name__ == "__main__":
+    unittest.main()
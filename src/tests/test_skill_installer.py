@@ -0,0 +1,115 @@
+import subprocess
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from core_os.skills import skill_installer
+from core_os.skills.skill_installer import InstallJobs
+
+
+def _completed(code):
+    return subprocess.CompletedProcess(args=[], returncode=code, stdout="", stderr="err" if code else "")
+
+
+class TestInstallJobs(unittest.TestCase):
+
+    def setUp(self):
+        self.jobs = InstallJobs()
+
+    def test_job_reports_progress_and_finishes(self):
+        def run(report):
+            report("installing_deps", 0.5, "half way")
+            return {"ok": True, "message": "installed"}
+
+        job = self.jobs.submit("user/repo", run)
+        self.assertIn(job["status"], ("queued", "running"))
+        done = self.jobs.wait(job["id"], timeout=5)
+        self.assertEqual(done["status"], "done")
+        self.assertEqual(done["progress"], 1.0)
+        self.assertEqual(done["log"], ["half way"])
+        self.assertEqual(done["message"], "installed")
+
+    def test_failures_are_recorded(self):
+        def run(report):
+            raise RuntimeError("download failed")
+
+        job = self.jobs.submit("user/broken", run)
+        done = self.jobs.wait(job["id"], timeout=5)
+        self.assertEqual(done["status"], "failed")
+        self.assertIn("download failed", done["message"])
+
+    def test_concurrent_installs_of_one_source_are_deduplicated(self):
+        release = threading.Event()
+        calls = []
+
+        def run(report):
+            calls.append(1)
+            release.wait(5)
+            return {"ok": True}
+
+        first = self.jobs.submit("user/repo", run)
+        second = self.jobs.submit("user/repo", run)
+        self.assertEqual(first["id"], second["id"])
+        self.assertTrue(second["deduplicated"])
+        release.set()
+        self.jobs.wait(first["id"], timeout=5)
+        self.assertEqual(len(calls), 1)
+        # Once finished, the same source can be installed again
+        third = self.jobs.submit("user/repo", run)
+        self.assertNotEqual(third["id"], first["id"])
+        self.jobs.wait(third["id"], timeout=5)
+
+
+class TestRequirementInstall(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = mock.patch.object(skill_installer, "WHEEL_CACHE", skill_installer.Path(self.tmp.name))
+        self.cache.start()
+
+    def tearDown(self):
+        self.cache.stop()
+        self.tmp.cleanup()
+
+    def test_cached_wheel_installs_offline(self):
+        with mock.patch.object(skill_installer, "_pip", return_value=_completed(0)) as pip:
+            outcome = skill_installer.install_requirement("requests")
+        self.assertEqual(outcome["source"], "cache")
+        args = pip.call_args_list[0][0][0]
+        self.assertIn("--no-index", args)
+        self.assertEqual(pip.call_count, 1)
+
+    def test_missing_wheel_is_built_into_cache(self):
+        replies = iter([_completed(1), _completed(0), _completed(0)])
+        with mock.patch.object(skill_installer, "_pip", side_effect=lambda args, **kw: next(replies)) as pip:
+            outcome = skill_installer.install_requirement("requests")
+        self.assertTrue(outcome["ok"])
+        self.assertEqual(outcome["source"], "network")
+        self.assertEqual(pip.call_args_list[1][0][0][0], "wheel")
+        self.assertIn("--no-index", pip.call_args_list[2][0][0])
+
+    def test_concurrent_installs_of_one_requirement_share_a_run(self):
+        calls = []
+
+        def slow_install(requirement):
+            calls.append(requirement)
+            time.sleep(0.3)
+            return {"requirement": requirement, "ok": True, "source": "cache"}
+
+        results = []
+        with mock.patch.object(skill_installer, "_install_one", side_effect=slow_install):
+            threads = [threading.Thread(target=lambda: results.append(skill_installer.install_requirement("rich")))
+                       for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 4)
+        self.assertTrue(all(r["ok"] for r in results))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,238 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core_os.skills import skill_manager
+from core_os.skills.skill_cache import MISSING, SkillResultCache
+
+SKILL_SOURCE = '''
+def register():
+    return {"name": "echo_test", "description": "Echoes the payload", "version": "1.0"}
+
+def execute(payload):
+    return payload
+'''
+
+INPROCESS_SOURCE = '''
+import os
+
+def register():
+    return {"name": "forge_test", "description": "Orchestrates long work", "isolated": False}
+
+def execute(payload):
+    return os.getpid()
+'''
+
+CACHED_SOURCE = '''
+import uuid
+
+def register():
+    return {"name": "cached_test", "description": "Fresh token per real call",
+            "cacheable": True, "cache_ttl": 60, "cache_key": ["q"]}
+
+def execute(payload):
+    return {"q": payload.get("q"), "token": uuid.uuid4().hex}
+'''
+
+
+class TestSkillRegistry(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.registry_path = root / "skills_registry.json"
+        self.registry = skill_manager._RegistryCache(self.registry_path)
+        self.patches = [
+            mock.patch.object(skill_manager, "_registry", self.registry),
+            mock.patch.object(skill_manager, "SKILLS_DIR", root),
+            mock.patch.dict(skill_manager._loaded, clear=True),
+        ]
+        for p in self.patches:
+            p.start()
+        src = root / "echo_test.py"
+        src.write_text(SKILL_SOURCE)
+        self.assertTrue(skill_manager.install_from_local(str(src))["ok"])
+
+    def tearDown(self):
+        for p in reversed(self.patches):
+            p.stop()
+        self.tmp.cleanup()
+
+    def test_install_writes_through(self):
+        on_disk = json.loads(self.registry_path.read_text())
+        self.assertTrue(on_disk["echo_test"]["enabled"])
+        self.assertEqual(skill_manager.execute_skill("echo_test", {"x": 1}), {"ok": True, "result": {"x": 1}})
+
+    def test_calls_are_instrumented(self):
+        from core_os.metrics import metrics
+        before = metrics.snapshot("skill").get("skill", {}).get("echo_test", {}).get("count", 0)
+        skill_manager.execute_skill("echo_test", {"x": 1})
+        stats = metrics.snapshot("skill")["skill"]["echo_test"]
+        self.assertEqual(stats["count"], before + 1)
+        self.assertGreater(stats["max_ms"], 0)
+
+    def test_toggle_is_visible_immediately(self):
+        skill_manager.toggle_skill("echo_test", False)
+        self.assertFalse(json.loads(self.registry_path.read_text())["echo_test"]["enabled"])
+        self.assertIn("disabled", skill_manager.execute_skill("echo_test", {})["error"])
+        skill_manager.toggle_skill("echo_test", True)
+        self.assertTrue(skill_manager.execute_skill("echo_test", {})["ok"])
+
+    def test_external_edit_invalidates_cache(self):
+        reg = json.loads(self.registry_path.read_text())
+        reg["echo_test"]["enabled"] = False
+        reg["other"] = {"name": "other", "enabled": True}
+        # Another process rewrites the file
+        self.registry_path.write_text(json.dumps(reg))
+        self.assertEqual({s["name"] for s in skill_manager.list_skills()}, {"echo_test", "other"})
+        self.assertFalse(skill_manager.execute_skill("echo_test", {})["ok"])
+
+    def test_concurrent_writers_keep_every_update(self):
+        def add(i):
+            with self.registry.update() as reg:
+                reg[f"skill_{i}"] = {"name": f"skill_{i}", "enabled": True}
+
+        threads = [threading.Thread(target=add, args=(i,)) for i in range(20)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        on_disk = json.loads(self.registry_path.read_text())
+        self.assertEqual(len(on_disk), 21)
+        self.assertEqual(list(self.registry_path.parent.glob(".skills_registry.*")), [])
+
+    def test_uninstall(self):
+        self.assertTrue(skill_manager.uninstall_skill("echo_test")["ok"])
+        self.assertEqual(skill_manager.list_skills(), [])
+        self.assertFalse(skill_manager._skill_path("echo_test").exists())
+
+    def test_cacheable_skill_results_are_reused(self):
+        src = Path(self.tmp.name) / "cached_test.py"
+        src.write_text(CACHED_SOURCE)
+        self.assertTrue(skill_manager.install_from_local(str(src))["ok"])
+        with mock.patch.object(skill_manager, "_results", SkillResultCache()):
+            first = skill_manager.execute_skill("cached_test", {"q": "a", "noise": 1})
+            again = skill_manager.execute_skill("cached_test", {"q": "a", "noise": 2})
+            other = skill_manager.execute_skill("cached_test", {"q": "b"})
+            self.assertTrue(again["cached"])
+            self.assertEqual(first["result"], again["result"])
+            self.assertNotEqual(first["result"], other["result"])
+            fresh = skill_manager.execute_skill("cached_test", {"q": "a"}, use_cache=False)
+            self.assertNotEqual(first["result"], fresh["result"])
+
+            skill_manager.invalidate_skill_cache("cached_test")
+            self.assertNotIn("cached", skill_manager.execute_skill("cached_test", {"q": "a"}))
+            stats = skill_manager.skill_cache_stats()["skills"]["cached_test"]
+            self.assertEqual(stats["hits"], 1)
+            self.assertEqual(stats["misses"], 3)
+
+    def test_isolation_is_opt_in_per_skill(self):
+        src = Path(self.tmp.name) / "forge_test.py"
+        src.write_text(INPROCESS_SOURCE)
+        pool = mock.Mock()
+        pool.run.return_value = {"ok": True, "result": "from worker"}
+        pool.preloaded.return_value = {"echo_test"}
+        with mock.patch.object(skill_manager, "get_skill_pool", return_value=pool):
+            self.assertTrue(skill_manager.install_from_local(str(src))["ok"])
+            self.assertEqual(skill_manager.execute_skill("forge_test", {})["result"], os.getpid())
+            self.assertEqual(skill_manager.execute_skill("echo_test", {})["result"], "from worker")
+            self.assertEqual(pool.run.call_count, 1)
+            loaded = {s["name"]: s["loaded"] for s in skill_manager.list_skills()}
+        self.assertEqual(loaded, {"echo_test": True, "forge_test": True})
+
+    def test_failed_requirement_aborts_install(self):
+        src = Path(self.tmp.name) / "needs_dep.py"
+        src.write_text(SKILL_SOURCE.replace('"echo_test"', '"needs_dep"').replace(
+            '"version": "1.0"', '"version": "1.0", "requires": ["nonexistent-pkg"]'))
+        outcome = {"requirement": "nonexistent-pkg", "ok": False, "source": "network",
+                   "error": "No matching distribution"}
+        with mock.patch.object(skill_manager, "install_requirements", return_value=[outcome]):
+            result = skill_manager.install_from_local(str(src))
+        self.assertFalse(result["ok"])
+        self.assertIn("No matching distribution", result["message"])
+        self.assertNotIn("needs_dep", skill_manager._load_registry())
+
+    def test_uncacheable_skill_is_not_cached(self):
+        with mock.patch.object(skill_manager, "_results", SkillResultCache()):
+            skill_manager.execute_skill("echo_test", {"x": 1})
+            self.assertEqual(skill_manager.skill_cache_stats()["entries"], 0)
+
+    def test_manifest_is_read_without_import(self):
+        path = Path(self.tmp.name) / "skill_lazy_test.py"
+        path.write_text(
+            "raise RuntimeError('imported')\n"
+            "def register():\n"
+            "    return {'name': 'lazy_test', 'description': 'Never imported',\n"
+            "            'parameters': {'type': 'object', 'properties': {'city': {'type': 'string'}}}}\n"
+        )
+        meta = skill_manager.read_manifest(path)
+        self.assertEqual(meta["description"], "Never imported")
+
+        with self.registry.update() as reg:
+            reg["lazy_test"] = {"name": "lazy_test", "enabled": True}
+        self.assertEqual(skill_manager.load_all_enabled(prewarm=False), 2)
+        entry = skill_manager._load_registry()["lazy_test"]
+        self.assertEqual(entry["schema"]["properties"], {"city": {"type": "string"}})
+        self.assertNotIn("lazy_test", skill_manager._loaded)
+
+        tool = skill_manager.skill_tool_schema()["function"]
+        self.assertIn("lazy_test(city): Never imported", tool["description"])
+        self.assertEqual(tool["parameters"]["properties"]["skill_name"]["enum"], ["echo_test", "lazy_test"])
+
+    def test_manifest_follows_file_edits(self):
+        path = skill_manager._skill_path("echo_test")
+        path.write_text(SKILL_SOURCE.replace("Echoes the payload", "Echoes it back"))
+        self.assertEqual(skill_manager.refresh_manifests(), 1)
+        self.assertEqual(skill_manager._load_registry()["echo_test"]["description"], "Echoes it back")
+        self.assertEqual(skill_manager.refresh_manifests(), 0)
+
+    def test_install_async_returns_job(self):
+        src = Path(self.tmp.name) / "cached_test.py"
+        src.write_text(CACHED_SOURCE)
+        job = skill_manager.install_async(str(src))
+        done = skill_manager._install_jobs.wait(job["id"], timeout=10)
+        self.assertEqual(done["status"], "done")
+        self.assertIn("cached_test", skill_manager._load_registry())
+
+    def test_cached_lookup_does_not_reread(self):
+        registry = self.registry
+        skill_manager._load_registry()
+        with mock.patch.object(registry, "_read", wraps=registry._read) as read:
+            for _ in range(100):
+                self.assertIn("echo_test", skill_manager._load_registry())
+            self.assertEqual(read.call_count, 0)
+            # Another process rewrites the file: the next lookup sees it
+            self.registry_path.write_text(json.dumps({"other": {"name": "other", "enabled": True}}))
+            self.assertEqual(list(skill_manager._load_registry()), ["other"])
+            self.assertEqual(read.call_count, 1)
+
+
+class TestSkillResultCache(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        cache = SkillResultCache(max_entries=2)
+        cache.put(("s", "1"), 1, ttl=60)
+        cache.put(("s", "2"), 2, ttl=60)
+        cache.get(("s", "1"))
+        cache.put(("s", "3"), 3, ttl=60)
+        self.assertIs(cache.get(("s", "2")), MISSING)
+        self.assertEqual(cache.get(("s", "1")), 1)
+        self.assertEqual(cache.stats()["skills"]["s"]["evicted"], 1)
+
+    def test_ttl_expiry(self):
+        now = [100.0]
+        cache = SkillResultCache(clock=lambda: now[0])
+        cache.put(("s", "k"), None, ttl=5)
+        now[0] += 4.9
+        self.assertIsNone(cache.get(("s", "k")))
+        now[0] += 0.2
+        self.assertIs(cache.get(("s", "k")), MISSING)
+        self.assertEqual(cache.stats()["skills"]["s"]["expired"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
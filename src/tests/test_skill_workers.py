@@ -0,0 +1,126 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core_os.skills.skill_workers import SkillWorkerPool
+
+SKILL_SOURCE = '''
+import os
+import time
+
+def register():
+    return {"name": "probe", "description": "Worker probe"}
+
+def execute(payload):
+    mode = payload.get("mode")
+    if mode == "sleep":
+        time.sleep(payload["seconds"])
+    elif mode == "spin":
+        while True:
+            pass
+    elif mode == "hog":
+        blob = bytearray(payload["mb"] * 1024 * 1024)
+        return len(blob)
+    elif mode == "raise":
+        raise ValueError("boom")
+    elif mode == "nested_pool":
+        from core_os.skills.skill_workers import get_skill_pool
+        return get_skill_pool() is None
+    return {"pid": os.getpid(), "echo": payload.get("echo")}
+'''
+
+
+class TestSkillWorkerPool(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = str(Path(self.tmp.name) / "skill_probe.py")
+        Path(self.path).write_text(SKILL_SOURCE)
+        self.pool = SkillWorkerPool(size=2, max_calls=3, timeout=10, cpu_limit=1, memory_mb=512)
+        self.pool.start(preload=[("probe", self.path)])
+
+    def tearDown(self):
+        self.pool.shutdown()
+        self.tmp.cleanup()
+
+    def run_probe(self, **payload):
+        return self.pool.run("probe", self.path, payload)
+
+    def test_runs_out_of_process(self):
+        reply = self.run_probe(echo="hi")
+        self.assertTrue(reply["ok"])
+        self.assertEqual(reply["result"]["echo"], "hi")
+        self.assertNotEqual(reply["result"]["pid"], os.getpid())
+
+    def test_errors_are_returned(self):
+        reply = self.run_probe(mode="raise")
+        self.assertEqual((reply["ok"], reply["error"]), (False, "boom"))
+        self.assertIn("cpu", reply["usage"])
+
+    def test_deadline_kills_worker(self):
+        started = time.monotonic()
+        reply = self.pool.run("probe", self.path, {"mode": "sleep", "seconds": 30}, timeout=0.5)
+        self.assertFalse(reply["ok"])
+        self.assertIn("timed out", reply["error"])
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertTrue(self.run_probe()["ok"])
+
+    def test_cancel(self):
+        cancel = threading.Event()
+        threading.Timer(0.3, cancel.set).start()
+        reply = self.pool.run("probe", self.path, {"mode": "sleep", "seconds": 30}, cancel=cancel)
+        self.assertIn("cancelled", reply["error"])
+        self.assertEqual(self.pool.stats["cancelled"], 1)
+
+    def test_cancel_by_name(self):
+        threading.Timer(0.3, self.pool.cancel, args=("probe",)).start()
+        reply = self.run_probe(mode="sleep", seconds=30)
+        self.assertIn("cancelled", reply["error"])
+
+    def test_cpu_limit(self):
+        reply = self.run_probe(mode="spin")
+        self.assertFalse(reply["ok"])
+        self.assertIn("CPU limit", reply["error"])
+
+    def test_memory_limit(self):
+        reply = self.run_probe(mode="hog", mb=1024)
+        self.assertFalse(reply["ok"])
+        self.assertTrue(self.run_probe(mode="hog", mb=16)["ok"])
+
+    def test_workers_are_recycled(self):
+        pool = SkillWorkerPool(size=1, max_calls=2, timeout=10)
+        try:
+            pids = [pool.run("probe", self.path, {})["result"]["pid"] for _ in range(4)]
+        finally:
+            pool.shutdown()
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+        self.assertEqual(pool.stats["recycled"], 2)
+
+    def test_workers_never_build_their_own_pool(self):
+        with mock.patch("core_os.skills.skill_workers.POOL_SIZE", 2):
+            self.assertTrue(self.run_probe(mode="nested_pool")["result"])
+
+    def test_preloaded_names(self):
+        self.assertEqual(self.pool.preloaded(), {"probe"})
+        self.assertEqual(SkillWorkerPool(size=1).preloaded(), set())
+
+    def test_parallel_calls(self):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.run_probe(mode="sleep", seconds=0.5)))
+                   for _ in range(2)]
+        started = time.monotonic()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(results), 2)
+        self.assertLess(time.monotonic() - started, 0.95)
+
+
+if __name__ == "__main__":
+    unittest.main()
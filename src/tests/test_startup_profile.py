@@ -0,0 +1,94 @@
+import json
+import os
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from core_os.startup_profile import StartupTimer, check_budget, main, parse_importtime, profile
+
+FAKE_ENTRY = textwrap.dedent("""
+    import time
+    from types import SimpleNamespace
+    from core_os.startup_profile import startup
+
+    time.sleep(0.05)
+
+    async def _preload():
+        with startup.phase("preload"):
+            time.sleep(0.1)
+
+    def _broken():
+        raise RuntimeError("no display")
+
+    app = SimpleNamespace(router=SimpleNamespace(on_startup=[_preload, _broken]))
+""")
+
+
+class TestStartupTimer(unittest.TestCase):
+
+    def test_phases_and_report_file(self):
+        timer = StartupTimer()
+        with timer.phase("ok"):
+            pass
+        with self.assertRaises(ValueError):
+            with timer.phase("bad"):
+                raise ValueError
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "report.json"
+            with mock.patch.dict(os.environ, {"MILLA_STARTUP_REPORT": str(path)}):
+                timer.finish()
+            report = json.loads(path.read_text())
+        self.assertTrue(report["phases"]["ok"]["ok"])
+        self.assertFalse(report["phases"]["bad"]["ok"])
+        self.assertIsNotNone(report["boot_ms"])
+
+    def test_parse_importtime(self):
+        rows = parse_importtime(
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   json.decoder\n"
+            "import time:      3000 |       3120 | json\n"
+        )
+        self.assertEqual(rows[1], {"module": "json", "depth": 0, "self_ms": 3.0, "cumulative_ms": 3.12})
+        self.assertEqual(rows[0]["depth"], 1)
+
+
+class TestHarness(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        Path(self.tmp.name, "fake_entry.py").write_text(FAKE_ENTRY)
+        env = {"PYTHONPATH": os.pathsep.join(filter(None, [self.tmp.name, os.environ.get("PYTHONPATH")]))}
+        patcher = mock.patch.dict(os.environ, env)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_profile_reports_imports_hooks_and_phases(self):
+        result = profile("fake_entry")
+        self.assertTrue(result["ok"])
+        self.assertGreaterEqual(result["import_ms"], 50)
+        hooks = {h["hook"]: h for h in result["hooks"]}
+        self.assertGreaterEqual(hooks["_preload"]["ms"], 100)
+        self.assertFalse(hooks["_broken"]["ok"])
+        self.assertIn("no display", hooks["_broken"]["error"])
+        self.assertIn("preload", result["phases"])
+        self.assertIn("fake_entry", [m["module"] for m in result["modules"]])
+
+        self.assertEqual(check_budget(result, budget_ms=60_000), [])
+        violations = check_budget(result, budget_ms=1, hook_budget_ms=50)
+        self.assertEqual(len(violations), 2)
+
+    def test_cli_fails_over_budget_and_writes_json(self):
+        out = Path(self.tmp.name) / "startup.json"
+        with mock.patch("builtins.print"):
+            code = main(["fake_entry", "--no-hooks", "--budget-ms", "1", "--json", str(out)])
+        self.assertEqual(code, 1)
+        report = json.loads(out.read_text())
+        self.assertEqual(report["hooks"], [])
+        self.assertTrue(report["budget_violations"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from core_os.stream_bridge import iterate_in_thread
+
+
+class TestStreamBridge(unittest.TestCase):
+
+    def test_items_arrive_before_generator_finishes(self):
+        release = threading.Event()
+
+        def slow():
+            yield "step 1"
+            release.wait(5)          # the rest of the run is still in progress
+            yield "step 2"
+
+        async def consume():
+            seen = []
+            async for item in iterate_in_thread(slow):
+                seen.append(item)
+                if item == "step 1":
+                    self.assertFalse(release.is_set())
+                    release.set()
+            return seen
+
+        self.assertEqual(asyncio.run(consume()), ["step 1", "step 2"])
+
+    def test_backpressure_bounds_buffered_items(self):
+        produced = []
+
+        def fast():
+            for i in range(100):
+                produced.append(i)
+                yield i
+
+        async def consume():
+            seen = []
+            async for item in iterate_in_thread(fast, maxsize=2):
+                await asyncio.sleep(0.01)
+                # the producer may be at most the queue plus one in-flight item ahead
+                self.assertLessEqual(len(produced) - len(seen), 4)
+                seen.append(item)
+            return seen
+
+        self.assertEqual(asyncio.run(consume()), list(range(100)))
+
+    def test_cancel_closes_generator(self):
+        closed = threading.Event()
+        produced = []
+
+        def endless():
+            try:
+                i = 0
+                while True:
+                    produced.append(i)
+                    yield i
+                    i += 1
+            finally:
+                closed.set()
+
+        async def consume():
+            async def reader():
+                async for _ in iterate_in_thread(endless, maxsize=1):
+                    await asyncio.sleep(0.01)
+
+            task = asyncio.create_task(reader())
+            await asyncio.sleep(0.1)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(consume())
+        self.assertTrue(closed.wait(2))
+        count = len(produced)
+        time.sleep(0.1)
+        self.assertEqual(len(produced), count)
+
+    def test_generator_errors_propagate(self):
+        def broken():
+            yield 1
+            raise ValueError("vision API down")
+
+        async def consume():
+            seen = []
+            with self.assertRaises(ValueError):
+                async for item in iterate_in_thread(broken):
+                    seen.append(item)
+            return seen
+
+        self.assertEqual(asyncio.run(consume()), [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
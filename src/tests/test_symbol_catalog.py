@@ -0,0 +1,68 @@
+import os
+import time
+import tempfile
+import unittest
+from pathlib import Path
+
+from core_os.memory.symbol_catalog import SymbolCatalog, extract_symbols
+
+
+class TestSymbolCatalog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name) / "src"
+        self.root.mkdir()
+        (self.root / "alpha.py").write_text(
+            "class NeuralMesh:\n    def pulse(self):\n        pass\n\nasync def stream_events():\n    pass\n"
+        )
+        (self.root / "legacy.py").write_text("print 'py2'\ndef old_helper():\n    pass\n")
+        self.catalog = SymbolCatalog(os.path.join(self.tmp.name, "agent_memory.db"))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _files(self):
+        return sorted(self.root.rglob("*.py"))
+
+    def test_extract_symbols_ast_and_regex_fallback(self):
+        self.assertEqual(extract_symbols("class A:\n    async def b(self): pass\n"), [("A", 1, "class"), ("b", 2, "def")])
+        self.assertEqual(extract_symbols("print 'x'\ndef f():\n  pass\n"), [("f", 2, "def")])
+
+    def test_refresh_is_incremental(self):
+        first = self.catalog.refresh(self.root, self._files())
+        self.assertEqual((first["reindexed"], first["symbols"]), (2, 4))
+        second = self.catalog.refresh(self.root, self._files())
+        self.assertEqual((second["reindexed"], second["unchanged"]), (0, 2))
+
+        time.sleep(0.01)
+        (self.root / "alpha.py").write_text("def renamed_pulse():\n    pass\n")
+        third = self.catalog.refresh(self.root, self._files())
+        self.assertEqual(third["reindexed"], 1)
+        self.assertEqual(self.catalog.search("NeuralMesh"), [])
+        self.assertEqual(self.catalog.search("renamed")[0][:2], ("renamed_pulse", "alpha.py"))
+
+    def test_removed_files_are_pruned(self):
+        self.catalog.refresh(self.root, self._files())
+        (self.root / "legacy.py").unlink()
+        stats = self.catalog.refresh(self.root, self._files())
+        self.assertEqual(stats["removed"], 1)
+        self.assertEqual(self.catalog.search("old_helper"), [])
+
+    def test_search_is_substring_and_case_insensitive(self):
+        self.catalog.refresh(self.root, self._files())
+        self.assertEqual({r[0] for r in self.catalog.search("mesh")}, {"NeuralMesh"})
+        self.assertEqual({r[0] for r in self.catalog.search("_EVE")}, {"stream_events"})
+        self.assertEqual({r[0] for r in self.catalog.search("pu")}, {"pulse"})
+
+    def test_search_uses_fts_index(self):
+        if self.catalog.fts_mode != "trigram":
+            self.skipTest("SQLite build lacks the FTS5 trigram tokenizer")
+        plan = self.catalog.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT c.symbol FROM catalog_fts f JOIN catalog c ON c.id = f.rowid "
+            "WHERE catalog_fts MATCH 'symbol:\"mesh\"'").fetchall()
+        self.assertFalse(any("SCAN c" in row[-1] or "SCAN catalog" in row[-1] for row in plan))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from core_os.memory.threaded_memory import ThreadedMemory
+
+
+class TestThreadedMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.tmp.name, "threaded_memory.db")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_topic_lookup_matches_substrings_newest_first(self):
+        store = ThreadedMemory(self.db)
+        store.save_thought("Identity", "first")
+        store.save_thought("Rain", "unrelated")
+        store.save_thought("Core identity shift", "second")
+        self.assertEqual([r[0] for r in store.retrieve_relevant("identity")], ["second", "first"])
+        self.assertEqual([r[0] for r in store.retrieve_relevant("Ra", limit=5)], ["unrelated"])
+
+    def test_search_covers_content(self):
+        store = ThreadedMemory(self.db)
+        store.save_thought("Identity", "I am a collaborative intelligence")
+        store.save_thought("Rain", "The storm hums on the roof")
+        self.assertEqual([r[0] for r in store.search("storm")], ["The storm hums on the roof"])
+
+    def test_short_and_unindexed_queries_match_substrings(self):
+        store = ThreadedMemory(self.db)
+        store.save_thought("Rain", "The storm hums on the roof")
+        store.fts_mode = None       # as on SQLite builds without the trigram tokenizer
+        self.assertEqual([r[0] for r in store.search("tor")], ["The storm hums on the roof"])
+        self.assertEqual([r[0] for r in store.retrieve_relevant("ai")], ["The storm hums on the roof"])
+
+    def test_whole_token_index_is_replaced(self):
+        conn = sqlite3.connect(self.db)
+        conn.execute("CREATE TABLE threads (id INTEGER PRIMARY KEY AUTOINCREMENT, topic TEXT, content TEXT, "
+                     "valence REAL, timestamp DATETIME)")
+        conn.execute("CREATE VIRTUAL TABLE threads_fts USING fts5(topic, content, content='threads', "
+                     "content_rowid='id', tokenize='unicode61')")
+        conn.commit()
+        conn.close()
+        store = ThreadedMemory(self.db)
+        self.assertNotEqual(store.fts_mode, "unicode61")
+        store.save_thought("Identity shift", "x")
+        self.assertEqual([r[0] for r in store.retrieve_relevant("dentit")], ["x"])
+
+    def test_import_does_not_open_the_default_db(self):
+        import core_os.memory.threaded_memory as tm
+        self.assertIsNone(tm._store)
+
+    def test_existing_rows_are_backfilled(self):
+        conn = sqlite3.connect(self.db)
+        conn.execute("CREATE TABLE threads (id INTEGER PRIMARY KEY AUTOINCREMENT, topic TEXT, content TEXT, "
+                     "valence REAL, timestamp DATETIME)")
+        conn.execute("INSERT INTO threads (topic, content, valence, timestamp) VALUES ('Pearl Leaf', 'care', 0.9, '2026-01-01')")
+        conn.commit()
+        conn.close()
+        store = ThreadedMemory(self.db)
+        self.assertEqual([r[0] for r in store.retrieve_relevant("pearl")], ["care"])
+
+
+if __name__ == "__main__":
+    unittest.main()
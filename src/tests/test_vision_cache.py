@@ -0,0 +1,129 @@
+import unittest
+from unittest import mock
+
+from core_os.ocr_cache import dhash, hamming
+from core_os.vision_cache import VisionResultCache, tile_hashes
+
+FRAME = ("tiles", tuple(0b1011 << i for i in range(16)))
+
+
+def flipped(fp, bits, tiles=(0,)):
+    """Flips `bits` bits of each listed tile."""
+    hashes = list(fp[1])
+    for t in tiles:
+        for i in range(bits):
+            hashes[t] ^= 1 << (40 + i)
+    return "tiles", tuple(hashes)
+
+
+class FakeImage:
+    """Grayscale image with the slice of the PIL API tile_hashes uses; pixels drawn as filled boxes."""
+
+    def __init__(self, width, height, boxes):
+        self.size = (width, height)
+        self.pixels = [[0] * width for _ in range(height)]
+        for left, top, right, bottom, shade in boxes:
+            for y in range(top, bottom):
+                self.pixels[y][left:right] = [shade] * (right - left)
+
+    def convert(self, mode):
+        return self
+
+    def resize(self, size):
+        width, height = self.size
+        w, h = size
+        out = []
+        for j in range(h):
+            y0, y1 = j * height // h, max(j * height // h + 1, (j + 1) * height // h)
+            for i in range(w):
+                x0, x1 = i * width // w, max(i * width // w + 1, (i + 1) * width // w)
+                cells = [self.pixels[y][x] for y in range(y0, y1) for x in range(x0, x1)]
+                out.append(sum(cells) // len(cells))
+        self._data = out
+        return self
+
+    def getdata(self):
+        return self._data
+
+
+DESKTOP = [(0, 0, 320, 12, 90), (10, 30, 150, 200, 200), (170, 30, 310, 120, 160), (20, 40, 120, 52, 40)]
+
+
+class TestVisionResultCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = VisionResultCache(max_entries=3, ttl=60, tolerance=4)
+
+    def test_near_duplicate_frames_hit(self):
+        self.cache.put("moondream", "describe", FRAME, "a desk with a terminal")
+        self.assertEqual(self.cache.get("moondream", "describe", FRAME), "a desk with a terminal")
+        self.assertEqual(self.cache.get("moondream", "describe", flipped(FRAME, 3)), "a desk with a terminal")
+        self.assertIsNone(self.cache.get("moondream", "describe", flipped(FRAME, 5)))
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["near_hits"], stats["misses"]), (1, 1, 1))
+
+    def test_every_tile_must_match(self):
+        self.cache.put("m", "p", FRAME, "r")
+        # Small differences spread across many tiles still match
+        self.assertEqual(self.cache.get("m", "p", flipped(FRAME, 3, tiles=range(16))), "r")
+        # One tile past the tolerance is a different screen, however much the rest agrees
+        self.assertIsNone(self.cache.get("m", "p", flipped(FRAME, 5, tiles=(7,))))
+
+    def test_small_region_change_misses(self):
+        cache = VisionResultCache(ttl=60)          # module defaults for grid and tolerance
+        desktop = FakeImage(320, 240, DESKTOP)
+        # A 30x16 notification: well under 1% of the frame
+        notified = FakeImage(320, 240, DESKTOP + [(205, 215, 235, 231, 255)])
+        same = cache.fingerprint_image(FakeImage(320, 240, DESKTOP))
+        cache.put("m", "p", cache.fingerprint_image(desktop), "an editor and a terminal")
+        self.assertEqual(cache.get("m", "p", same), "an editor and a terminal")
+        self.assertIsNone(cache.get("m", "p", cache.fingerprint_image(notified)))
+        # The single whole-frame hash used before could not tell the two apart
+        self.assertLessEqual(hamming(dhash(desktop), dhash(notified)), 6)
+
+    def test_tile_hashes_grid(self):
+        hashes = tile_hashes(FakeImage(320, 240, DESKTOP), grid=4)
+        self.assertEqual(len(hashes), 16)
+        self.assertTrue(all(0 <= h < 1 << 64 for h in hashes))
+
+    def test_model_and_prompt_are_part_of_the_key(self):
+        self.cache.put("moondream", "describe", FRAME, "x")
+        self.assertIsNone(self.cache.get("qwen2.5vl:7b", "describe", FRAME))
+        self.assertIsNone(self.cache.get("moondream", "read the error", FRAME))
+
+    def test_ttl(self):
+        with mock.patch("core_os.vision_cache.time.time", return_value=1000.0):
+            self.cache.put("m", "p", FRAME, "old")
+        with mock.patch("core_os.vision_cache.time.time", return_value=1061.0):
+            self.assertIsNone(self.cache.get("m", "p", FRAME))
+            self.assertIsNone(self.cache.get("m", "p", flipped(FRAME, 1)))
+        self.assertEqual(self.cache.stats()["expired"], 1)
+
+    def test_size_bound_evicts_least_recent(self):
+        frames = [("tiles", (0xFF << (16 * i),)) for i in range(4)]   # 16 bits apart from each other
+        for i in range(3):
+            self.cache.put("m", "p", frames[i], f"r{i}")
+        self.cache.get("m", "p", frames[0])          # touch r0
+        self.cache.put("m", "p", frames[3], "r3")
+        self.assertEqual(self.cache.stats()["evicted"], 1)
+        self.assertIsNone(self.cache.get("m", "p", frames[1]))
+        self.assertEqual(self.cache.get("m", "p", frames[0]), "r0")
+
+    def test_exact_fingerprint_fallback_has_no_tolerance(self):
+        with mock.patch("core_os.vision_cache._Image") as image:
+            image.get.return_value = None
+            a = self.cache.fingerprint(b"\x89PNG frame one")
+            b = self.cache.fingerprint(b"\x89PNG frame two")
+        self.assertEqual(a[0], "sha")
+        self.cache.put("m", "p", a, "one")
+        self.assertEqual(self.cache.get("m", "p", a), "one")
+        self.assertIsNone(self.cache.get("m", "p", b))
+
+    def test_disabled_with_zero_ttl(self):
+        cache = VisionResultCache(ttl=0)
+        cache.put("m", "p", FRAME, "x")
+        self.assertIsNone(cache.get("m", "p", FRAME))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import threading
+import time
+import unittest
+
+from core_os.vision_fanout import VisionTask, fan_out
+
+
+class StandInModel:
+    """Local stand-in for the vision model: sleeps per image, tracks concurrency."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, image_path, prompt):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            delay = self.delays[image_path]
+            if delay is None:
+                raise ConnectionError("model offline")
+            time.sleep(delay)
+            return f"saw {image_path}"
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def tasks(n):
+    return [VisionTask(f"region{i}", f"crop{i}.png", "describe") for i in range(n)]
+
+
+class TestVisionFanOut(unittest.TestCase):
+
+    def test_latency_approaches_slowest_region(self):
+        model = StandInModel({f"crop{i}.png": 0.1 + 0.05 * (i == 2) for i in range(3)})
+        result = fan_out(tasks(3), model, max_workers=3, deadline=5)
+        self.assertEqual(list(result.results), ["region0", "region1", "region2"])
+        self.assertEqual(result.results["region1"], "saw crop1.png")
+        self.assertLess(result.elapsed_ms, 300)   # sequential would be 350 ms
+        self.assertEqual(model.peak, 3)
+
+    def test_concurrency_cap(self):
+        model = StandInModel({f"crop{i}.png": 0.05 for i in range(6)})
+        result = fan_out(tasks(6), model, max_workers=2, deadline=5)
+        self.assertEqual(len(result.results), 6)
+        self.assertEqual(model.peak, 2)
+
+    def test_deadline_returns_partial_results_and_cleans_up(self):
+        model = StandInModel({"crop0.png": 0.01, "crop1.png": 1.0, "crop2.png": 1.0})
+        cleaned = []
+        started = time.perf_counter()
+        result = fan_out(tasks(3), model, max_workers=1, deadline=0.2,
+                         cleanup=lambda task: cleaned.append(task.key))
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(list(result.results), ["region0"])
+        self.assertEqual(result.timed_out, ["region1", "region2"])
+        self.assertIn("region2", cleaned)             # queued, never started
+        time.sleep(1.0)
+        self.assertEqual(sorted(cleaned), ["region0", "region1", "region2"])
+
+    def test_errors_are_reported_per_task(self):
+        model = StandInModel({"crop0.png": 0.0, "crop1.png": None})
+        result = fan_out(tasks(2), model, deadline=5)
+        self.assertEqual(list(result.results), ["region0"])
+        self.assertIn("ConnectionError", result.errors["region1"])
+        self.assertEqual(result.as_metadata()["vision_completed"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+
+from core_os.memory.vision_history import VisionHistory
+
+
+class TestVisionHistory(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.tmp.name, "vision_history.db")
+        self.history = VisionHistory(self.db, capacity=5)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_window_keeps_last_entries_in_order(self):
+        for i in range(12):
+            self.history.append(f"frame {i}", source="moondream")
+        self.assertEqual(self.history.count(), 5)
+        self.assertEqual([e["description"] for e in self.history.recent(3)], ["frame 9", "frame 10", "frame 11"])
+        self.assertEqual(len(self.history.recent(50)), 5)
+        self.assertEqual(self.history.recent(1)[0]["source"], "moondream")
+
+    def test_concurrent_writers_do_not_lose_entries(self):
+        history = VisionHistory(self.db, capacity=1000)
+
+        def writer(n):
+            for i in range(25):
+                history.append(f"w{n}-{i}")
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(history.count(), 100)
+        # a second handle on the same file (another process, in practice) sees every write
+        self.assertEqual(VisionHistory(self.db, capacity=1000).count(), 100)
+
+    def test_import_legacy_json(self):
+        legacy = os.path.join(self.tmp.name, "visual_history.json")
+        with open(legacy, "w") as f:
+            json.dump([{"timestamp": f"2026-03-0{i}T00:00:00", "description": f"old {i}"} for i in range(1, 8)], f)
+        self.assertEqual(self.history.import_legacy_json(legacy), 5)
+        recent = self.history.recent(5)
+        self.assertEqual(recent[0]["description"], "old 3")
+        self.assertEqual(recent[-1]["timestamp"], "2026-03-07T00:00:00")
+
+    def test_missing_legacy_file(self):
+        self.assertEqual(self.history.import_legacy_json(os.path.join(self.tmp.name, "nope.json")), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()